@@ -12,10 +12,36 @@ This is safety-critical code. The Mapper enforces:
 
 import time
 import math
-from typing import Optional
+from typing import Callable, Optional
 from .types import ControlState, CommandFrame, DriveMode, MapperConfig
 
 
+def _shape_axis(value: float, deadzone: float, curve: float) -> float:
+    """
+    Apply deadzone, then the response curve, to one axis.
+    
+    Input below the deadzone returns 0; above it the input is rescaled so
+    the deadzone edge maps to 0 and 1.0 stays 1.0. A curve > 1.0 then makes
+    the response more gradual at low inputs for finer control at slow speeds.
+    
+    Args:
+        value: Input value (-1.0 to 1.0)
+        deadzone: Deadzone threshold
+        curve: Curve exponent
+    
+    Returns:
+        Shaped value (-1.0 to 1.0)
+    """
+    magnitude = abs(value)
+    if magnitude < deadzone:
+        return 0.0
+    scaled = (magnitude - deadzone) / (1.0 - deadzone)
+    if scaled == 0.0:
+        return 0.0
+    curved = math.pow(scaled, curve)
+    return curved if value > 0 else -curved
+
+
 class Mapper:
     """
     Transforms ControlState into CommandFrame with safety rules.
@@ -23,14 +49,16 @@ class Mapper:
     This is the core safety layer - all unsafe inputs are filtered here.
     """
     
-    def __init__(self, config: MapperConfig) -> None:
+    def __init__(self, config: MapperConfig, clock: Callable[[], float] = time.time) -> None:
         """
         Initialize mapper with configuration.
         
         Args:
             config: Mapper configuration (deadzones, curves, limits)
+            clock: Time source for ramping and frame timestamps (seconds)
         """
         self.config = config
+        self._clock = clock
         self._last_command: Optional[CommandFrame] = None
         self._last_time: float = 0.0
     
@@ -44,7 +72,7 @@ class Mapper:
         Returns:
             CommandFrame to send, or None if unsafe (triggers stop)
         """
-        current_time = time.time()
+        current_time = self._clock()
         
         # SAFETY RULE 1: Deadman switch must be pressed
         if not state.deadman:
@@ -58,22 +86,20 @@ class Mapper:
             self._last_time = current_time
             return self._last_command
         
-        # Apply processing pipeline
-        vx = self._apply_deadzone(state.vx)
-        vy = self._apply_deadzone(state.vy)
-        
-        vx = self._apply_curve(vx)
-        vy = self._apply_curve(vy)
+        # Apply processing pipeline (deadzone + curve fused per axis)
+        config = self.config
+        vx = _shape_axis(state.vx, config.deadzone, config.curve)
+        vy = _shape_axis(state.vy, config.deadzone, config.curve)
         
         # Convert to differential drive
         left, right = self._differential_drive(vx, vy)
         
         # Apply mode-specific speed limit
-        max_speed = self.config.get_max_speed(state.mode)
+        max_speed = config.get_max_speed(state.mode)
         left = left * max_speed  # Scale to actual speed values
         right = right * max_speed
-        left = self._clamp(left, -max_speed, max_speed)
-        right = self._clamp(right, -max_speed, max_speed)
+        left = max(-max_speed, min(max_speed, left))
+        right = max(-max_speed, min(max_speed, right))
         
         # Apply ramping if we have previous command
         if self._last_command is not None and self._last_time > 0:
@@ -100,49 +126,6 @@ class Mapper:
         self._last_command = None
         self._last_time = 0.0
     
-    def _apply_deadzone(self, value: float) -> float:
-        """
-        Apply deadzone to eliminate drift and small movements.
-        
-        Input below deadzone threshold returns 0.
-        Input above deadzone is rescaled to maintain full range.
-        
-        Args:
-            value: Input value (-1.0 to 1.0)
-        
-        Returns:
-            Deadzone-filtered value
-        """
-        if abs(value) < self.config.deadzone:
-            return 0.0
-        
-        # Rescale so deadzone maps to 0, and 1.0 stays 1.0
-        sign = 1.0 if value > 0 else -1.0
-        magnitude = abs(value)
-        scaled = (magnitude - self.config.deadzone) / (1.0 - self.config.deadzone)
-        return sign * scaled
-    
-    def _apply_curve(self, value: float) -> float:
-        """
-        Apply exponential curve for smoother control.
-        
-        Curve > 1.0 makes the response more gradual at low inputs,
-        giving finer control at slow speeds.
-        
-        Args:
-            value: Input value (-1.0 to 1.0)
-        
-        Returns:
-            Curved value
-        """
-        if value == 0.0:
-            return 0.0
-        
-        sign = 1.0 if value > 0 else -1.0
-        magnitude = abs(value)
-        curved = math.pow(magnitude, self.config.curve)
-        return sign * curved
-    
     def _differential_drive(self, vx: float, vy: float) -> tuple[float, float]:
         """
         Convert forward/turn inputs to left/right wheel speeds.
@@ -171,10 +154,6 @@ class Mapper:
         
         return left, right
     
-    def _clamp(self, value: float, min_val: float, max_val: float) -> float:
-        """Clamp value to range [min_val, max_val]"""
-        return max(min_val, min(max_val, value))
-    
     def _apply_ramp(self, target: float, current: float, dt: float) -> float:
         """
         Apply ramping to prevent sudden speed changes.
@@ -74,6 +74,16 @@ class Supervisor:
         
         # State change callbacks
         self._state_callbacks: list[Callable[[SupervisorState, SupervisorState], Any]] = []
+        
+        # State handlers, resolved once instead of walking an if/elif chain every tick
+        self._state_handlers = {
+            SupervisorState.DISCONNECTED: self._handle_disconnected,
+            SupervisorState.CONNECTING: self._handle_connecting,
+            SupervisorState.PAIRED: self._handle_paired,
+            SupervisorState.ARMED: self._handle_armed,
+            SupervisorState.DRIVING: self._handle_driving,
+            SupervisorState.FAILSAFE: self._handle_failsafe,
+        }
     
     def add_state_callback(self, callback: Callable[[SupervisorState, SupervisorState], Any]) -> None:
         """
@@ -156,23 +166,7 @@ class Supervisor:
             return
         
         # State machine
-        if self.state == SupervisorState.DISCONNECTED:
-            await self._handle_disconnected()
-        
-        elif self.state == SupervisorState.CONNECTING:
-            await self._handle_connecting()
-        
-        elif self.state == SupervisorState.PAIRED:
-            await self._handle_paired()
-        
-        elif self.state == SupervisorState.ARMED:
-            await self._handle_armed()
-        
-        elif self.state == SupervisorState.DRIVING:
-            await self._handle_driving()
-        
-        elif self.state == SupervisorState.FAILSAFE:
-            await self._handle_failsafe()
+        await self._state_handlers[self.state]()
         
         # Watchdogs (active in ARMED and DRIVING states)
         if self.state in (SupervisorState.ARMED, SupervisorState.DRIVING):
@@ -48,6 +48,7 @@ from m25_protocol_data import (
     DRIVE_MODE_REMOTE,
 )
 from m25_ecs import ECSRemote, ResponseParser
+from m25_crypto import clear_cipher_cache
 from m25_utils import parse_key
 
 
@@ -259,6 +260,9 @@ class BluetoothTransport:
                 await self._disconnect_wheel(self._right_conn, self._right_transport)
                 self._right_conn = None
             
+            # Next connect may use other wheel keys; release the cached ciphers
+            clear_cipher_cache()
+            
             self._connected = False
             logger.info("Disconnected")
         
@@ -66,6 +66,10 @@ class MockTransport:
     
     async def send_command(self, frame: CommandFrame) -> bool:
         """Log command instead of sending"""
+        return self.send_command_sync(frame)
+    
+    def send_command_sync(self, frame: CommandFrame) -> bool:
+        """Synchronous send_command for loops that need no event loop"""
         if not self._connected:
             logger.warning("[MOCK] Cannot send command - not connected")
             return False
@@ -77,11 +81,12 @@ class MockTransport:
         avg_speed = (frame.left_speed + frame.right_speed) / 2
         self._speed = abs(avg_speed) / 10.0  # Convert to km/h (rough sim)
         
-        logger.debug(
-            f"[MOCK] Command #{self._command_count}: "
-            f"L={frame.left_speed:+4d} R={frame.right_speed:+4d} "
-            f"-> {self._speed:.1f} km/h"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"[MOCK] Command #{self._command_count}: "
+                f"L={frame.left_speed:+4d} R={frame.right_speed:+4d} "
+                f"-> {self._speed:.1f} km/h"
+            )
         
         return True
     
@@ -7,8 +7,12 @@ All the data structures that flow through the system, fully typed.
 from dataclasses import dataclass, field
 from enum import Enum, IntEnum
 from typing import List, Optional
+import sys
 import time
 
+# slots=True needs Python 3.10+; older versions fall back to a __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 class DriveMode(IntEnum):
     """Drive mode selection - affects max speed and behavior"""
@@ -28,13 +32,14 @@ class SupervisorState(Enum):
     FAILSAFE = "failsafe"          # Emergency state, sending stop commands
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class ControlState:
     """
     Normalized control input from any input provider.
     
     This is the output of all InputProvider implementations.
-    Values are normalized and ready for mapping.
+    Values are normalized and ready for mapping. Immutable, so scripted
+    providers can hand out the same instance on every read.
     """
     vx: float                    # Forward/backward: -1.0 (back) to 1.0 (forward)
     vy: float                    # Left/right: -1.0 (left) to 1.0 (right)
@@ -58,7 +63,7 @@ class ControlState:
         return self.deadman and self.mode != DriveMode.STOP
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class CommandFrame:
     """
     Command frame to send to vehicles.
@@ -7,18 +7,18 @@ import argparse
 import os
 import sys
 import threading
+import queue
 import asyncio
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from importlib.util import find_spec
 from pathlib import Path
-from datetime import datetime
 from typing import Any, Optional, cast
 
-try:
-    from dotenv import load_dotenv
-    HAS_DOTENV = True
-except ImportError:
-    load_dotenv = None
-    HAS_DOTENV = False
+# dotenv is only needed once, in load_env(); probe for it without importing.
+HAS_DOTENV = find_spec("dotenv") is not None
+if not HAS_DOTENV:
     print("Warning: python-dotenv not installed. Install with: pip install python-dotenv")
 
 # Import core architecture
@@ -32,33 +32,26 @@ except ImportError:
     HAS_CORE = False
     print("Warning: Core architecture not available")
 
-try:
-    from m25_ecs import ECSPacketBuilder, ECSRemote, ResponseParser
-    from m25_utils import parse_key
-    HAS_M25_PROTOCOL = True
-except ImportError as e:
-    ECSPacketBuilder = cast(Any, None)
-    ECSRemote = cast(Any, None)
-    ResponseParser = cast(Any, None)
-    parse_key = cast(Any, None)
-    HAS_M25_PROTOCOL = False
-    print(f"Warning: M25 protocol modules not available: {e}")
-
-try:
-    from m25_spp import BluetoothConnection as RFCOMMBluetoothConnection
-    HAS_RFCOMM = True
-except ImportError:
-    RFCOMMBluetoothConnection = cast(Any, None)
-    HAS_RFCOMM = False
-
-try:
-    from m25_bluetooth_ble import M25BluetoothBLE, detect_m25_ble_profile, scan_devices as ble_scan_devices
-    HAS_BLE = True
-except ImportError:
-    M25BluetoothBLE = cast(Any, None)
-    detect_m25_ble_profile = cast(Any, None)
-    ble_scan_devices = cast(Any, None)
-    HAS_BLE = False
+from m25_utils import parse_key
+
+# The protocol and Bluetooth stacks (pycryptodome, bleak, sockets) are imported
+# on first use by _ensure_bt(). Until then the flags below are cheap probes.
+ECSPacketBuilder = cast(Any, None)
+ECSRemote = cast(Any, None)
+ResponseParser = cast(Any, None)
+RFCOMMBluetoothConnection = cast(Any, None)
+M25BluetoothBLE = cast(Any, None)
+detect_m25_ble_profile = cast(Any, None)
+ble_scan_devices = cast(Any, None)
+ble_resolve_devices = cast(Any, None)
+BLEConnectionAdapter = cast(Any, None)
+
+HAS_M25_PROTOCOL = find_spec("Crypto") is not None
+if not HAS_M25_PROTOCOL:
+    print("Warning: M25 protocol modules not available: pycryptodome not installed")
+HAS_RFCOMM = HAS_M25_PROTOCOL
+HAS_BLE = HAS_M25_PROTOCOL and find_spec("bleak") is not None
+_bt_loaded = False
 
 from m25_protocol_data import (
     PARAM_ID_STATUS_SOC,
@@ -70,6 +63,13 @@ from m25_protocol_data import (
     PARAM_ID_STATUS_DUO_DRIVE_PARAMS,
     DRIVE_MODE_BIT_CRUISE,
     DRIVE_MODE_BIT_REMOTE,
+    PROFILE_ID_STANDARD,
+    PROFILE_ID_SENSITIVE,
+    PROFILE_ID_SOFT,
+    PROFILE_ID_ACTIVE,
+    PROFILE_ID_SENSITIVE_PLUS,
+    PROFILE_NAMES,
+    format_max_speed,
 )
 from m25_transport import (
     M25_VERSION_AUTO,
@@ -86,6 +86,110 @@ from m25_transport import (
 HAS_BLUETOOTH = HAS_M25_PROTOCOL and (HAS_BLE or HAS_RFCOMM)
 IS_WINDOWS = sys.platform.startswith("win")
 
+
+def _ensure_bt():
+    """Import the M25 protocol and Bluetooth modules the first time they are needed."""
+    global _bt_loaded, HAS_M25_PROTOCOL, HAS_RFCOMM, HAS_BLE, HAS_BLUETOOTH
+    global ECSPacketBuilder, ECSRemote, ResponseParser, RFCOMMBluetoothConnection
+    global M25BluetoothBLE, detect_m25_ble_profile, ble_scan_devices, ble_resolve_devices
+    global BLEConnectionAdapter
+    if _bt_loaded or not HAS_M25_PROTOCOL:
+        return
+    _bt_loaded = True
+
+    try:
+        from m25_ecs import ECSPacketBuilder, ECSRemote, ResponseParser
+    except ImportError as e:
+        HAS_M25_PROTOCOL = False
+        print(f"Warning: M25 protocol modules not available: {e}")
+
+    try:
+        from m25_spp import BluetoothConnection as RFCOMMBluetoothConnection
+    except ImportError:
+        HAS_RFCOMM = False
+
+    try:
+        from m25_bluetooth_ble import M25BluetoothBLE, detect_m25_ble_profile, scan_devices as ble_scan_devices
+        from m25_bluetooth_ble import resolve_devices as ble_resolve_devices
+        from gui.transport import BLEConnectionAdapter
+    except ImportError:
+        HAS_BLE = False
+
+    HAS_BLUETOOTH = HAS_M25_PROTOCOL and (HAS_BLE or HAS_RFCOMM)
+
+
+# Output-pane prefix per log level; also serves as the set of valid levels.
+_LOG_PREFIX = {
+    "muted": "NOTE",
+    "info": "INFO",
+    "success": "OK",
+    "warning": "WARN",
+    "error": "ERR",
+}
+# Per level: the "PREFIX: " label and the (level,) tag tuple reused by every insert
+_LOG_LEVELS = {lvl: (f"{prefix}: ", (lvl,)) for lvl, prefix in _LOG_PREFIX.items()}
+_TAG_TS = ("ts",)
+_TAG_PREFIX = ("prefix",)
+_TAG_TRACE = ("trace",)
+
+# Profile menu label -> protocol profile ID
+_PROFILE_MAP = {
+    "Standard": PROFILE_ID_STANDARD,
+    "Sensitive": PROFILE_ID_SENSITIVE,
+    "Soft": PROFILE_ID_SOFT,
+    "Active": PROFILE_ID_ACTIVE,
+    "SensitivePlus": PROFILE_ID_SENSITIVE_PLUS,
+}
+_PROFILES_AVAILABLE = ", ".join(PROFILE_NAMES.values())
+
+# Info Dump reads after the firmware line, in display order: (builder method, status param ID,
+# ResponseParser method, line formatter). Names are resolved at call time
+# because the protocol modules are imported lazily.
+_INFO_DUMP_READS = (
+    ("build_read_soc", PARAM_ID_STATUS_SOC, "parse_soc",
+     lambda v: f"Battery: {v}%"),
+    ("build_read_assist_level", PARAM_ID_STATUS_ASSIST_LEVEL, "parse_assist_level",
+     lambda v: f"Assist Level: {v['value']} ({v['name']})"),
+    ("build_read_drive_mode", PARAM_ID_STATUS_DRIVE_MODE, "parse_drive_mode",
+     lambda v: f"Hill Hold: {'ON' if v['auto_hold'] else 'OFF'}"),
+    ("build_read_drive_profile", PARAM_ID_STATUS_DRIVE_PROFILE, "parse_drive_profile",
+     lambda v: f"Drive Profile: {v['name']}"),
+    ("build_read_cruise_values", PARAM_ID_CRUISE_VALUES, "parse_cruise_values",
+     lambda v: f"Distance: {v['distance_km']:.1f} km"),
+    # DuoDrive parameters can carry policy knobs on some firmware builds.
+    ("build_read_duo_drive_params", PARAM_ID_STATUS_DUO_DRIVE_PARAMS, "parse_duo_drive_params",
+     lambda v: f"DuoDrive: side={v['mounting_name']}, sens={v['speed_sensibility']}, dynamic={v['steering_dynamic']}"),
+)
+
+# Tcl lambda (for `apply`) that refills an OptionMenu dropdown in one call.
+# Entries are radiobuttons on the menu's variable, like OptionMenu's own, and
+# each reports its value to the selection callback.
+_FILL_DEVICE_MENU = """{m v c opts} {
+    $m delete 0 end
+    foreach o [linsert $opts 0 {}] {
+        $m add radiobutton -label $o -variable $v -value $o -command [list $c $o]
+    }
+}"""
+
+
+def _selection_address(selection):
+    """Return the address from a "Name (address)" device entry, or None."""
+    _, sep, rest = selection.rpartition("(")
+    if not sep or not rest.endswith(")"):
+        return None
+    return rest[:-1] or None
+
+
+_ts_cache = [0, ""]
+
+
+def _clock_ts():
+    """Return the wall-clock time as HH:MM:SS, formatted at most once per second."""
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache[:] = [now, time.strftime("%H:%M:%S", time.localtime(now))]
+    return _ts_cache[1]
+
 try:
     import pygame as _pygame_probe
     HAS_PYGAME = True
@@ -95,7 +199,6 @@ except ImportError:
 
 from gui.widgets import PlaceholderEntry
 from gui.theme import THEMES, LEVELS
-from gui.transport import BLEConnectionAdapter
 
 
 
@@ -143,6 +246,14 @@ class M25GUI:
     GAMEPAD_DEADZONE = 0.15
     GAMEPAD_POLL_MS = 50
 
+    # Log lines are buffered and written to the output pane at most this often.
+    LOG_FLUSH_MS = 30
+    # Oldest lines are trimmed once the output pane holds more than this.
+    MAX_LOG_LINES = 2000
+
+    # A repeat scan with the same settings within this window reuses the last result.
+    SCAN_CACHE_TTL_S = 5.0
+
     # After all inputs go to zero, hold remote mode this long before disarming.
     # New input within this window resumes without re-arming.
     DRIVE_GRACE_S = 1.5
@@ -174,11 +285,29 @@ class M25GUI:
         # Connection state
         self.connected = False
         self.scanned_devices = []
+        self._last_scan_key = None
+        self._last_scan_ts = 0.0
+        # Python callbacks registered as Tcl commands, by callable
+        self._tcl_commands: dict = {}
+        # Serializes scans and connection setup; the adapter can't discover and connect at once
+        self._radio_lock = threading.Lock()
+        # Reused worker threads: one-shot GUI actions, and the per-wheel fan-out
+        self._io_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="m25-io")
+        self._wheel_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="m25-wheel")
+        # Write actions with a request still on the wire; repeat clicks are dropped
+        self._inflight: set = set()
         self.left_conn = None
         self.right_conn = None
         self.ecs_remote: Any = None
+        # One packet builder per session; its telegram counter is thread-safe
+        self._builder: Any = None
+        # Firmware version per connection; it can't change while connected
+        self._sw_versions: dict = {}
+        # _INFO_DUMP_READS resolved against _builder: (builder, [(build, param_id, parse), ...])
+        self._info_dump_plan: tuple | None = None
         self.demo_mode = False
         self.event_loop = None  # For Windows async Bluetooth
+        self._ble_scanner: Any = None  # M25BluetoothBLE reused for every scan
         self.default_m25_version = normalize_m25_version(default_m25_version or os.getenv("M25_VERSION"))
         self.connected_transport_summary = "Not connected"
         
@@ -231,10 +360,22 @@ class M25GUI:
         # Theme state
         self.current_theme = "dark"
 
+        # Log output is buffered as (text, tags) pairs and flushed on a short timer
+        self._pending_log: list = []
+        self._pending_trace: list = []
+        self._log_flush_id = None
+
+        # Worker threads hand UI work to the Tk thread through this queue; one
+        # idle callback drains everything posted since it was scheduled.
+        self._ui_queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._ui_pump_scheduled = False
+
         # Create UI first (so status bar exists)
         self.create_widgets()
 
         self._close_after_disconnect = False
+        # True while a connect/disconnect worker runs; repeat clicks are ignored
+        self._transition_in_progress = False
         self.root.protocol("WM_DELETE_WINDOW", self.on_window_close)
 
         # Apply theme
@@ -267,7 +408,8 @@ class M25GUI:
 
     def load_env(self):
         """Load .env file if available"""
-        if HAS_DOTENV and load_dotenv is not None:
+        if HAS_DOTENV:
+            from dotenv import load_dotenv
             env_path = Path(".env")
             if env_path.exists():
                 load_dotenv(env_path)
@@ -932,10 +1074,20 @@ class M25GUI:
             self.output_frame,
             height=15,
             width=80,
-            wrap=tk.WORD,
+            # No wrapping and a fixed-width font: inserts don't re-measure earlier lines
+            wrap=tk.NONE,
+            font="TkFixedFont",
             relief=tk.FLAT,
             borderwidth=2,
+            # Read-only log: no undo stack, writable only inside _flush_log
+            undo=False,
+            autoseparators=False,
+            maxundo=0,
+            state=tk.DISABLED,
         )
+        self.output_hbar = ttk.Scrollbar(self.output.frame, orient=tk.HORIZONTAL, command=self.output.xview)
+        self.output_hbar.pack(side=tk.BOTTOM, fill=tk.X, before=self.output)
+        self.output.configure(xscrollcommand=self.output_hbar.set)
         self.output.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
 
         # Small button panel for output actions (Clear, Copy, Save)
@@ -1005,6 +1157,8 @@ class M25GUI:
         # Configure row weights for resizing
         self.main_frame.rowconfigure(3, weight=1)
         
+        self._register_theme_groups()
+
         # Detect system configuration
         self.detect_bluetooth_mode()
         self.detect_input_device()
@@ -1042,35 +1196,26 @@ class M25GUI:
         widget.bind("<Leave>", hide)
         widget.bind("<ButtonPress>", hide)
 
-    def _theme_widget(self, widget, widget_type="label", **kwargs):
-        """
-        Helper to apply theme to a widget based on its type.
-        
-        Args:
-            widget: The widget to theme
-            widget_type: Type of widget (label, button, entry, checkbox, optionmenu, frame)
-            **kwargs: Additional custom colors (e.g., fg="red" to override)
-        """
-        if not widget or not hasattr(widget, 'configure'):
-            return
-        
+    def _theme_config(self, widget_type):
+        """Return the configure() options for a widget type under the current theme."""
         theme = self.THEMES[self.current_theme]
-        
-        config = {}
-        
+
         if widget_type == "label":
-            config = {"bg": theme["bg"], "fg": theme["fg"]}
-        
-        elif widget_type == "button":
+            return {"bg": theme["bg"], "fg": theme["fg"]}
+
+        if widget_type in ("button", "optionmenu", "menu"):
             config = {
                 "bg": theme["button_bg"],
                 "fg": theme["button_fg"],
                 "activebackground": theme["select_bg"],
                 "activeforeground": theme["select_fg"],
             }
-        
-        elif widget_type == "entry":
-            config = {
+            if widget_type == "optionmenu":
+                config["highlightthickness"] = 0
+            return config
+
+        if widget_type == "entry":
+            return {
                 "bg": theme["entry_bg"],
                 "fg": theme["entry_fg"],
                 "insertbackground": theme["entry_fg"],
@@ -1080,50 +1225,53 @@ class M25GUI:
                 "disabledbackground": theme["entry_bg"],
                 "disabledforeground": theme["entry_fg"],
             }
-        
-        elif widget_type == "checkbox":
-            config = {
+
+        if widget_type == "checkbox":
+            return {
                 "bg": theme["bg"],
                 "fg": theme["fg"],
                 "activebackground": theme["bg"],
                 "activeforeground": theme["fg"],
                 "selectcolor": theme["entry_bg"],
             }
-        
-        elif widget_type == "optionmenu":
-            config = {
-                "bg": theme["button_bg"],
-                "fg": theme["button_fg"],
-                "activebackground": theme["select_bg"],
-                "activeforeground": theme["select_fg"],
-                "highlightthickness": 0,
-            }
-            # Also theme the dropdown menu
-            try:
-                menu = widget["menu"]
-                menu.configure(
-                    bg=theme["button_bg"],
-                    fg=theme["button_fg"],
-                    activebackground=theme["select_bg"],
-                    activeforeground=theme["select_fg"]
-                )
-            except:
-                pass
-        
-        elif widget_type == "frame":
-            config = {"bg": theme["bg"]}
-        
-        elif widget_type == "labelframe":
-            config = {"bg": theme["bg"], "fg": theme["fg"]}
 
-        elif widget_type == "scale":
-            config = {
+        if widget_type == "frame":
+            return {"bg": theme["bg"]}
+
+        if widget_type == "labelframe":
+            return {"bg": theme["bg"], "fg": theme["fg"]}
+
+        if widget_type == "scale":
+            return {
                 "bg": theme["bg"],
                 "fg": theme["fg"],
                 "highlightbackground": theme["bg"],
                 "activebackground": theme["select_bg"],
                 "troughcolor": theme["entry_bg"],
             }
+
+        return {}
+
+    def _theme_widget(self, widget, widget_type="label", **kwargs):
+        """
+        Helper to apply theme to a widget based on its type.
+        
+        Args:
+            widget: The widget to theme
+            widget_type: Type of widget (label, button, entry, checkbox, optionmenu, frame)
+            **kwargs: Additional custom colors (e.g., fg="red" to override)
+        """
+        if not widget or not hasattr(widget, 'configure'):
+            return
+        
+        config = self._theme_config(widget_type)
+
+        if widget_type == "optionmenu":
+            # Also theme the dropdown menu
+            try:
+                widget["menu"].configure(**self._theme_config("menu"))
+            except:
+                pass
         
         # Override with any custom kwargs
         config.update(kwargs)
@@ -1133,7 +1281,123 @@ class M25GUI:
             widget.configure(**config)
         except:
             pass  # Some widgets don't support all options
-    
+
+    def _theme_script(self):
+        """
+        Build (and cache per theme) one Tcl script that configures every
+        registered theme widget, so apply_theme makes a single tk.eval call
+        instead of one configure() round trip per widget.
+        """
+        script = self._theme_scripts.get(self.current_theme)
+        if script is not None:
+            return script
+
+        opts = {}
+
+        def options(kind):
+            if kind not in opts:
+                opts[kind] = " ".join(f"-{k} {{{v}}}" for k, v in self._theme_config(kind).items())
+            return opts[kind]
+
+        lines = []
+        for widget, kind in self._theme_groups:
+            # catch mirrors _theme_widget: skip options a widget doesn't support
+            lines.append(f"catch {{{widget} configure {options(kind)}}}")
+            if kind == "optionmenu":
+                lines.append(f"catch {{[{widget} cget -menu] configure {options('menu')}}}")
+        script = self._theme_scripts[self.current_theme] = "\n".join(lines)
+        return script
+
+    def _register_theme_groups(self):
+        """Collect (widget, kind) pairs for apply_theme once the widgets exist."""
+        groups = []
+
+        def add(kind, *widgets):
+            groups.extend((w, kind) for w in widgets)
+
+        def add_children(frame):
+            for w in frame.winfo_children():
+                if isinstance(w, tk.Label):
+                    add("label", w)
+                elif isinstance(w, tk.Entry):
+                    add("entry", w)
+                elif isinstance(w, tk.Button):
+                    add("button", w)
+
+        # Main frame and title
+        add("frame", self.main_frame, self.title_frame)
+        add("label", self.title_label)
+
+        # Connection frame
+        add("labelframe", self.conn_frame)
+        add("frame", self.scan_frame, self.left_device_frame, self.right_device_frame,
+            self.connection_action_frame)
+        add("button", self.scan_btn, self.connect_btn)
+        add("checkbox", self.filter_check)
+        add("optionmenu", self.m25_version_menu, self.left_device_menu, self.right_device_menu)
+        add("label", self.scan_status_lbl, self.lbl_left_device, self.lbl_right_device,
+            self.lbl_left_mac, self.lbl_left_key, self.lbl_right_mac, self.lbl_right_key,
+            self.connection_state_lbl)
+        add("entry", self.left_mac, self.left_key, self.right_mac, self.right_key)
+        if HAS_CORE and hasattr(self, "core_mode_check"):
+            add("checkbox", self.core_mode_check)
+
+        # Controls
+        add("labelframe", self.control_frame)
+        add("frame", self.assist_frame, self.profile_frame, self.max_speed_frame,
+            self.profile_desc_frame, self.btn_frame)
+        add("label", self.lbl_assist, self.lbl_profile, self.lbl_hill_hold, self.lbl_max_speed)
+        add("optionmenu", self.assist_level_menu, self.profile_menu)
+        add("button", self.set_level_btn, self.set_profile_btn)
+        add("checkbox", self.hill_hold_check)
+        add("entry", self.max_speed_level1_entry, self.max_speed_level2_entry)
+        add_children(self.max_speed_frame)
+
+        # Status buttons
+        add("button", self.read_battery_btn, self.read_status_btn, self.read_version_btn,
+            self.read_profile_btn, self.info_dump_btn)
+
+        # Drive Test Section
+        add("labelframe", self.drive_test_frame, self.one_shot_panel, self.motion_tuning_outer)
+        add("frame", self.drive_left_frame, self.drive_test_steps_frame, self.single_dir_frame,
+            self.quick_move_frame, self.one_shot_frame, self.oneshot_mode_frame,
+            self.kb_drive_frame, self.kb_gp_frame, self.motion_tuning_frame,
+            self.packet_stats_frame)
+        add("label", self.drive_test_label, self.single_dir_label, self.single_duration_label,
+            self.quick_label, self.quick_duration_label, self.arm_state_lbl,
+            self.motion_speed_label, self.drive_step_duration_label, self.turn_duration_label,
+            self.pulse_interval_label, self.drive_test_status)
+        add("optionmenu", self.single_dir_menu)
+        add("scale", self.single_duration_scale, self.quick_duration_scale, self.motion_speed_scale,
+            self.drive_step_duration_scale, self.turn_duration_scale, self.pulse_interval_scale)
+        add("button", self.drive_test_btn, self.single_dir_btn, self.quick_fwd_btn,
+            self.quick_bwd_btn, self.just_start_fwd_btn, self.just_start_bwd_btn,
+            self.just_stop_btn, self.arm_btn, self.disarm_btn, self.kb_fwd_btn,
+            self.kb_left_btn, self.kb_stop_btn, self.kb_right_btn, self.kb_bwd_btn,
+            self.keyboard_btn)
+        if HAS_PYGAME:
+            add("button", self.gamepad_btn)
+        add("checkbox", self.oneshot_continuous_check)
+        for w in self.oneshot_mode_frame.winfo_children():
+            if isinstance(w, tk.Label):
+                add("label", w)
+        add_children(self.packet_stats_frame)
+
+        # Output panel
+        add("labelframe", self.output_frame)
+        add("frame", self.output_btn_frame, self.log_config_frame)
+        add("button", self.clear_log_btn, self.copy_log_btn, self.save_log_btn,
+            self.choose_trace_file_btn)
+        add("checkbox", self.raw_trace_check, self.debug_log_check, self.raw_trace_save_check)
+        add("label", self.raw_trace_file_label)
+
+        # System info panel
+        add("frame", self.info_frame)
+        add("label", self.info_bluetooth_lbl, self.info_input_lbl, self.info_arch_lbl)
+
+        self._theme_groups = groups
+        self._theme_scripts = {}
+
     def apply_theme(self):
         """Apply the current theme to all widgets"""
         theme = self.THEMES[self.current_theme]
@@ -1141,235 +1405,49 @@ class M25GUI:
         # Root window
         self.root.configure(bg=theme["bg"])
 
-        # Main frame
-        self._theme_widget(self.main_frame, "frame")
+        self.root.tk.eval(self._theme_script())
 
-        # Title
-        self._theme_widget(self.title_frame, "frame")
-        self._theme_widget(self.title_label, "label")
-
-        # Theme button
-        if hasattr(self, "theme_btn"):
-            text = "☀ Light Mode" if self.current_theme == "dark" else "🌙 Dark Mode"
-            self._theme_widget(self.theme_btn, "button", text=text)
+        # Theme button label follows the mode it switches to
+        text = "☀ Light Mode" if self.current_theme == "dark" else "🌙 Dark Mode"
+        self._theme_widget(self.theme_btn, "button", text=text)
 
-        # Connection frame
-        self._theme_widget(self.conn_frame, "labelframe")
-        self._theme_widget(self.scan_frame, "frame")
-        self._theme_widget(self.scan_btn, "button")
-        self._theme_widget(self.filter_check, "checkbox")
-        self._theme_widget(self.m25_version_menu, "optionmenu")
-        self._theme_widget(self.scan_status_lbl, "label")
-        
-        # Device selection
-        self._theme_widget(self.lbl_left_device, "label")
-        self._theme_widget(self.lbl_right_device, "label")
-        self._theme_widget(self.left_device_frame, "frame")
-        self._theme_widget(self.right_device_frame, "frame")
-        self._theme_widget(self.left_device_menu, "optionmenu")
-        self._theme_widget(self.right_device_menu, "optionmenu")
-        
-        # MAC and Key entries
-        self._theme_widget(self.lbl_left_mac, "label")
-        self._theme_widget(self.lbl_left_key, "label")
-        self._theme_widget(self.lbl_right_mac, "label")
-        self._theme_widget(self.lbl_right_key, "label")
-        self._theme_widget(self.left_mac, "entry")
-        self._theme_widget(self.left_key, "entry")
-        self._theme_widget(self.right_mac, "entry")
-        self._theme_widget(self.right_key, "entry")
-        
-        # Core architecture checkboxes
-        if HAS_CORE and hasattr(self, "core_mode_check"):
-            self._theme_widget(self.core_mode_check, "checkbox")
-            
-            if hasattr(self, "deadman_disable_check"):
-                # Keep deadman checkbox red when enabled
-                if self.deadman_disable_var.get():
-                    self._theme_widget(self.deadman_disable_check, "checkbox", fg="red", activeforeground="red")
-                else:
-                    self._theme_widget(self.deadman_disable_check, "checkbox")
+        # Keep deadman checkbox red when enabled
+        if HAS_CORE and hasattr(self, "deadman_disable_check"):
+            if self.deadman_disable_var.get():
+                self._theme_widget(self.deadman_disable_check, "checkbox", fg="red", activeforeground="red")
+            else:
+                self._theme_widget(self.deadman_disable_check, "checkbox")
 
-        self._theme_widget(self.connect_btn, "button")
-        self._theme_widget(self.connection_action_frame, "frame")
-        self._theme_widget(self.connection_state_lbl, "label")
         self._update_connection_state_visual("connected" if self.connected else "disconnected")
-        
-        # Controls
-        self._theme_widget(self.control_frame, "labelframe")
-        self._theme_widget(self.assist_frame, "frame")
-        self._theme_widget(self.lbl_assist, "label")
-        self._theme_widget(self.assist_level_menu, "optionmenu")
-        self._theme_widget(self.set_level_btn, "button")
-        
-        self._theme_widget(self.profile_frame, "frame")
-        self._theme_widget(self.lbl_profile, "label")
-        self._theme_widget(self.profile_menu, "optionmenu")
-        self._theme_widget(self.set_profile_btn, "button")
-        
-        self._theme_widget(self.lbl_hill_hold, "label")
-        self._theme_widget(self.hill_hold_check, "checkbox")
-        
-        # Max speed controls
-        self._theme_widget(self.max_speed_frame, "frame")
-        self._theme_widget(self.lbl_max_speed, "label")
-        if hasattr(self, "max_speed_level1_entry"):
-            self._theme_widget(self.max_speed_level1_entry, "entry")
-        if hasattr(self, "max_speed_level2_entry"):
-            self._theme_widget(self.max_speed_level2_entry, "entry")
-        if hasattr(self, "profile_desc_frame"):
-            self._theme_widget(self.profile_desc_frame, "frame")
-        if hasattr(self, "profile_desc_text"):
-            theme = self.THEMES[self.current_theme]
-            self.profile_desc_text.config(
-                bg=theme["bg"],
-                fg=theme["fg"],
-                insertbackground=theme["fg"]
-            )
-            # Configure text tags with colors
-            self.profile_desc_text.tag_configure('profile_name', foreground=theme["text"]["info"], font=("TkDefaultFont", 10, "bold"))
-            self.profile_desc_text.tag_configure('level_info', foreground=theme["text"]["success"])
-            self.profile_desc_text.tag_configure('best_for', foreground=theme["text"]["warning"], font=("TkDefaultFont", 9, "italic"))
-        for widget in self.max_speed_frame.winfo_children():
-            if isinstance(widget, tk.Label):
-                self._theme_widget(widget, "label")
-            elif isinstance(widget, tk.Entry):
-                self._theme_widget(widget, "entry")
-            elif isinstance(widget, tk.Button):
-                self._theme_widget(widget, "button")
-        
-        # Status buttons
-        self._theme_widget(self.btn_frame, "frame")
-        for btn in (self.read_battery_btn, self.read_status_btn, self.read_version_btn, 
-                    self.read_profile_btn, self.info_dump_btn):
-            self._theme_widget(btn, "button")
-        
-        # Drive Test Section
-        if hasattr(self, "drive_test_frame"):
-            self._theme_widget(self.drive_test_frame, "labelframe")
-            if hasattr(self, "drive_left_frame"):
-                self._theme_widget(self.drive_left_frame, "frame")
-            self._theme_widget(self.drive_test_label, "label")
-            self._theme_widget(self.drive_test_btn, "button")
-            # Step indicator chips
-            if hasattr(self, "drive_test_steps_frame"):
-                self._theme_widget(self.drive_test_steps_frame, "frame")
-                for _lbl in getattr(self, "drive_step_labels", []):
-                    _lbl.config(bg=theme["button_bg"], fg=theme["fg"])
-            # Single direction row
-            self._theme_widget(self.single_dir_frame, "frame")
-            self._theme_widget(self.single_dir_label, "label")
-            self._theme_widget(self.single_dir_menu, "optionmenu")
-            self._theme_widget(self.single_duration_label, "label")
-            self._theme_widget(self.single_duration_scale, "scale")
-            self._theme_widget(self.single_dir_btn, "button")
-            # Quick row
-            self._theme_widget(self.quick_move_frame, "frame")
-            self._theme_widget(self.quick_label, "label")
-            self._theme_widget(self.quick_duration_label, "label")
-            self._theme_widget(self.quick_duration_scale, "scale")
-            self._theme_widget(self.quick_fwd_btn, "button")
-            self._theme_widget(self.quick_bwd_btn, "button")
-            self._theme_widget(self.just_start_fwd_btn, "button")
-            self._theme_widget(self.just_start_bwd_btn, "button")
-            self._theme_widget(self.just_stop_btn, "button")
-            # Right panel
-            if hasattr(self, "one_shot_panel"):
-                self._theme_widget(self.one_shot_panel, "labelframe")
-            self._theme_widget(self.one_shot_frame, "frame")
-            self._theme_widget(self.arm_btn, "button")
-            self._theme_widget(self.disarm_btn, "button")
-            if hasattr(self, "arm_state_lbl"):
-                self._theme_widget(self.arm_state_lbl, "label")
-            if hasattr(self, "oneshot_mode_frame"):
-                self._theme_widget(self.oneshot_mode_frame, "frame")
-                for _w in self.oneshot_mode_frame.winfo_children():
-                    if isinstance(_w, tk.Label):
-                        self._theme_widget(_w, "label")
-            if hasattr(self, "oneshot_continuous_check"):
-                self._theme_widget(self.oneshot_continuous_check, "checkbox")
-            if hasattr(self, "kb_drive_frame"):
-                self._theme_widget(self.kb_drive_frame, "frame")
-            for _btn in ("kb_fwd_btn", "kb_left_btn", "kb_stop_btn", "kb_right_btn", "kb_bwd_btn"):
-                if hasattr(self, _btn):
-                    self._theme_widget(getattr(self, _btn), "button")
-            if hasattr(self, "kb_gp_frame"):
-                self._theme_widget(self.kb_gp_frame, "frame")
-            if hasattr(self, "keyboard_btn"):
-                self._theme_widget(self.keyboard_btn, "button")
-            if hasattr(self, "gamepad_btn"):
-                self._theme_widget(self.gamepad_btn, "button")
-            # Drive params bottom bar
-            if hasattr(self, "motion_tuning_outer"):
-                self._theme_widget(self.motion_tuning_outer, "labelframe")
-            if hasattr(self, "motion_tuning_frame"):
-                self._theme_widget(self.motion_tuning_frame, "frame")
-            self._theme_widget(self.motion_speed_label, "label")
-            self._theme_widget(self.motion_speed_scale, "scale")
-            self._theme_widget(self.drive_step_duration_label, "label")
-            self._theme_widget(self.drive_step_duration_scale, "scale")
-            self._theme_widget(self.turn_duration_label, "label")
-            self._theme_widget(self.turn_duration_scale, "scale")
-            if hasattr(self, "pulse_interval_label"):
-                self._theme_widget(self.pulse_interval_label, "label")
-            if hasattr(self, "pulse_interval_scale"):
-                self._theme_widget(self.pulse_interval_scale, "scale")
-            # Packet stats row
-            if hasattr(self, "packet_stats_frame"):
-                self._theme_widget(self.packet_stats_frame, "frame")
-                for _w in self.packet_stats_frame.winfo_children():
-                    if isinstance(_w, tk.Label):
-                        self._theme_widget(_w, "label")
-                    elif isinstance(_w, tk.Button):
-                        self._theme_widget(_w, "button")
-            self._theme_widget(self.drive_test_status, "label")
-        
+
+        # Profile description text and its tags
+        self.profile_desc_text.config(
+            bg=theme["bg"],
+            fg=theme["fg"],
+            insertbackground=theme["fg"]
+        )
+        self.profile_desc_text.tag_configure('profile_name', foreground=theme["text"]["info"], font=("TkDefaultFont", 10, "bold"))
+        self.profile_desc_text.tag_configure('level_info', foreground=theme["text"]["success"])
+        self.profile_desc_text.tag_configure('best_for', foreground=theme["text"]["warning"], font=("TkDefaultFont", 9, "italic"))
+
+        # Step indicator chips
+        for _lbl in self.drive_step_labels:
+            _lbl.config(bg=theme["button_bg"], fg=theme["fg"])
+
         # Output
-        self._theme_widget(self.output_frame, "labelframe")
-        if hasattr(self, "output"):
-            self.output.configure(
-                bg=theme["output_bg"],
-                fg=theme["output_fg"],
-                insertbackground=theme["output_fg"],
-                selectbackground=theme["select_bg"],
-                selectforeground=theme["select_fg"],
-            )
-            self._apply_output_tags()
-            # Theme output button panel if present
-            if hasattr(self, "output_btn_frame"):
-                self._theme_widget(self.output_btn_frame, "frame")
-            if hasattr(self, "clear_log_btn"):
-                self._theme_widget(self.clear_log_btn, "button")
-            if hasattr(self, "copy_log_btn"):
-                self._theme_widget(self.copy_log_btn, "button")
-            if hasattr(self, "save_log_btn"):
-                self._theme_widget(self.save_log_btn, "button")
-            if hasattr(self, "log_config_frame"):
-                self._theme_widget(self.log_config_frame, "frame")
-            if hasattr(self, "raw_trace_check"):
-                self._theme_widget(self.raw_trace_check, "checkbox")
-            if hasattr(self, "debug_log_check"):
-                self._theme_widget(self.debug_log_check, "checkbox")
-            if hasattr(self, "raw_trace_save_check"):
-                self._theme_widget(self.raw_trace_save_check, "checkbox")
-            if hasattr(self, "raw_trace_file_label"):
-                self._theme_widget(self.raw_trace_file_label, "label")
-            if hasattr(self, "choose_trace_file_btn"):
-                self._theme_widget(self.choose_trace_file_btn, "button")
+        self.output.configure(
+            bg=theme["output_bg"],
+            fg=theme["output_fg"],
+            insertbackground=theme["output_fg"],
+            selectbackground=theme["select_bg"],
+            selectforeground=theme["select_fg"],
+        )
+        self._apply_output_tags()
 
         # Status bar
-        if hasattr(self, "status"):
-            self.status.configure(bg=theme["bg"])
-        
-        # System info panel
-        if hasattr(self, "info_frame"):
-            self._theme_widget(self.info_frame, "frame")
-        if hasattr(self, "info_bluetooth_lbl"):
-            self._theme_widget(self.info_bluetooth_lbl, "label")
-        if hasattr(self, "info_input_lbl"):
-            self._theme_widget(self.info_input_lbl, "label")
-        if hasattr(self, "info_arch_lbl"):
-            self._theme_widget(self.info_arch_lbl, "label")
+        self.status.configure(bg=theme["bg"])
+        # Per-level status colours, resolved once per theme change
+        self._status_fg = {lvl: theme["text"].get(lvl, theme["fg"]) for lvl in self.LEVELS}
 
     def _apply_output_tags(self):
         """Apply semantic tags to the output widget for the current theme"""
@@ -1473,23 +1551,93 @@ class M25GUI:
             
             self.profile_desc_text.config(state=tk.DISABLED)
     
-    def _make_ui_callbacks(self, test_status_widget=None):
-        """Return thread-safe (ui_log, ui_status, ui_test_status) closures for background threads."""
-        def ui_log(level_msg: str, msg: str) -> None:
-            self.root.after(0, lambda: self.log(level_msg, msg))
+    def _post(self, fn, *args):
+        """Run fn(*args) on the Tk thread; safe to call from any thread."""
+        self._ui_queue.put((fn, args))
+        if not self._ui_pump_scheduled:
+            self._ui_pump_scheduled = True
+            self.root.after_idle(self._drain_ui_queue)
+
+    def _drain_ui_queue(self):
+        """Run every queued UI callback in one pass of the event loop."""
+        # Clear the flag first so a post racing with this drain schedules another
+        self._ui_pump_scheduled = False
+        while True:
+            try:
+                fn, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                fn(*args)
+            except Exception:
+                self.root.report_callback_exception(*sys.exc_info())
 
-        def ui_status(level_msg: str, msg: str) -> None:
-            self.root.after(0, lambda: self.status_message(level_msg, msg))
+    def _make_ui_callbacks(self, test_status_widget=None):
+        """Return thread-safe (ui_log, ui_status, ui_test_status) callables for background threads."""
+        # Bound partials queue (fn, args) directly; no closure is built per message
+        ui_log = partial(self._post, self.log)
+        ui_status = partial(self._post, self.status_message)
 
         def ui_test_status(msg: str, color: str = "black") -> None:
-            widget = test_status_widget
-            if widget is not None:
-                self.root.after(0, lambda widget=widget, msg=msg, color=color: widget.config(
-                    text=msg, foreground=color
-                ))
+            if test_status_widget is not None:
+                self._post(partial(test_status_widget.config, text=msg, foreground=color))
 
         return ui_log, ui_status, ui_test_status
 
+    def _on_both_wheels(self, fn):
+        """Run fn(conn) for the left and right wheel concurrently; return (left, right).
+
+        The wheels are independent links, so a pairwise read or write costs one
+        round trip instead of two. Call from a worker thread, never the Tk thread.
+        """
+        left = self._wheel_pool.submit(fn, self.left_conn)
+        right = self._wheel_pool.submit(fn, self.right_conn)
+        return left.result(), right.result()
+
+    def _action_busy(self, action):
+        """Return True (and say so in the status bar) while action is still running."""
+        if action in self._inflight:
+            self.status_message("warning", "Busy")
+            return True
+        return False
+
+    def _submit_action(self, action, fn):
+        """Run fn on the I/O pool, marking action in flight until it returns."""
+        self._inflight.add(action)
+
+        def run():
+            try:
+                fn()
+            finally:
+                self._inflight.discard(action)
+
+        self._io_pool.submit(run)
+
+    def _read_sw_version(self, conn):
+        """Return the firmware version of conn, reading it over the link only once per connection."""
+        version = self._sw_versions.get(conn)
+        if version is None:
+            version = self.ecs_remote.read_value(
+                conn,
+                self._builder.build_read_sw_version,
+                PARAM_ID_STATUS_SW_VERSION,
+                ResponseParser.parse_sw_version
+            )
+            if version is not None:
+                self._sw_versions[conn] = version
+        return version
+
+    def _info_dump_reads(self):
+        """Return _INFO_DUMP_READS as read_values() tuples, resolved once per builder."""
+        builder = self._builder
+        if self._info_dump_plan is None or self._info_dump_plan[0] is not builder:
+            reads = [
+                (getattr(builder, build_name), param_id, getattr(ResponseParser, parser_name))
+                for build_name, param_id, parser_name, _ in _INFO_DUMP_READS
+            ]
+            self._info_dump_plan = (builder, reads)
+        return self._info_dump_plan[1]
+
     def update_system_info(self):
         """Update system information labels"""
         # Bluetooth mode - show actual per-wheel transport when connected
@@ -1588,15 +1736,15 @@ class M25GUI:
                 pygame.init()
             pygame.joystick.init()
             if pygame.joystick.get_count() == 0:
-                self.root.after(0, lambda: self.log("warning", "Gamepad: no joystick found"))
+                self._post(self.log, "warning", "Gamepad: no joystick found")
                 self.gamepad_enabled = False
                 if hasattr(self, "gamepad_btn"):
-                    self.root.after(0, lambda: self.gamepad_btn.config(text="Gamepad: OFF"))
+                    self._post(partial(self.gamepad_btn.config, text="Gamepad: OFF"))
                 return
             joy = pygame.joystick.Joystick(0)
             joy.init()
             name = joy.get_name()
-            self.root.after(0, lambda: self.log("info", f"Gamepad: {name}"))
+            self._post(self.log, "info", f"Gamepad: {name}")
 
             while self.gamepad_enabled and not self._gamepad_stop_event.is_set():
                 pygame.event.pump()
@@ -1642,11 +1790,11 @@ class M25GUI:
                 self._gamepad_stop_event.wait(self.GAMEPAD_POLL_MS / 1000.0)
 
         except Exception as exc:
-            self.root.after(0, lambda: self.log("error", f"Gamepad error: {exc}"))
+            self._post(self.log, "error", f"Gamepad error: {exc}")
         finally:
             self.gamepad_enabled = False
             if hasattr(self, "gamepad_btn"):
-                self.root.after(0, lambda: self.gamepad_btn.config(text="Gamepad: OFF"))
+                self._post(partial(self.gamepad_btn.config, text="Gamepad: OFF"))
 
     def _bind_keyboard(self):
         """Bind driving keys to the root window."""
@@ -1795,7 +1943,7 @@ class M25GUI:
                     ui_log("error", "Keyboard drive: not connected")
                     return
 
-                builder = ECSPacketBuilder()
+                builder = self._builder
                 self._set_arm_state("Arming...")
 
                 remote_armed, _, _ = self._ensure_remote_mode_both(builder, ui_log)
@@ -1840,8 +1988,7 @@ class M25GUI:
                 # Only disarm if this thread armed AND One-Shot has not claimed arm state.
                 if armed_here and not self._is_armed:
                     try:
-                        builder2 = ECSPacketBuilder()
-                        self._set_remote_mode_both(builder2, False)
+                        self._set_remote_mode_both(self._builder, False)
                     except Exception:
                         pass
                 self._set_arm_state("Armed" if self._is_armed else "Disarmed")
@@ -1885,18 +2032,37 @@ class M25GUI:
         if self.connected and self.ecs_remote and self.left_conn and self.right_conn and (kb_was_alive or self._is_armed):
             def _zero():
                 try:
-                    self._write_remote_speed_both(ECSPacketBuilder(), 0, 0)
+                    self._write_remote_speed_both(self._builder, 0, 0)
                 except Exception:
                     pass
             threading.Thread(target=_zero, daemon=True).start()
         self.log("muted", "D-Pad: Stop (all motion halted)")
 
     def _ensure_event_loop(self):
-        """Create a private event loop for BLE tasks when needed."""
+        """Return the BLE event loop, started once on its own daemon thread.
+
+        The loop is never closed between connects; adapters submit coroutines
+        with run_coroutine_threadsafe, so both wheels can be in flight at once.
+        """
         if not self.event_loop or self.event_loop.is_closed():
-            self.event_loop = asyncio.new_event_loop()
+            loop = asyncio.new_event_loop()
+            # Don't hand the loop out until run_forever is live: callers branch on
+            # is_running(), and a not-yet-started loop would be driven from two threads
+            running = threading.Event()
+            loop.call_soon(running.set)
+            threading.Thread(target=loop.run_forever, name="ble-loop", daemon=True).start()
+            running.wait()
+            self.event_loop = loop
         return self.event_loop
 
+    def _ble_scan(self, duration, filter_m25):
+        """Run a BLE discovery on the shared event loop; call from a worker thread."""
+        if self._ble_scanner is None:
+            self._ble_scanner = M25BluetoothBLE()
+        return asyncio.run_coroutine_threadsafe(
+            self._ble_scanner.scan(duration, filter_m25), self._ensure_event_loop()
+        ).result()
+
     def _detect_transport_for_wheel(self, mac, selected_version, loop):
         """Choose BLE or RFCOMM for one wheel based on explicit mode or BLE probing."""
         preferred = preferred_transport_for_version(selected_version)
@@ -1918,7 +2084,7 @@ class M25GUI:
             return TRANSPORT_BLE, "auto: Windows BLE only"
 
         if HAS_BLE and detect_m25_ble_profile:
-            profile = loop.run_until_complete(detect_m25_ble_profile(mac, timeout=5))
+            profile = asyncio.run_coroutine_threadsafe(detect_m25_ble_profile(mac, timeout=5), loop).result()
             if profile == "M25V2" or (profile and profile.startswith("Fake")):
                 return TRANSPORT_BLE, f"auto detected {profile}"
             if profile == "M25V1":
@@ -1997,42 +2163,81 @@ class M25GUI:
     def status_message(self, level, msg):
         """Update status bar with semantic color"""
         lvl = (level or "info").strip().lower()
-        if lvl not in self.LEVELS:
-            lvl = "info"
-
-        theme = self.THEMES[self.current_theme]
-        fg = theme["text"][lvl] if lvl in theme["text"] else theme["fg"]
-
+        fg = self._status_fg.get(lvl) or self._status_fg["info"]
         self.status.config(text=msg, fg=fg)
 
     def log(self, level, message):
         """Append message to output log with semantic color"""
         lvl = (level or "info").strip().lower()
-        if lvl not in self.LEVELS:
-            lvl = "info"
-
-        ts = datetime.now().strftime("%H:%M:%S")
-        prefix = {
-            "muted": "NOTE",
-            "info": "INFO",
-            "success": "OK",
-            "warning": "WARN",
-            "error": "ERR",
-        }[lvl]
-
-        self.output.insert(tk.END, "[", ("ts",))
-        self.output.insert(tk.END, ts, ("ts",))
-        self.output.insert(tk.END, "] ", ("ts",))
-        self.output.insert(tk.END, f"{prefix}: ", ("prefix",))
-        self.output.insert(tk.END, f"{message}\n", (lvl,))
-        self.output.see(tk.END)
+        label, tags = _LOG_LEVELS.get(lvl) or _LOG_LEVELS["info"]
+
+        ts = _clock_ts()
+
+        self._pending_log.extend((
+            f"[{ts}] ", _TAG_TS,
+            label, _TAG_PREFIX,
+            f"{message}\n", tags,
+        ))
+        self._schedule_log_flush()
 
         # Mirror all semantic log lines to the trace file when save is active
-        try:
-            if getattr(self, "raw_trace_save_var", None) and self.raw_trace_save_var.get():
-                self._write_trace_to_file(f"[{ts}] {prefix}: {message}")
-        except Exception:
-            pass
+        if self._trace_fp is not None:
+            self._pending_trace.append(f"[{ts}] {label}{message}\n")
+
+    def log_block(self, level, lines):
+        """Append several lines as one log entry: one timestamp, one tag, one segment.
+
+        For multi-line reports (Info Dump) where per-line prefixes add nothing.
+        """
+        if not lines:
+            return
+        lvl = (level or "info").strip().lower()
+        label, tags = _LOG_LEVELS.get(lvl) or _LOG_LEVELS["info"]
+        ts = _clock_ts()
+        body = "\n".join(lines) + "\n"
+
+        self._pending_log.extend((
+            f"[{ts}] ", _TAG_TS,
+            label, _TAG_PREFIX,
+            body, tags,
+        ))
+        self._schedule_log_flush()
+
+        if self._trace_fp is not None:
+            self._pending_trace.append(f"[{ts}] {label}{body}")
+
+    def _schedule_log_flush(self):
+        """Arm the flush timer unless one is already pending."""
+        if self._log_flush_id is None:
+            self._log_flush_id = self.root.after(self.LOG_FLUSH_MS, self._flush_log)
+
+    def _flush_log(self):
+        """Write all buffered log segments with one insert and one see().
+
+        Bursts such as Info Dump or scan results arrive as many log() calls;
+        Text.insert accepts alternating (chars, tags) pairs, so a whole burst
+        keeps its colouring and costs a single Tcl round-trip and relayout.
+        """
+        self._log_flush_id = None
+        self._flush_trace()
+        if not self._pending_log:
+            return
+        segments, self._pending_log = self._pending_log, []
+        self.output.configure(state=tk.NORMAL)
+        self.output.insert(tk.END, *segments)
+        # Drop only the oldest slice; the rest of the widget is left untouched
+        lines = int(self.output.index("end-1c").split(".")[0])
+        if lines > self.MAX_LOG_LINES:
+            self.output.delete("1.0", f"{lines - self.MAX_LOG_LINES + 1}.0")
+        self.output.configure(state=tk.DISABLED)
+        self.output.see(tk.END)
+
+    def _flush_trace(self):
+        """Append buffered trace-file lines with one write and one flush."""
+        if not self._pending_trace:
+            return
+        lines, self._pending_trace = self._pending_trace, []
+        self._write_trace_to_file("".join(lines))
 
     def _raw_log_visible(self, message: str) -> bool:
         """Return True when message should be shown given current toggles."""
@@ -2044,20 +2249,18 @@ class M25GUI:
         """Append a [D] trace line filtered by the log-config checkboxes."""
         if not self._raw_log_visible(message):
             return
-        ts = datetime.now().strftime("%H:%M:%S")
-        self.output.insert(tk.END, f"[{ts}] {message}\n", ("trace",))
-        self.output.see(tk.END)
-        try:
-            if getattr(self, "raw_trace_save_var", None) and self.raw_trace_save_var.get():
-                self._write_trace_to_file(f"[{ts}] {message}")
-        except Exception:
-            pass
+        ts = _clock_ts()
+        line = f"[{ts}] {message}\n"
+        self._pending_log.extend((line, _TAG_TRACE))
+        if self._trace_fp is not None:
+            self._pending_trace.append(line)
+        self._schedule_log_flush()
 
     def queue_raw_log(self, message):
         """Thread-safe sink for background Bluetooth and ECS callbacks."""
         if not self._raw_log_visible(message):
             return
-        self.root.after(0, lambda: self.raw_log(message))
+        self._post(self.raw_log, message)
 
     def _on_raw_trace_save_toggle(self):
         """Handle toggling file-save for raw traces."""
@@ -2101,16 +2304,17 @@ class M25GUI:
     def _close_trace_file(self):
         try:
             if getattr(self, "_trace_fp", None):
+                self._flush_trace()
                 self._trace_fp.close()
                 self._trace_fp = None
         except Exception:
             pass
 
-    def _write_trace_to_file(self, message):
-        """Write a single trace line to the open trace file (if any)."""
+    def _write_trace_to_file(self, text):
+        """Write newline-terminated trace text to the open trace file (if any)."""
         try:
             if getattr(self, "_trace_fp", None):
-                self._trace_fp.write(message + "\n")
+                self._trace_fp.write(text)
                 self._trace_fp.flush()
         except Exception:
             # Swallow file write errors to avoid crashing UI
@@ -2119,14 +2323,17 @@ class M25GUI:
     def clear_output(self):
         """Clear the output text pane."""
         try:
+            self._pending_log = []
             self.output.config(state=tk.NORMAL)
             self.output.delete(1.0, tk.END)
+            self.output.config(state=tk.DISABLED)
         except Exception:
             pass
 
     def copy_output(self):
         """Copy the entire output contents to the clipboard."""
         try:
+            self._flush_log()
             text = self.output.get(1.0, tk.END)
             self.root.clipboard_clear()
             self.root.clipboard_append(text)
@@ -2144,6 +2351,7 @@ class M25GUI:
             )
             if not path:
                 return
+            self._flush_log()
             with open(path, "w", encoding="utf-8") as fp:
                 fp.write(self.output.get(1.0, tk.END))
             self.status_message("success", f"Saved output to {os.path.basename(path)}")
@@ -2343,7 +2551,7 @@ class M25GUI:
                     ui_status("error", "Drive test failed: Not connected")
                     return
                 
-                builder = ECSPacketBuilder()
+                builder = self._builder
                 test_speed = self._speed_raw(self.motion_speed_var.get())
                 test_duration = max(self.DRIVE_STEP_DURATION_MIN, min(self.DRIVE_STEP_DURATION_MAX, float(self.drive_step_duration_var.get())))
                 turn_speed = max(self.TURN_SPEED_MIN, int(test_speed * self.TURN_SPEED_FACTOR))
@@ -2383,7 +2591,7 @@ class M25GUI:
                 for i, (label, left_speed, right_speed) in enumerate(test_sequence):
                     ui_test_status(f"Step {i+1}/{len(test_sequence)}: {label}")
                     ui_log("info", f"  -> {label} (L:{left_speed}, R:{right_speed})")
-                    self.root.after(0, lambda s=label: self._set_drive_step_active(s))
+                    self._post(self._set_drive_step_active, label)
 
                     # Stream speed commands during each movement window.
                     if label == "Stop":
@@ -2401,7 +2609,7 @@ class M25GUI:
                 ui_log("info", "  -> Final stop")
                 self._pulse_remote_speed(builder, 0, 0, self.REMOTE_STOP_DURATION_S)
                 
-                self.root.after(0, self._clear_drive_step_highlight)
+                self._post(self._clear_drive_step_highlight)
                 ui_test_status("Drive test completed")
                 ui_log("success", "Drive test completed successfully")
                 ui_status("success", "Drive test completed")
@@ -2410,16 +2618,16 @@ class M25GUI:
                 ui_log("error", f"Drive test failed: {e}")
                 ui_status("error", "Drive test failed")
                 ui_test_status("Test failed")
-                self.root.after(0, self._clear_drive_step_highlight)
+                self._post(self._clear_drive_step_highlight)
                 # Emergency stop on error
                 try:
-                    builder = ECSPacketBuilder()
+                    builder = self._builder
                     self._pulse_remote_speed(builder, 0, 0, self.REMOTE_STOP_DURATION_S)
                 except:
                     pass
             finally:
                 try:
-                    builder = ECSPacketBuilder()
+                    builder = self._builder
                     self._set_remote_mode_both(builder, False)
                 except Exception:
                     pass
@@ -2476,7 +2684,7 @@ class M25GUI:
                     ui_status("error", "Test failed: Not connected")
                     return
 
-                builder = ECSPacketBuilder()
+                builder = self._builder
                 test_speed = self._speed_raw(self.motion_speed_var.get())
                 speed = test_speed if direction == "Forward" else -test_speed
 
@@ -2506,13 +2714,13 @@ class M25GUI:
                 ui_status("error", "Test failed")
                 ui_test_status("Test failed")
                 try:
-                    builder = ECSPacketBuilder()
+                    builder = self._builder
                     self._pulse_remote_speed(builder, 0, 0, self.REMOTE_STOP_DURATION_S)
                 except:
                     pass
             finally:
                 try:
-                    builder = ECSPacketBuilder()
+                    builder = self._builder
                     self._set_remote_mode_both(builder, False)
                 except Exception:
                     pass
@@ -2536,7 +2744,7 @@ class M25GUI:
                     ui_log("error", "Not connected")
                     return
 
-                builder = ECSPacketBuilder()
+                builder = self._builder
                 speed_mag = self._speed_raw(self.motion_speed_var.get())
                 speed = speed_mag if direction == "forward" else -speed_mag
                 label = "Forward" if direction == "forward" else "Backward"
@@ -2563,13 +2771,13 @@ class M25GUI:
                 ui_log("error", f"Quick movement failed: {e}")
                 ui_test_status("Movement failed")
                 try:
-                    builder = ECSPacketBuilder()
+                    builder = self._builder
                     self._pulse_remote_speed(builder, 0, 0, self.REMOTE_STOP_DURATION_S)
                 except:
                     pass
             finally:
                 try:
-                    builder = ECSPacketBuilder()
+                    builder = self._builder
                     self._set_remote_mode_both(builder, False)
                 except Exception:
                     pass
@@ -2585,7 +2793,7 @@ class M25GUI:
         def _apply(state=state, color=color):
             self.arm_state_lbl.config(text=f"State: {state}", foreground=color)
             self._update_oneshot_drive_buttons()
-        self.root.after(0, _apply)
+        self._post(_apply)
 
     def _update_oneshot_drive_buttons(self):
         """Enable Start Fwd/Bwd when armed+connected; Stop enabled when connected."""
@@ -2612,7 +2820,7 @@ class M25GUI:
                 if not self.ecs_remote or not self.left_conn or not self.right_conn:
                     ui_log("error", "Not connected")
                     return
-                builder = ECSPacketBuilder()
+                builder = self._builder
                 ui_test_status("Arming...")
                 self._set_arm_state("Arming...")
                 ok, left_mode, right_mode = self._ensure_remote_mode_both(builder, ui_log)
@@ -2646,7 +2854,7 @@ class M25GUI:
                 if not self.ecs_remote or not self.left_conn or not self.right_conn:
                     ui_log("error", "Not connected")
                     return
-                builder = ECSPacketBuilder()
+                builder = self._builder
                 ui_test_status("Disarming...")
                 self._set_arm_state("Disarming...")
                 left_ok, right_ok = self._set_remote_mode_both(builder, False)
@@ -2718,7 +2926,7 @@ class M25GUI:
                 if not self.ecs_remote or not self.left_conn or not self.right_conn:
                     ui_log("error", "Continuous: not connected")
                     return
-                builder = ECSPacketBuilder()
+                builder = self._builder
                 label = "Fwd" if speed > 0 else "Bwd"
                 ui_log("info", f"Continuous: {label} running (speed={speed})")
                 ui_test_status(f"Continuous {label}")
@@ -2752,7 +2960,7 @@ class M25GUI:
                 if not self.ecs_remote or not self.left_conn or not self.right_conn:
                     ui_log("error", "One-Shot: not connected")
                     return
-                builder = ECSPacketBuilder()
+                builder = self._builder
                 self._write_remote_speed_both(builder, speed, speed)
                 label = "Fwd" if speed > 0 else ("Bwd" if speed < 0 else "Stop")
                 ui_log("info", f"One-Shot: {label} speed={speed}")
@@ -2777,7 +2985,7 @@ class M25GUI:
         # Detect hard BLE link drop propagated up from the transport layer.
         if not getattr(self.left_conn, "connected", True) or \
                 not getattr(self.right_conn, "connected", True):
-            self.root.after(0, self._on_ble_link_lost)
+            self._post(self._on_ble_link_lost)
 
         return left_ok, right_ok
 
@@ -2811,8 +3019,8 @@ class M25GUI:
                         conn.disconnect()
                     except Exception:
                         pass
-            self.root.after(0, self.disconnection_complete)
-        threading.Thread(target=_cleanup, daemon=True).start()
+            self._post(self.disconnection_complete)
+        self._io_pool.submit(_cleanup)
 
     def _record_packet_stat(self):
         """Record a sent speed packet timestamp for stats display."""
@@ -2824,7 +3032,7 @@ class M25GUI:
                 self._stat_intervals.pop(0)
         self._stat_last_sent = now
         self._stat_pkt_count += 1
-        self.root.after(0, self._refresh_packet_stats_ui)
+        self._post(self._refresh_packet_stats_ui)
 
     def _refresh_packet_stats_ui(self):
         """Update packet stats labels; called on the main thread."""
@@ -2836,7 +3044,7 @@ class M25GUI:
             avg_txt = f"{avg:.0f}ms"
         last_txt = "--:--:--"
         if self._stat_last_sent > 0:
-            last_txt = datetime.now().strftime("%H:%M:%S")
+            last_txt = _clock_ts()
         self.stat_pkt_count_lbl.config(text=f"Pkts: {self._stat_pkt_count}")
         self.stat_avg_interval_lbl.config(text=f"Avg interval: {avg_txt}")
         self.stat_last_ts_lbl.config(text=f"Last: {last_txt}")
@@ -2956,6 +3164,19 @@ class M25GUI:
         else:
             self.connect()
 
+    def _begin_transition(self) -> bool:
+        """Claim the connect/disconnect slot; False if one is already running."""
+        if self._transition_in_progress:
+            return False
+        self._transition_in_progress = True
+        self.connect_btn.config(state="disabled")
+        return True
+
+    def _end_transition(self):
+        """Release the connect/disconnect slot and re-enable the button."""
+        self._transition_in_progress = False
+        self.connect_btn.config(state="normal")
+
     def _update_connection_state_visual(self, state: str):
         """Make the connection state obvious with a colored status label."""
         if not hasattr(self, "connection_state_lbl"):
@@ -2976,6 +3197,8 @@ class M25GUI:
     
     def disconnect(self, skip_confirmation: bool = False):
         """Disconnect from M25 wheels"""
+        if not self._begin_transition():
+            return
         if not (self.skip_disconnect_confirmation or skip_confirmation):
             # Confirm disconnection
             confirm = messagebox.askyesno(
@@ -2984,6 +3207,7 @@ class M25GUI:
             )
 
             if not confirm:
+                self._end_transition()
                 return
         
         self.log("info", "Disconnecting from wheels...")
@@ -2995,7 +3219,7 @@ class M25GUI:
                 if self.demo_mode:
                     # Simulate disconnection in demo mode
                     time.sleep(1)
-                    self.root.after(0, self.disconnection_complete)
+                    self._post(self.disconnection_complete)
                 else:
                     # Real hardware disconnection
                     if self.left_conn:
@@ -3008,14 +3232,19 @@ class M25GUI:
                     self.right_conn = None
                     self.ecs_remote = None
                     
-                    self.root.after(0, self.disconnection_complete)
+                    # Next connect may use other wheel keys; release the cached ciphers
+                    from m25_crypto import clear_cipher_cache
+                    clear_cipher_cache()
+                    
+                    self._post(self.disconnection_complete)
             except Exception as e:
-                self.root.after(0, self.disconnection_error, str(e))
+                self._post(self.disconnection_error, str(e))
         
-        threading.Thread(target=disconnect_thread, daemon=True).start()
+        self._io_pool.submit(disconnect_thread)
     
     def disconnection_error(self, error_msg):
         """Handle disconnection error"""
+        self._end_transition()
         self.log("error", f"Disconnection failed: {error_msg}")
         self.status_message("error", "Disconnection failed")
         self._update_connection_state_visual("error")
@@ -3023,6 +3252,7 @@ class M25GUI:
     
     def disconnection_complete(self):
         """Handle disconnection completion"""
+        self._end_transition()
         self.connected = False
         self.connect_btn.config(text="Connect")
         self._update_connection_state_visual("disconnected")
@@ -3032,6 +3262,7 @@ class M25GUI:
         # Revert Bluetooth label to static form
         self._left_transport = None
         self._right_transport = None
+        self._sw_versions.clear()
         self.update_system_info()
 
         if self._close_after_disconnect:
@@ -3040,6 +3271,8 @@ class M25GUI:
 
     def connect(self):
         """Connect to M25 wheels"""
+        if self._transition_in_progress:
+            return
         left_mac = self.left_mac.get().strip()
         left_key = self.left_key.get().strip()
         right_mac = self.right_mac.get().strip()
@@ -3064,6 +3297,7 @@ class M25GUI:
             self.log("warning", "DEMO MODE detected (MAC: AA:BB:CC:DD:EE:FF)")
             self.log("info", "Running in simulation mode - no real hardware connection")
         else:
+            _ensure_bt()
             if not HAS_BLUETOOTH:
                 messagebox.showerror("Error", "Bluetooth modules not available.\nInstall required packages.")
                 self.log("error", "Bluetooth modules not available")
@@ -3075,48 +3309,58 @@ class M25GUI:
         self.log("muted", f"Right: {right_mac}")
         self.log("muted", f"Mode:  {describe_m25_version(self.get_selected_m25_version())}")
         self.status_message("info", "Connecting..." if not self.demo_mode else "Connecting (Demo Mode)...")
+        self._begin_transition()
 
         def connect_thread():
             try:
                 if self.demo_mode:
                     # Simulate connection in demo mode
                     time.sleep(2)
-                    self.root.after(0, self.connection_complete, True, self.demo_mode)
+                    self._post(self.connection_complete, True, self.demo_mode)
                 else:
                     # Parse encryption keys
                     try:
                         left_key_bytes = parse_key(left_key)
                         right_key_bytes = parse_key(right_key)
                     except Exception as e:
-                        self.root.after(0, self.connection_error, f"Invalid encryption key: {e}")
+                        self._post(self.connection_error, f"Invalid encryption key: {e}")
                         return
 
-                    selected_version = self.get_selected_m25_version()
-                    loop = self._ensure_event_loop() if HAS_BLE else None
+                    # Hold the radio for discovery/probing and connect so a scan can't interleave
+                    with self._radio_lock:
+                        selected_version = self.get_selected_m25_version()
+                        loop = self._ensure_event_loop() if HAS_BLE else None
 
-                    left_transport, left_reason = self._detect_transport_for_wheel(left_mac, selected_version, loop)
-                    right_transport, right_reason = self._detect_transport_for_wheel(right_mac, selected_version, loop)
+                        # Typed-in MACs: find both wheels in one scan, not one per BleakClient
+                        if loop is not None and preferred_transport_for_version(selected_version) == TRANSPORT_BLE:
+                            asyncio.run_coroutine_threadsafe(
+                                ble_resolve_devices([left_mac, right_mac]), loop
+                            ).result()
 
-                    self.log("info", f"Left wheel transport: {left_transport} ({left_reason})")
-                    self.log("info", f"Right wheel transport: {right_transport} ({right_reason})")
+                        left_transport, left_reason = self._detect_transport_for_wheel(left_mac, selected_version, loop)
+                        right_transport, right_reason = self._detect_transport_for_wheel(right_mac, selected_version, loop)
 
-                    self.left_conn = self._make_connection(left_transport, left_mac, left_key_bytes, "left", loop)
-                    self.right_conn = self._make_connection(right_transport, right_mac, right_key_bytes, "right", loop)
-                    self.connected_transport_summary = f"L={left_transport}, R={right_transport}"
-                    self._left_transport = left_transport
-                    self._right_transport = right_transport
+                        self.log("info", f"Left wheel transport: {left_transport} ({left_reason})")
+                        self.log("info", f"Right wheel transport: {right_transport} ({right_reason})")
+
+                        self.left_conn = self._make_connection(left_transport, left_mac, left_key_bytes, "left", loop)
+                        self.right_conn = self._make_connection(right_transport, right_mac, right_key_bytes, "right", loop)
+                        self.connected_transport_summary = f"L={left_transport}, R={right_transport}"
+                        self._left_transport = left_transport
+                        self._right_transport = right_transport
                     
-                    # Connect to wheels
-                    if not self.left_conn.connect():
-                        self.root.after(0, self.connection_error, f"Failed to connect to left wheel at {left_mac}")
-                        return
+                        # Connect to wheels
+                        if not self.left_conn.connect():
+                            self._post(self.connection_error, f"Failed to connect to left wheel at {left_mac}")
+                            return
                     
-                    if not self.right_conn.connect():
-                        self.left_conn.disconnect()
-                        self.root.after(0, self.connection_error, f"Failed to connect to right wheel at {right_mac}")
-                        return
+                        if not self.right_conn.connect():
+                            self.left_conn.disconnect()
+                            self._post(self.connection_error, f"Failed to connect to right wheel at {right_mac}")
+                            return
                     
                     # Create ECS Remote helper
+                    self._builder = ECSPacketBuilder()
                     self.ecs_remote = ECSRemote(
                         self.left_conn,
                         self.right_conn,
@@ -3125,15 +3369,16 @@ class M25GUI:
                         log_callback=self.queue_raw_log,
                     )
                     
-                    self.root.after(0, self.connection_complete, True, False)
+                    self._post(self.connection_complete, True, False)
                     
             except Exception as e:
-                self.root.after(0, self.connection_error, str(e))
+                self._post(self.connection_error, str(e))
 
-        threading.Thread(target=connect_thread, daemon=True).start()
+        self._io_pool.submit(connect_thread)
 
     def connection_error(self, error_msg):
         """Handle connection error"""
+        self._end_transition()
         self.log("error", f"Connection failed: {error_msg}")
         self.status_message("error", "Connection failed")
         self._update_connection_state_visual("error")
@@ -3141,6 +3386,7 @@ class M25GUI:
 
     def connection_complete(self, success, demo_mode=False):
         """Handle connection result"""
+        self._end_transition()
         if success:
             self.connected = True
             if demo_mode:
@@ -3162,6 +3408,8 @@ class M25GUI:
 
     def set_assist_level(self):
         """Set assist level"""
+        if self._action_busy("assist"):
+            return
         level_str = self.assist_level_var.get()
         level = self.assist_levels.index(level_str)
         level_names = ["Normal (Level 1)", "Outdoor (Level 2)", "Learning (Level 3)"]
@@ -3181,17 +3429,14 @@ class M25GUI:
                         ui_log("error", "Not connected")
                         return
                     
-                    builder = ECSPacketBuilder()
-                    
-                    # Write to left wheel
-                    left_ok = self.ecs_remote.write_assist_level(self.left_conn, builder, level)
+                    left_ok, right_ok = self._on_both_wheels(
+                        lambda conn: self.ecs_remote.write_assist_level(conn, self._builder, level)
+                    )
                     if left_ok:
                         ui_log("success", "Left wheel: Assist level set")
                     else:
                         ui_log("warning", "Left wheel: Failed to set assist level")
                     
-                    # Write to right wheel
-                    right_ok = self.ecs_remote.write_assist_level(self.right_conn, builder, level)
                     if right_ok:
                         ui_log("success", "Right wheel: Assist level set")
                     else:
@@ -3206,27 +3451,15 @@ class M25GUI:
                     ui_log("error", f"Assist level change failed: {e}")
                     ui_status("error", "Assist level change failed")
             
-            threading.Thread(target=write_thread, daemon=True).start()
+            self._submit_action("assist", write_thread)
 
     def set_drive_profile(self):
         """Set drive profile"""
+        if self._action_busy("profile"):
+            return
         profile_name = self.profile_var.get()
         
-        # Map profile name to ID
-        from m25_protocol_data import (
-            PROFILE_ID_STANDARD, PROFILE_ID_SENSITIVE, PROFILE_ID_SOFT,
-            PROFILE_ID_ACTIVE, PROFILE_ID_SENSITIVE_PLUS
-        )
-        
-        profile_map = {
-            "Standard": PROFILE_ID_STANDARD,
-            "Sensitive": PROFILE_ID_SENSITIVE,
-            "Soft": PROFILE_ID_SOFT,
-            "Active": PROFILE_ID_ACTIVE,
-            "SensitivePlus": PROFILE_ID_SENSITIVE_PLUS,
-        }
-        
-        profile_id = profile_map.get(profile_name)
+        profile_id = _PROFILE_MAP.get(profile_name)
         if profile_id is None:
             self.log("error", f"Unknown profile: {profile_name}")
             return
@@ -3247,20 +3480,19 @@ class M25GUI:
                         ui_log("error", "Not connected")
                         return
                     
-                    builder = ECSPacketBuilder()
+                    builder = self._builder
                     
                     # Build write profile packet
                     packet = builder.build_write_drive_profile(profile_id)
                     
-                    # Write to left wheel
-                    left_ok = self.ecs_remote.write_value(self.left_conn, packet, "write_drive_profile")
+                    left_ok, right_ok = self._on_both_wheels(
+                        lambda conn: self.ecs_remote.write_value(conn, packet, "write_drive_profile")
+                    )
                     if left_ok:
                         ui_log("success", "Left wheel: Profile set")
                     else:
                         ui_log("warning", "Left wheel: Failed to set profile")
                     
-                    # Write to right wheel
-                    right_ok = self.ecs_remote.write_value(self.right_conn, packet, "write_drive_profile")
                     if right_ok:
                         ui_log("success", "Right wheel: Profile set")
                     else:
@@ -3275,10 +3507,14 @@ class M25GUI:
                     ui_log("error", f"Profile change failed: {e}")
                     ui_status("error", "Profile change failed")
             
-            threading.Thread(target=write_thread, daemon=True).start()
+            self._submit_action("profile", write_thread)
 
     def toggle_hill_hold(self):
         """Toggle hill hold on or off"""
+        if self._action_busy("hill_hold"):
+            # Undo the checkbox flip; the wheel state hasn't changed
+            self.hill_hold.set(not self.hill_hold.get())
+            return
         enabled = self.hill_hold.get()
         state = "ON" if enabled else "OFF"
         self.log("info", f"Setting hill hold: {state}")
@@ -3297,17 +3533,14 @@ class M25GUI:
                         ui_log("error", "Not connected")
                         return
                     
-                    builder = ECSPacketBuilder()
-                    
-                    # Write to left wheel
-                    left_ok = self.ecs_remote.write_auto_hold(self.left_conn, builder, enabled)
+                    left_ok, right_ok = self._on_both_wheels(
+                        lambda conn: self.ecs_remote.write_auto_hold(conn, self._builder, enabled)
+                    )
                     if left_ok:
                         ui_log("success", f"Left wheel: Hill hold {state}")
                     else:
                         ui_log("warning", f"Left wheel: Failed to set hill hold")
                     
-                    # Write to right wheel
-                    right_ok = self.ecs_remote.write_auto_hold(self.right_conn, builder, enabled)
                     if right_ok:
                         ui_log("success", f"Right wheel: Hill hold {state}")
                     else:
@@ -3323,10 +3556,12 @@ class M25GUI:
                     ui_log("error", f"Hill hold change failed: {e}")
                     ui_status("error", "Hill hold change failed")
             
-            threading.Thread(target=write_thread, daemon=True).start()
+            self._submit_action("hill_hold", write_thread)
 
     def set_max_speed(self):
         """Set max speed for Level 1 and Level 2"""
+        if self._action_busy("max_speed"):
+            return
         level1_speed = self.max_speed_level1.get()
         level2_speed = self.max_speed_level2.get()
         self.log("info", f"Setting max speeds: Level 1={level1_speed} km/h, Level 2={level2_speed} km/h")
@@ -3345,29 +3580,26 @@ class M25GUI:
                         ui_log("error", "Not connected")
                         return
                     
-                    builder = ECSPacketBuilder()
+                    def write_both_levels(conn):
+                        builder = self._builder
+                        return (self.ecs_remote.write_max_speed(conn, builder, 1, level1_speed),
+                                self.ecs_remote.write_max_speed(conn, builder, 2, level2_speed))
+
+                    (left1_ok, left2_ok), (right1_ok, right2_ok) = self._on_both_wheels(write_both_levels)
                     results = []
                     
-                    # Write Level 1 max speed to left wheel
-                    left1_ok = self.ecs_remote.write_max_speed(self.left_conn, builder, 1, level1_speed)
                     results.append(("Left wheel Level 1", left1_ok))
                     ui_log("success" if left1_ok else "warning", 
                            f"Left wheel Level 1: {level1_speed} km/h" if left1_ok else "Left wheel Level 1: Failed")
                     
-                    # Write Level 2 max speed to left wheel
-                    left2_ok = self.ecs_remote.write_max_speed(self.left_conn, builder, 2, level2_speed)
                     results.append(("Left wheel Level 2", left2_ok))
                     ui_log("success" if left2_ok else "warning",
                            f"Left wheel Level 2: {level2_speed} km/h" if left2_ok else "Left wheel Level 2: Failed")
                     
-                    # Write Level 1 max speed to right wheel
-                    right1_ok = self.ecs_remote.write_max_speed(self.right_conn, builder, 1, level1_speed)
                     results.append(("Right wheel Level 1", right1_ok))
                     ui_log("success" if right1_ok else "warning",
                            f"Right wheel Level 1: {level1_speed} km/h" if right1_ok else "Right wheel Level 1: Failed")
                     
-                    # Write Level 2 max speed to right wheel
-                    right2_ok = self.ecs_remote.write_max_speed(self.right_conn, builder, 2, level2_speed)
                     results.append(("Right wheel Level 2", right2_ok))
                     ui_log("success" if right2_ok else "warning",
                            f"Right wheel Level 2: {level2_speed} km/h" if right2_ok else "Right wheel Level 2: Failed")
@@ -3383,7 +3615,7 @@ class M25GUI:
                     ui_log("error", f"Max speed change failed: {e}")
                     ui_status("error", "Max speed change failed")
             
-            threading.Thread(target=write_thread, daemon=True).start()
+            self._submit_action("max_speed", write_thread)
 
     def read_battery(self):
         """Read battery status"""
@@ -3405,24 +3637,15 @@ class M25GUI:
                         ui_log("error", "Not connected")
                         return
                     
-                    builder = ECSPacketBuilder()
-                    
-                    # Read left wheel battery
-                    left_soc = self.ecs_remote.read_value(
-                        self.left_conn,
-                        builder.build_read_soc,
-                        PARAM_ID_STATUS_SOC,
-                        ResponseParser.parse_soc
+                    left_soc, right_soc = self._on_both_wheels(
+                        lambda conn: self.ecs_remote.read_value(
+                            conn,
+                            self._builder.build_read_soc,
+                            PARAM_ID_STATUS_SOC,
+                            ResponseParser.parse_soc
+                        )
                     )
                     left_battery = f"{left_soc}%" if left_soc is not None else "??%"
-                    
-                    # Read right wheel battery
-                    right_soc = self.ecs_remote.read_value(
-                        self.right_conn,
-                        builder.build_read_soc,
-                        PARAM_ID_STATUS_SOC,
-                        ResponseParser.parse_soc
-                    )
                     right_battery = f"{right_soc}%" if right_soc is not None else "??%"
                     
                     ui_log("muted", f"Left wheel:  {left_battery}")
@@ -3433,7 +3656,7 @@ class M25GUI:
                     ui_log("error", f"Battery read failed: {e}")
                     ui_status("error", "Battery read failed")
             
-            threading.Thread(target=read_thread, daemon=True).start()
+            self._io_pool.submit(read_thread)
 
     def read_status(self):
         """Read full status"""
@@ -3455,7 +3678,7 @@ class M25GUI:
                         ui_log("error", "Not connected")
                         return
                     
-                    builder = ECSPacketBuilder()
+                    builder = self._builder
                     
                     # Read assist level from left wheel
                     assist = self.ecs_remote.read_value(
@@ -3505,7 +3728,7 @@ class M25GUI:
                     ui_log("error", f"Status read failed: {e}")
                     ui_status("error", "Status read failed")
             
-            threading.Thread(target=read_thread, daemon=True).start()
+            self._io_pool.submit(read_thread)
 
     def read_version(self):
         """Read firmware version"""
@@ -3526,27 +3749,12 @@ class M25GUI:
                         ui_log("error", "Not connected")
                         return
 
-                    builder = ECSPacketBuilder()
-
-                    # Read left wheel version
-                    left_ver = self.ecs_remote.read_value(
-                        self.left_conn,
-                        builder.build_read_sw_version,
-                        PARAM_ID_STATUS_SW_VERSION,
-                        ResponseParser.parse_sw_version
-                    )
+                    left_ver, right_ver = self._on_both_wheels(self._read_sw_version)
                     if left_ver:
                         ui_log("success", f"Left wheel: {left_ver['version_str']}")
                     else:
                         ui_log("warning", "Left wheel: Unable to read version")
 
-                    # Read right wheel version
-                    right_ver = self.ecs_remote.read_value(
-                        self.right_conn,
-                        builder.build_read_sw_version,
-                        PARAM_ID_STATUS_SW_VERSION,
-                        ResponseParser.parse_sw_version
-                    )
                     if right_ver:
                         ui_log("success", f"Right wheel: {right_ver['version_str']}")
                     else:
@@ -3559,7 +3767,7 @@ class M25GUI:
                     ui_log("error", f"Version read failed: {e}")
                     ui_status("error", "Version read failed")
 
-            threading.Thread(target=read_thread, daemon=True).start()
+            self._io_pool.submit(read_thread)
 
     def read_profile(self):
         """Read drive profile"""
@@ -3580,7 +3788,7 @@ class M25GUI:
                         ui_log("error", "Not connected")
                         return
                     
-                    builder = ECSPacketBuilder()
+                    builder = self._builder
                     
                     # Read active profile from left wheel
                     profile = self.ecs_remote.read_value(
@@ -3596,16 +3804,14 @@ class M25GUI:
                         ui_log("warning", "Active Profile: Unable to read")
                     
                     # Show available profiles
-                    from m25_protocol_data import PROFILE_NAMES
-                    available = ", ".join(PROFILE_NAMES.values())
-                    ui_log("muted", f"Available: {available}")
+                    ui_log("muted", f"Available: {_PROFILES_AVAILABLE}")
                     ui_status("success", "Profile read complete")
                     
                 except Exception as e:
                     ui_log("error", f"Profile read failed: {e}")
                     ui_status("error", "Profile read failed")
             
-            threading.Thread(target=read_thread, daemon=True).start()
+            self._io_pool.submit(read_thread)
 
 
     def info_dump(self):
@@ -3641,80 +3847,40 @@ class M25GUI:
                 ui_log, ui_status, _ = self._make_ui_callbacks()
 
                 def read_from_wheel(conn, wheel_name):
-                    """Read all available info from one wheel using ECSRemote"""
-                    ui_log("success", f"\n=== {wheel_name} ===")
-                    builder = ECSPacketBuilder()
-                    
-                    # Version
-                    version = self.ecs_remote.read_value(
-                        conn, builder.build_read_sw_version, PARAM_ID_STATUS_SW_VERSION, ResponseParser.parse_sw_version
-                    )
-                    if version:
-                        ui_log("muted", f"Firmware: {version['version_str']}")
-                    
-                    # Battery
-                    soc = self.ecs_remote.read_value(
-                        conn, builder.build_read_soc, PARAM_ID_STATUS_SOC, ResponseParser.parse_soc
-                    )
-                    if soc is not None:
-                        ui_log("muted", f"Battery: {soc}%")
-                    
-                    # Assist Level
-                    level = self.ecs_remote.read_value(
-                        conn, builder.build_read_assist_level, PARAM_ID_STATUS_ASSIST_LEVEL, ResponseParser.parse_assist_level
-                    )
-                    if level:
-                        ui_log("muted", f"Assist Level: {level['value']} ({level['name']})")
-                    
-                    # Drive Mode (for Hill Hold)
-                    mode = self.ecs_remote.read_value(
-                        conn, builder.build_read_drive_mode, PARAM_ID_STATUS_DRIVE_MODE, ResponseParser.parse_drive_mode
-                    )
-                    if mode:
-                        hill_hold = "ON" if mode['auto_hold'] else "OFF"
-                        ui_log("muted", f"Hill Hold: {hill_hold}")
-                    
-                    # Drive Profile
-                    profile = self.ecs_remote.read_value(
-                        conn, builder.build_read_drive_profile, PARAM_ID_STATUS_DRIVE_PROFILE, ResponseParser.parse_drive_profile
-                    )
-                    if profile:
-                        ui_log("muted", f"Drive Profile: {profile['name']}")
-                    
-                    # Cruise Values (distance)
-                    cruise = self.ecs_remote.read_value(
-                        conn, builder.build_read_cruise_values, PARAM_ID_CRUISE_VALUES, ResponseParser.parse_cruise_values
-                    )
-                    if cruise:
-                        ui_log("muted", f"Distance: {cruise['distance_km']:.1f} km")
-
-                    # DuoDrive parameters can carry policy knobs on some firmware builds.
-                    duo = self.ecs_remote.read_value(
-                        conn, builder.build_read_duo_drive_params, PARAM_ID_STATUS_DUO_DRIVE_PARAMS, ResponseParser.parse_duo_drive_params
-                    )
-                    if duo:
-                        ui_log(
-                            "muted",
-                            f"DuoDrive: side={duo['mounting_name']}, sens={duo['speed_sensibility']}, dynamic={duo['steering_dynamic']}"
-                        )
+                    """Read all available info from one wheel; return its report lines"""
+                    lines = [f"=== {wheel_name} ==="]
+                    builder = self._builder
+
+                    version = self._read_sw_version(conn)
+                    if version is not None:
+                        lines.append(f"Firmware: {version['version_str']}")
+                    values = self.ecs_remote.read_values(conn, self._info_dump_reads())
+                    for (_, _, _, fmt), value in zip(_INFO_DUMP_READS, values):
+                        if value is not None:
+                            lines.append(fmt(value))
                     
                     # Drive Parameters for Level 1
                     params = self.ecs_remote.read_profile_params(conn, builder, 0)
                     if params:
-                        ui_log("muted", "Level 1 Parameters:")
-                        ui_log("muted", f"  Max Torque: {params['max_torque']}%")
-                        ui_log("muted", f"  Max Speed: {params['max_speed']:.1f} km/h")
-                        ui_log("muted", f"  P-Factor: {params['p_factor']}")
-                        ui_log("muted", f"  Speed Bias: {params['speed_bias']}")
+                        lines.append("Level 1 Parameters:")
+                        lines.append(f"  Max Torque: {params['max_torque']}%")
+                        lines.append(f"  Max Speed: {format_max_speed(params['max_speed_raw'])}")
+                        lines.append(f"  P-Factor: {params['p_factor']}")
+                        lines.append(f"  Speed Bias: {params['speed_bias']}")
+                    return lines
 
                 try:
                     if not self.ecs_remote or not self.left_conn or not self.right_conn:
                         ui_log("error", "Not connected")
                         return
                     
-                    # Read from both wheels
-                    read_from_wheel(self.left_conn, "LEFT WHEEL")
-                    read_from_wheel(self.right_conn, "RIGHT WHEEL")
+                    # Read both wheels concurrently, then log left before right
+                    left_lines, right_lines = self._on_both_wheels(
+                        lambda conn: read_from_wheel(conn, "LEFT WHEEL" if conn is self.left_conn else "RIGHT WHEEL")
+                    )
+                    # One log entry per wheel keeps the dump to a couple of inserts
+                    self._post(self.log_block, "muted", left_lines)
+                    self._post(self.log_block, "muted", right_lines)
                     
                     ui_log("info", "")
                     ui_log("success", "=== Info dump complete ===")
@@ -3724,10 +3890,11 @@ class M25GUI:
                     ui_log("error", f"Info dump failed: {e}")
                     ui_status("error", "Info dump failed")
             
-            threading.Thread(target=dump_thread, daemon=True).start()
+            self._io_pool.submit(dump_thread)
 
     def scan_devices(self):
         """Scan for Bluetooth devices"""
+        _ensure_bt()
         if not HAS_BLUETOOTH:
             messagebox.showerror("Error", "Bluetooth support not available.\nInstall bleak: pip install bleak")
             self.log("error", "Bluetooth support not available.")
@@ -3735,6 +3902,15 @@ class M25GUI:
             return
 
         selected_version = self.get_selected_m25_version()
+        filter_enabled = self.filter_m25.get()
+        scan_key = (selected_version, filter_enabled)
+
+        # Discovery takes seconds; answer a quick repeat click from the last result
+        if (self.scanned_devices and scan_key == self._last_scan_key
+                and time.monotonic() - self._last_scan_ts < self.SCAN_CACHE_TTL_S):
+            self.log("muted", "Reusing results from the previous scan")
+            self.scan_complete(self.scanned_devices)
+            return
 
         # Show Windows limitation warning
         if IS_WINDOWS and selected_version != M25_VERSION_V1:
@@ -3751,7 +3927,6 @@ class M25GUI:
                 icon="info"
             )
 
-        filter_enabled = self.filter_m25.get()
         scan_type = "M25 wheels" if filter_enabled else "all Bluetooth devices"
         self.log("info", f"Scanning for {scan_type} using {describe_m25_version(selected_version)}...")
         if IS_WINDOWS and selected_version != M25_VERSION_V1:
@@ -3771,32 +3946,36 @@ class M25GUI:
                             seen.add(addr)
                             devices.append((addr, name))
 
-                if selected_version == M25_VERSION_V2:
-                    if not HAS_BLE or not ble_scan_devices:
-                        raise RuntimeError("BLE scanning not available")
-                    add_devices(ble_scan_devices(duration=10, filter_m25=filter_enabled))
-                elif selected_version == M25_VERSION_V1:
-                    if IS_WINDOWS:
-                        raise RuntimeError("M25V1 RFCOMM scanning is not supported on Windows in this app")
-                    from m25_bluetooth import scan_devices as rfcomm_scan_devices
-                    add_devices(rfcomm_scan_devices(duration=10, filter_m25=filter_enabled))
-                else:
-                    if HAS_BLE and ble_scan_devices:
-                        add_devices(ble_scan_devices(duration=5, filter_m25=filter_enabled))
-                    if not IS_WINDOWS and HAS_RFCOMM:
+                with self._radio_lock:
+                    if selected_version == M25_VERSION_V2:
+                        if not HAS_BLE or not ble_scan_devices:
+                            raise RuntimeError("BLE scanning not available")
+                        add_devices(self._ble_scan(10, filter_enabled))
+                    elif selected_version == M25_VERSION_V1:
+                        if IS_WINDOWS:
+                            raise RuntimeError("M25V1 RFCOMM scanning is not supported on Windows in this app")
                         from m25_bluetooth import scan_devices as rfcomm_scan_devices
-                        add_devices(rfcomm_scan_devices(duration=5, filter_m25=filter_enabled))
+                        add_devices(rfcomm_scan_devices(duration=10, filter_m25=filter_enabled))
+                    else:
+                        if HAS_BLE and ble_scan_devices:
+                            add_devices(self._ble_scan(5, filter_enabled))
+                        if not IS_WINDOWS and HAS_RFCOMM:
+                            from m25_bluetooth import scan_devices as rfcomm_scan_devices
+                            add_devices(rfcomm_scan_devices(duration=5, filter_m25=filter_enabled))
                 
-                self.root.after(0, self.scan_complete, devices)
+                self._post(self.scan_complete, devices, scan_key)
             except Exception as e:
-                self.root.after(0, self.scan_error, str(e))
+                self._post(self.scan_error, str(e))
 
-        threading.Thread(target=scan_thread, daemon=True).start()
+        self._io_pool.submit(scan_thread)
 
-    def scan_complete(self, devices):
+    def scan_complete(self, devices, scan_key=None):
         """Handle scan completion"""
         self.scanned_devices = devices
         self.scan_btn.config(state="normal")
+        if scan_key is not None:
+            self._last_scan_key = scan_key
+            self._last_scan_ts = time.monotonic()
 
         if not devices:
             self.log("warning", "No devices found.")
@@ -3812,23 +3991,22 @@ class M25GUI:
         for addr, name in devices:
             self.log("muted", f"[{addr}] {name}")
 
-        device_options = [f"{name} ({addr})" for addr, name in devices]
-
-        menu = self.left_device_menu["menu"]
-        menu.delete(0, "end")
-        menu.add_command(label="", command=lambda: self.left_device_var.set(""))
-        for option in device_options:
-            menu.add_command(label=option, command=lambda val=option: self.left_device_var.set(val))
-
-        menu = self.right_device_menu["menu"]
-        menu.delete(0, "end")
-        menu.add_command(label="", command=lambda: self.right_device_var.set(""))
-        for option in device_options:
-            menu.add_command(label=option, command=lambda val=option: self.right_device_var.set(val))
+        device_options = tuple(f"{name} ({addr})" for addr, name in devices)
+        self._fill_device_menu(self.left_device_menu, self.left_device_var,
+                               self.on_left_device_selected, device_options)
+        self._fill_device_menu(self.right_device_menu, self.right_device_var,
+                               self.on_right_device_selected, device_options)
 
         self.scan_status_lbl.config(text=f"Found {len(devices)} device(s)")
         self.status_message("success", f"Scan complete, found {len(devices)} device(s)")
 
+    def _fill_device_menu(self, option_menu, var, on_select, options):
+        """Replace an OptionMenu's entries (plus a blank one) with a single Tcl call."""
+        cmd = self._tcl_commands.get(on_select)
+        if cmd is None:
+            cmd = self._tcl_commands[on_select] = self.root.register(on_select)
+        self.root.tk.call("apply", _FILL_DEVICE_MENU, str(option_menu["menu"]), str(var), cmd, options)
+
     def scan_error(self, error):
         """Handle scan error"""
         self.scan_btn.config(state="normal")
@@ -3842,8 +4020,8 @@ class M25GUI:
         if not selection:
             return
 
-        if "(" in selection and ")" in selection:
-            mac = selection.split("(")[1].split(")")[0]
+        mac = _selection_address(selection)
+        if mac:
             self.left_mac.delete(0, tk.END)
             self.left_mac.insert(0, mac)
             self.log("info", f"Selected left wheel: {selection}")
@@ -3854,8 +4032,8 @@ class M25GUI:
         if not selection:
             return
 
-        if "(" in selection and ")" in selection:
-            mac = selection.split("(")[1].split(")")[0]
+        mac = _selection_address(selection)
+        if mac:
             self.right_mac.delete(0, tk.END)
             self.right_mac.insert(0, mac)
             self.log("info", f"Selected right wheel: {selection}")
@@ -3944,6 +4122,10 @@ def main(default_m25_version=M25_VERSION_AUTO, skip_disconnect_confirmation=Fals
         log_file=resolved_log,
     )
     root.mainloop()
+    # Write out any trace lines still waiting for the next log flush
+    app._close_trace_file()
+    app._io_pool.shutdown(wait=False, cancel_futures=True)
+    app._wheel_pool.shutdown(wait=False, cancel_futures=True)
 
 
 if __name__ == "__main__":
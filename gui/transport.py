@@ -2,7 +2,9 @@
 
 import sys
 import time
+import asyncio
 import threading
+import weakref
 from typing import cast, Any
 
 try:
@@ -13,6 +15,23 @@ except ImportError:
     HAS_BLE = False
 
 
+# A loop can't run_until_complete() from two threads at once, so adapters that
+# share a loop (left and right wheel) must also share its lock.
+_loop_locks: "weakref.WeakKeyDictionary[Any, threading.RLock]" = weakref.WeakKeyDictionary()
+_loop_locks_guard = threading.Lock()
+
+
+def _lock_for_loop(loop):
+    """Return the RLock serializing coroutine runs on loop."""
+    if loop is None:
+        return threading.RLock()
+    with _loop_locks_guard:
+        lock = _loop_locks.get(loop)
+        if lock is None:
+            lock = _loop_locks[loop] = threading.RLock()
+        return lock
+
+
 class BLEConnectionAdapter:
     """Sync adapter for the async BLE transport used by ECSRemote."""
 
@@ -30,7 +49,10 @@ class BLEConnectionAdapter:
         self.bt = M25BluetoothBLE(address=address, key=key, name=name, debug=debug, log_callback=log_callback)
         self.connected = False
         self.notifications_started = False
-        self._loop_lock = threading.RLock()
+        self._loop_lock = _lock_for_loop(loop)
+        # One request/response exchange at a time per wheel, so concurrent
+        # callers can't drain or steal each other's responses.
+        self._tx_lock = threading.Lock()
 
     def _trace(self, message):
         if self.log_callback:
@@ -43,10 +65,14 @@ class BLEConnectionAdapter:
             print(message, file=sys.stderr)
 
     def _run(self, coro):
-        """Run one coroutine on the shared loop, serialized across threads."""
+        """Run one coroutine on the shared loop and wait for its result."""
         if not self.loop:
             coro.close()  # suppress "coroutine never awaited" RuntimeWarning
             return None
+        if self.loop.is_running():
+            # Loop lives on its own thread; hand the coroutine over instead of
+            # driving the loop here, so other adapters' coroutines run alongside.
+            return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
         with self._loop_lock:
             return self.loop.run_until_complete(coro)
 
@@ -93,6 +119,45 @@ class BLEConnectionAdapter:
 
     def transact(self, spp_data, timeout=1.0):
         """Send packet and receive decrypted response (sync interface)."""
+        with self._tx_lock:
+            return self._transact(spp_data, timeout)
+
+    def transact_many(self, packets, timeout=2.0):
+        """Send packets back to back and collect responses matched by telegram ID.
+
+        Returns one decrypted response (or None) per packet, in order.
+        """
+        results = [None] * len(packets)
+        with self._tx_lock:
+            if not self.loop or not self.connected:
+                return results
+            try:
+                self._drain_notifications()
+                pending = {}
+                for index, packet in enumerate(packets):
+                    if not self._run(self.bt.send_packet(packet)):
+                        if not getattr(self.bt, "connected", True):
+                            self.connected = False
+                        break
+                    tid = self._telegram_id(packet)
+                    if tid is not None:
+                        pending[tid] = index
+
+                deadline = time.monotonic() + max(0.05, timeout)
+                while pending and time.monotonic() < deadline:
+                    remaining = deadline - time.monotonic()
+                    response = self._run(self.bt.wait_notification(timeout=min(0.4, max(0.01, remaining))))
+                    if response is None:
+                        continue
+                    index = pending.pop(self._telegram_id(response), None)
+                    if index is not None:
+                        results[index] = response
+            except Exception as e:
+                if self.debug:
+                    self._trace(f"  transact_many error [{self.name}]: {e}")
+        return results
+
+    def _transact(self, spp_data, timeout):
         if not self.loop or not self.connected:
             return None
         # Mirror underlying BT state: if device dropped, don't try to send.
@@ -7,7 +7,9 @@ class PlaceholderEntry(tk.Entry):
     """Entry widget that shows placeholder text when empty."""
 
     def __init__(self, master=None, placeholder="", placeholder_color="gray", is_password=False, **kwargs):
-        super().__init__(master, **kwargs)
+        # Back the entry with a StringVar so reads skip the widget's Tcl command.
+        self._var = kwargs.pop("textvariable", None) or tk.StringVar(master)
+        super().__init__(master, textvariable=self._var, **kwargs)
 
         self.placeholder = placeholder
         self.placeholder_color = placeholder_color
@@ -35,14 +37,13 @@ class PlaceholderEntry(tk.Entry):
             self.has_placeholder = False
 
     def on_focus_out(self, event):
-        if not super().get():
+        if not self._var.get():
             self.put_placeholder()
 
     def get(self):
-        content = super().get()
         if self.has_placeholder:
             return ""
-        return content
+        return self._var.get()
 
     def set_theme_colors(self, fg_color, placeholder_color):
         """Update fg and placeholder colors for the active theme."""
@@ -71,11 +71,15 @@ class MockInput:
     
     async def read_control_state(self) -> Optional[ControlState]:
         """Return next scripted state or keyboard state"""
+        return self.read_control_state_sync()
+    
+    def read_control_state_sync(self) -> Optional[ControlState]:
+        """Synchronous read_control_state; nothing here actually waits"""
         if not self._running:
             return None
         
         if self._use_keyboard:
-            return await self._read_keyboard_state()
+            return self._read_keyboard_state()
         
         # Scripted mode
         if not self._states:
@@ -89,7 +93,7 @@ class MockInput:
         self._index += 1
         return state
     
-    async def _read_keyboard_state(self) -> ControlState:
+    def _read_keyboard_state(self) -> ControlState:
         """
         Read keyboard input (simulated for now).
         
@@ -140,15 +144,16 @@ class MockInput:
         Args:
             script_name: Name of script to load from TestScripts
         """
+        # Build only the requested script; reads then just index the list
         script_map = {
-            "forward": TestScripts.forward_drive(),
-            "emergency_stop": TestScripts.emergency_stop(),
-            "turn": TestScripts.turn_test(),
-            "forward_turn_stop": TestScripts.forward_turn_stop(),
+            "forward": TestScripts.forward_drive,
+            "emergency_stop": TestScripts.emergency_stop,
+            "turn": TestScripts.turn_test,
+            "forward_turn_stop": TestScripts.forward_turn_stop,
         }
         
         if script_name in script_map:
-            self._states = script_map[script_name]
+            self._states = script_map[script_name]()
             self._use_keyboard = False
             logger.info(f"Loaded script '{script_name}' with {len(self._states)} states")
         else:
@@ -13,20 +13,15 @@ import json
 
 from m25_utils import parse_hex, iter_input_lines, has_input_available
 from m25_protocol_data import (
-    POS_PROTOCOL_ID,
-    POS_TELEGRAM_ID,
-    POS_SOURCE_ID,
-    POS_DEST_ID,
-    POS_SERVICE_ID,
-    POS_PARAM_ID,
     POS_PAYLOAD,
     MIN_SPP_PACKET_SIZE,
     PROTOCOL_ID_STANDARD,
-    get_source_name,
-    get_dest_name,
-    get_service_name,
+    source_name_of_byte,
+    dest_name_of_byte,
+    service_name_of_byte,
     get_param_name,
-    is_valid_protocol_id
+    is_valid_protocol_id,
+    parse_header
 )
 
 
@@ -51,12 +46,7 @@ class M25PacketParser:
             return None
 
         # Extract fields
-        protocol_id = spp_data[POS_PROTOCOL_ID]
-        telegram_id = spp_data[POS_TELEGRAM_ID]
-        source_id = spp_data[POS_SOURCE_ID]
-        dest_id = spp_data[POS_DEST_ID]
-        service_id = spp_data[POS_SERVICE_ID]
-        param_id = spp_data[POS_PARAM_ID]
+        protocol_id, telegram_id, source_id, dest_id, service_id, param_id = parse_header(spp_data)
         payload = spp_data[POS_PAYLOAD:] if len(spp_data) > POS_PAYLOAD else b''
 
         packet = {
@@ -75,9 +65,9 @@ class M25PacketParser:
             'has_payload': len(payload) > 0,
 
             # Human-readable names
-            'source_name': get_source_name(source_id),
-            'dest_name': get_dest_name(dest_id),
-            'service_name': get_service_name(service_id),
+            'source_name': source_name_of_byte(source_id),
+            'dest_name': dest_name_of_byte(dest_id),
+            'service_name': service_name_of_byte(service_id),
             'param_name': get_param_name(service_id, param_id),
 
             # Raw data
@@ -22,7 +22,7 @@ import asyncio
 import sys
 import json
 from pathlib import Path
-from typing import Any, Optional, List, Tuple
+from typing import Any, Dict, Optional, List, Tuple
 
 try:
     from bleak import BleakScanner, BleakClient
@@ -36,12 +36,22 @@ except ImportError:
 try:
     from m25_protocol import calculate_crc, remove_delimiters
     from m25_utils import parse_hex
-    from m25_crypto import M25Encryptor, M25Decryptor
+    from m25_crypto import get_encryptor, get_decryptor
 except ImportError:
     print("ERROR: m25_protocol.py, m25_utils.py, or m25_crypto.py not found", file=sys.stderr)
     sys.exit(1)
 
 
+# BLEDevice objects from recent scans, keyed by upper-case address. BleakClient
+# given a bare address runs its own discovery first; given a device it doesn't.
+_discovered_devices: Dict[str, Any] = {}
+
+
+def _client_target(address: str) -> Any:
+    """Return the scanned BLEDevice for address if we have one, else the address."""
+    return _discovered_devices.get(address.upper(), address)
+
+
 # M25 device name prefixes
 M25_DEVICE_PREFIXES = ["emotion", "M25", "e-motion", "Alber", "WHEEL"]
 
@@ -81,7 +91,7 @@ KNOWN_M25_BLE_PROFILES = [
 
 
 def _hex_bytes(data: bytes) -> str:
-    return " ".join(f"{byte:02X}" for byte in data)
+    return bytes(data).hex(" ").upper()
 
 # State file for storing connection info
 STATE_FILE = Path.home() / ".m5squared" / "ble_state.json"
@@ -170,8 +180,8 @@ class M25BluetoothBLE:
         self.connected = False
         
         # Encryption (only if key provided)
-        self.encryptor = M25Encryptor(key) if key else None
-        self.decryptor = M25Decryptor(key) if key else None
+        self.encryptor = get_encryptor(bytes(key)) if key else None
+        self.decryptor = get_decryptor(bytes(key)) if key else None
         
         # BLE characteristics
         self._tx_char = None
@@ -221,6 +231,7 @@ class M25BluetoothBLE:
         
         results = []
         for addr, (device, adv_data) in devices.items():
+            _discovered_devices[addr.upper()] = device
             name = device.name or "Unknown"
             
             # Filter if requested
@@ -261,7 +272,7 @@ class M25BluetoothBLE:
             self._trace(f"[{self.name}] Connecting to {addr}...")
         
         try:
-            self.client = BleakClient(addr, timeout=timeout)
+            self.client = BleakClient(_client_target(addr), timeout=timeout)
             await self.client.connect()
             # Register OS-level disconnect callback so we learn about drops immediately.
             if hasattr(self.client, "set_disconnected_callback"):
@@ -510,7 +521,7 @@ class M25BluetoothBLE:
         except asyncio.TimeoutError:
             return None
     
-    async def receive_packet(self, timeout: int = 5) -> Optional[bytes]:
+    async def receive_packet(self, timeout: float = 5.0) -> Optional[bytes]:
         """
         Receive packet data by reading characteristic (POLLING - uses more power)
         
@@ -518,10 +529,10 @@ class M25BluetoothBLE:
         For power-efficient operation, use start_notifications() + wait_notification() instead.
         
         Args:
-            timeout: Receive timeout in seconds
+            timeout: Receive timeout in seconds (fractions allowed, 0 = no limit)
             
         Returns:
-            Received bytes (decrypted if decryptor exists) or None
+            Received bytes (decrypted if decryptor exists) or None on timeout
         """
         if not self.connected or not self.client or not self._rx_char:
             if self.debug:
@@ -529,8 +540,9 @@ class M25BluetoothBLE:
             return None
         
         try:
-            # Read from characteristic
-            data = await self.client.read_gatt_char(self._rx_char)
+            # Read from characteristic, bounded by the caller's timeout
+            read = self.client.read_gatt_char(self._rx_char)
+            data = await asyncio.wait_for(read, timeout=float(timeout)) if timeout else await read
             
             if data:
                 # Decrypt if decryptor is available
@@ -545,6 +557,8 @@ class M25BluetoothBLE:
             
             return None
             
+        except asyncio.TimeoutError:
+            return None
         except Exception as e:
             if self.debug:
                 self._trace(f"[{self.name}] Receive error: {e}")
@@ -647,6 +661,38 @@ def _requires_write_response(services, tx_uuid: str) -> bool:
     return False
 
 
+async def resolve_devices(addresses: List[str], timeout: float = 5.0) -> bool:
+    """Cache a BLEDevice for every address, with one scan covering all missing ones.
+
+    A BleakClient given a bare address runs its own discovery first, so two
+    wheels typed in by MAC would otherwise cost two scans. Stops as soon as
+    every address has been seen. Returns True if all were resolved.
+    """
+    if not HAS_BLEAK or BleakScanner is None:
+        return False
+
+    missing = {addr.upper() for addr in addresses if addr} - _discovered_devices.keys()
+    if not missing:
+        return True
+
+    all_found = asyncio.Event()
+
+    def on_detect(device, _adv_data):
+        addr = device.address.upper()
+        if addr in missing:
+            _discovered_devices[addr] = device
+            missing.discard(addr)
+            if not missing:
+                all_found.set()
+
+    try:
+        async with BleakScanner(detection_callback=on_detect):
+            await asyncio.wait_for(all_found.wait(), timeout)
+    except Exception:
+        pass
+    return not missing
+
+
 async def detect_m25_ble_profile(address: str, timeout: int = 5) -> Optional[str]:
     """Connect briefly and detect whether a wheel exposes a known BLE profile."""
     if not HAS_BLEAK:
@@ -654,7 +700,7 @@ async def detect_m25_ble_profile(address: str, timeout: int = 5) -> Optional[str
     if BleakClient is None:
         return None
 
-    client = BleakClient(address, timeout=timeout)
+    client = BleakClient(_client_target(address), timeout=timeout)
     try:
         await client.connect()
         if not client.is_connected:
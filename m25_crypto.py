@@ -10,6 +10,7 @@ At least they didn't roll their own crypto... entirely.
 39C3: We break wheelchairs (with consent and good intentions).
 """
 
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 import sys
 
@@ -26,6 +27,19 @@ from m25_protocol import (
     calculate_crc, add_delimiters, remove_delimiters
 )
 
+# CBC done by hand on the shared ECB cipher skips AES.new()'s per-packet key
+# schedule. Encryption chains block by block in Python, so it only wins for
+# short messages (command packets are one or two blocks); decryption XORs
+# all blocks at once and always wins.
+_CBC_INLINE_MAX = 2 * AES.block_size
+
+
+@lru_cache(maxsize=None)
+def _header_crc(frame_length: int) -> int:
+    """CRC state after the 3-byte frame header, which depends only on the length."""
+    header = bytes([HEADER_MARKER, (frame_length >> 8) & 0xFF, frame_length & 0xFF])
+    return calculate_crc(header, len(header))
+
 
 class M25Encryptor:
     """Encrypt M25 SPP packets for transmission."""
@@ -34,23 +48,30 @@ class M25Encryptor:
         if len(key) != 16:
             raise ValueError(f"Key must be 16 bytes, got {len(key)}")
         self.key = key
-
-    def encrypt(self, spp_data: bytes) -> bytes:
-        """Encrypt SPP data into complete M25 packet ready to send."""
-        return self.encrypt_verbose(spp_data)['encrypted_packet']
-
-    encrypt_packet = encrypt  # Backward compatibility
-
-    def encrypt_verbose(self, spp_data: bytes) -> Dict[str, Any]:
-        """Encrypt with full details. Returns dict with encrypted_packet, iv, crc, etc."""
+        # ECB is stateless, so one cipher (and its key schedule) serves every IV.
+        self._ecb = AES.new(key, AES.MODE_ECB)
+
+    def _cbc_encrypt(self, iv: bytes, data: bytes) -> bytes:
+        """AES-CBC encrypt block-aligned data."""
+        if len(data) > _CBC_INLINE_MAX:
+            return AES.new(self.key, AES.MODE_CBC, iv).encrypt(data)
+        encrypt_block = self._ecb.encrypt
+        blocks = []
+        prev = iv
+        for i in range(0, len(data), AES.block_size):
+            mixed = int.from_bytes(data[i:i + AES.block_size], 'big') ^ int.from_bytes(prev, 'big')
+            prev = encrypt_block(mixed.to_bytes(AES.block_size, 'big'))
+            blocks.append(prev)
+        return b''.join(blocks)
+
+    def _encrypt_frame(self, spp_data: bytes):
+        """Build the unstuffed frame. Returns (frame, iv, iv_encrypted, encrypted_data, frame_length, crc)."""
         padded_data = pad(spp_data, AES.block_size)
         iv = get_random_bytes(IV_SIZE)
 
-        cipher_ecb = AES.new(self.key, AES.MODE_ECB)
-        iv_encrypted = cipher_ecb.encrypt(iv)
+        iv_encrypted = self._ecb.encrypt(iv)
 
-        cipher_cbc = AES.new(self.key, AES.MODE_CBC, iv)
-        encrypted_data = cipher_cbc.encrypt(padded_data)
+        encrypted_data = self._cbc_encrypt(iv, padded_data)
 
         payload = iv_encrypted + encrypted_data
         frame_length = HEADER_SIZE + len(payload) + 2 - 1
@@ -61,15 +82,23 @@ class M25Encryptor:
         frame = bytearray([HEADER_MARKER, (frame_length >> 8) & 0xFF, frame_length & 0xFF])
         frame.extend(payload)
 
-        crc = calculate_crc(bytes(frame), len(frame))
+        crc = calculate_crc(payload, len(payload), _header_crc(frame_length))
         frame.append((crc >> 8) & 0xFF)
         frame.append(crc & 0xFF)
 
-        packet_raw = bytes(frame)
-        packet_stuffed = add_delimiters(packet_raw)
+        return bytes(frame), iv, iv_encrypted, encrypted_data, frame_length, crc
 
+    def encrypt(self, spp_data: bytes) -> bytes:
+        """Encrypt SPP data into complete M25 packet ready to send."""
+        return add_delimiters(self._encrypt_frame(spp_data)[0])
+
+    encrypt_packet = encrypt  # Backward compatibility
+
+    def encrypt_verbose(self, spp_data: bytes) -> Dict[str, Any]:
+        """Encrypt with full details. Returns dict with encrypted_packet, iv, crc, etc."""
+        packet_raw, iv, iv_encrypted, encrypted_data, frame_length, crc = self._encrypt_frame(spp_data)
         return {
-            'encrypted_packet': packet_stuffed,
+            'encrypted_packet': add_delimiters(packet_raw),
             'encrypted_packet_raw': packet_raw,
             'iv': iv,
             'iv_encrypted': iv_encrypted,
@@ -86,6 +115,16 @@ class M25Decryptor:
         if len(key) != 16:
             raise ValueError(f"Key must be 16 bytes, got {len(key)}")
         self.key = key
+        # ECB is stateless, so one cipher (and its key schedule) serves every IV.
+        self._ecb = AES.new(key, AES.MODE_ECB)
+
+    def _cbc_decrypt(self, iv: bytes, data: bytes) -> bytes:
+        """AES-CBC decrypt block-aligned data: one ECB pass, then one XOR with the shifted ciphertext."""
+        if not data:
+            return b''
+        plain = self._ecb.decrypt(data)
+        chain = iv + data[:-AES.block_size]
+        return (int.from_bytes(plain, 'big') ^ int.from_bytes(chain, 'big')).to_bytes(len(data), 'big')
 
     def decrypt(self, packet_bytes: bytes, validate_padding: bool = True) -> Optional[bytes]:
         """Decrypt M25 packet. Returns SPP data or None on failure."""
@@ -124,15 +163,13 @@ class M25Decryptor:
             return None
 
         iv_encrypted = destuffed[HEADER_SIZE:HEADER_SIZE + IV_SIZE]
-        cipher_ecb = AES.new(self.key, AES.MODE_ECB)
-        iv = cipher_ecb.decrypt(iv_encrypted)
+        iv = self._ecb.decrypt(iv_encrypted)
 
         data_start = HEADER_SIZE + IV_SIZE
         encrypted_data_length = frame_length - data_start - 2 + 1
         encrypted_data = destuffed[data_start:data_start + encrypted_data_length]
 
-        cipher_cbc = AES.new(self.key, AES.MODE_CBC, iv)
-        decrypted_data = cipher_cbc.decrypt(encrypted_data)
+        decrypted_data = self._cbc_decrypt(iv, encrypted_data)
 
         return {
             'decrypted': decrypted_data,
@@ -182,6 +219,26 @@ class MultiKeyDecryptor:
         return None
 
 
+# Encryptors/decryptors are immutable once built, so connections that use the
+# same key can share one. Bounded to a handful of keys (two wheels plus spares).
+@lru_cache(maxsize=8)
+def get_encryptor(key: bytes) -> M25Encryptor:
+    """Return a shared M25Encryptor for key."""
+    return M25Encryptor(key)
+
+
+@lru_cache(maxsize=8)
+def get_decryptor(key: bytes) -> M25Decryptor:
+    """Return a shared M25Decryptor for key."""
+    return M25Decryptor(key)
+
+
+def clear_cipher_cache() -> None:
+    """Drop cached encryptors/decryptors, e.g. after the wheel keys change."""
+    get_encryptor.cache_clear()
+    get_decryptor.cache_clear()
+
+
 def extract_decrypted_data(result: Dict[str, Any], include_padding: bool = False) -> bytes:
     """Extract decrypted data from verbose result."""
     decrypted = result['decrypted']
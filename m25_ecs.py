@@ -17,6 +17,7 @@ import sys
 import socket
 import json
 import time
+from functools import lru_cache
 
 # Import M25 protocol utilities
 from m25_protocol import HEADER_MARKER
@@ -27,6 +28,7 @@ from m25_protocol_data import (
     # Protocol constants
     PROTOCOL_ID_STANDARD, POS_PROTOCOL_ID, POS_TELEGRAM_ID, POS_SOURCE_ID,
     POS_DEST_ID, POS_SERVICE_ID, POS_PARAM_ID, POS_PAYLOAD, MIN_SPP_PACKET_SIZE,
+    HEADER_STRUCT,
     # Device IDs
     SRC_ID_SMARTPHONE, DEST_ID_M25_WHEEL_COMMON,
     # Service IDs
@@ -56,7 +58,10 @@ from m25_protocol_data import (
     # ACK/NACK
     PARAM_ID_ACK, NACK_GENERAL,
     # System/Drive modes
-    SYSTEM_MODE_CONNECT
+    SYSTEM_MODE_CONNECT,
+    # Payload layouts
+    PAYLOAD_DRIVE_PROFILE_PARAMS_STRUCT, PAYLOAD_CRUISE_VALUES_STRUCT,
+    PAYLOAD_CRUISE_VALUES_TYPE, unpack_record
 )
 
 
@@ -103,8 +108,7 @@ class ECSPacketBuilder(PacketBuilderBase):
         Args:
             level: 0 = Normal/Level1, 1 = Outdoor/Level2, 2 = Learning/Level3
         """
-        return self.build_packet(SERVICE_ID_APP_MGMT, PARAM_ID_WRITE_ASSIST_LEVEL,
-                                 bytes([level]))
+        return self.build_byte_packet(SERVICE_ID_APP_MGMT, PARAM_ID_WRITE_ASSIST_LEVEL, level)
 
     def build_write_drive_mode(self, mode):
         """Build WRITE_DRIVE_MODE packet (auto hold / hill hold)
@@ -115,8 +119,7 @@ class ECSPacketBuilder(PacketBuilderBase):
         mode_value = int(mode)
         if mode_value < 0 or mode_value > 0xFF:
             raise ValueError(f"Drive mode {mode_value} out of range (0-255)")
-        return self.build_packet(SERVICE_ID_APP_MGMT, PARAM_ID_WRITE_DRIVE_MODE,
-                                 bytes([mode_value]))
+        return self.build_byte_packet(SERVICE_ID_APP_MGMT, PARAM_ID_WRITE_DRIVE_MODE, mode_value)
 
     def build_write_drive_profile(self, profile_id):
         """Build WRITE_DRIVE_PROFILE packet (select profile)
@@ -124,8 +127,7 @@ class ECSPacketBuilder(PacketBuilderBase):
         Args:
             profile_id: 0=Customized, 1=Standard, 2=Sensitive, 3=Soft, 4=Active, 5=SensitivePlus
         """
-        return self.build_packet(SERVICE_ID_APP_MGMT, PARAM_ID_WRITE_DRIVE_PROFILE,
-                                 bytes([profile_id]))
+        return self.build_byte_packet(SERVICE_ID_APP_MGMT, PARAM_ID_WRITE_DRIVE_PROFILE, profile_id)
     
     def build_write_remote_speed(self, speed):
         """Build WRITE_REMOTE_SPEED packet (send motor speed command)
@@ -134,14 +136,14 @@ class ECSPacketBuilder(PacketBuilderBase):
             speed: signed 16-bit speed value (-32768 to 32767)
                    Typically use range like -100 to 100 for percentage-based control
         """
-        # Convert to signed 16-bit big-endian
+        return self._build_speed_packet(speed, self._speed_payload)
+
+    @staticmethod
+    def _speed_payload(speed):
+        """Encode a remote speed as signed 16-bit big-endian."""
         if speed < -32768 or speed > 32767:
             raise ValueError(f"Speed {speed} out of range (-32768 to 32767)")
-        
-        # Pack as signed 16-bit big-endian
-        payload = speed.to_bytes(2, byteorder='big', signed=True)
-        return self.build_packet(SERVICE_ID_APP_MGMT, PARAM_ID_WRITE_REMOTE_SPEED,
-                                 payload)
+        return speed.to_bytes(2, byteorder='big', signed=True)
 
     def build_write_drive_profile_params(self, assist_level, max_torque, max_speed,
                                           p_factor, speed_bias, speed_factor,
@@ -175,6 +177,16 @@ class ECSPacketBuilder(PacketBuilderBase):
         return self.build_packet(SERVICE_ID_APP_MGMT, PARAM_ID_WRITE_DRIVE_PROFILE_PARAMS,
                                  payload)
 
+
+_MOUNTING_SIDE_NAMES = {0: "Unknown", 1: "Right", 2: "Left"}
+
+
+@lru_cache(maxsize=256)
+def _unknown_name(value):
+    """Label for an ID with no known name; values are bytes, so this caches them all."""
+    return f"Unknown({value})"
+
+
 class ResponseParser:
     """Parse M25 SPP response packets"""
 
@@ -183,13 +195,14 @@ class ResponseParser:
         """Parse SPP packet header"""
         if len(data) < MIN_SPP_PACKET_SIZE:
             return None
+        protocol_id, telegram_id, source_id, dest_id, service_id, param_id = HEADER_STRUCT.unpack_from(data)
         return {
-            'protocol_id': data[POS_PROTOCOL_ID],
-            'telegram_id': data[POS_TELEGRAM_ID],
-            'source_id': data[POS_SOURCE_ID],
-            'dest_id': data[POS_DEST_ID],
-            'service_id': data[POS_SERVICE_ID],
-            'param_id': data[POS_PARAM_ID],
+            'protocol_id': protocol_id,
+            'telegram_id': telegram_id,
+            'source_id': source_id,
+            'dest_id': dest_id,
+            'service_id': service_id,
+            'param_id': param_id,
             'payload': data[POS_PAYLOAD:] if len(data) > POS_PAYLOAD else b''
         }
 
@@ -218,7 +231,7 @@ class ResponseParser:
             level = payload[0]
             return {
                 'value': level,
-                'name': ASSIST_LEVEL_NAMES.get(level, f"Unknown({level})")
+                'name': ASSIST_LEVEL_NAMES.get(level) or _unknown_name(level)
             }
         return None
 
@@ -242,26 +255,26 @@ class ResponseParser:
             profile_id = payload[0]
             return {
                 'value': profile_id,
-                'name': PROFILE_NAMES.get(profile_id, f"Unknown({profile_id})")
+                'name': PROFILE_NAMES.get(profile_id) or _unknown_name(profile_id)
             }
         return None
 
     @staticmethod
     def parse_drive_profile_params(payload):
         """Parse STATUS_DRIVE_PROFILE_PARAMS response (10 bytes)"""
-        if len(payload) >= 10:
-            max_speed_raw = (payload[1] << 8) | payload[2]
-            p_factor = (payload[3] << 8) | payload[4]
+        if len(payload) >= PAYLOAD_DRIVE_PROFILE_PARAMS_STRUCT.size:
+            (max_torque, max_speed_raw, p_factor, speed_bias, speed_factor,
+             rotation_threshold, slope_inc, slope_dec) = PAYLOAD_DRIVE_PROFILE_PARAMS_STRUCT.unpack_from(payload)
             return {
-                'max_torque': payload[0],
+                'max_torque': max_torque,
                 'max_speed': max_speed_raw * 0.0036,  # mm/s to km/h
                 'max_speed_raw': max_speed_raw,
                 'p_factor': p_factor,
-                'speed_bias': payload[5],
-                'speed_factor': payload[6],
-                'rotation_threshold': payload[7],
-                'slope_inc': payload[8],
-                'slope_dec': payload[9]
+                'speed_bias': speed_bias,
+                'speed_factor': speed_factor,
+                'rotation_threshold': rotation_threshold,
+                'slope_inc': slope_inc,
+                'slope_dec': slope_dec
             }
         return None
 
@@ -271,9 +284,10 @@ class ResponseParser:
 
         Contains: drive_mode, push_rim, speed, soc, distance, push_counter, error
         """
-        if len(payload) >= 12:
+        if len(payload) >= PAYLOAD_CRUISE_VALUES_STRUCT.size:
             # Bytes 5-8: overall_distance (uint32_be, 0.01m units)
-            distance_raw = (payload[5] << 24) | (payload[6] << 16) | (payload[7] << 8) | payload[8]
+            cruise = unpack_record(PAYLOAD_CRUISE_VALUES_STRUCT, PAYLOAD_CRUISE_VALUES_TYPE, payload)
+            distance_raw = cruise.overall_distance
             distance_km = distance_raw * 0.01 / 1000  # 0.01m -> km
             return {
                 'distance_km': distance_km,
@@ -320,11 +334,7 @@ class ResponseParser:
         if len(payload) >= 3:
             mounting_side = payload[0]
             steering_dynamic = payload[2]
-            mounting_name = {
-                0: "Unknown",
-                1: "Right",
-                2: "Left",
-            }.get(mounting_side, f"Unknown({mounting_side})")
+            mounting_name = _MOUNTING_SIDE_NAMES.get(mounting_side) or _unknown_name(mounting_side)
             return {
                 'mounting_side': mounting_side,
                 'mounting_name': mounting_name,
@@ -370,15 +380,56 @@ class ECSRemote:
             print(f"  Init: no response", file=sys.stderr)
         return False
 
+    def _match_read_response(self, packet, response, expected_param_id, parse_method):
+        """Interpret one response to a read request.
+
+        Returns (parsed, error, retry_delay): parsed is None on failure, and
+        retry_delay is None when retrying is pointless (NACK).
+        """
+        requested_tid = packet[POS_TELEGRAM_ID] if len(packet) > POS_TELEGRAM_ID else None
+        requested_service_id = packet[POS_SERVICE_ID] if len(packet) > POS_SERVICE_ID else None
+        requested_param_id = packet[POS_PARAM_ID] if len(packet) > POS_PARAM_ID else None
+
+        header = ResponseParser.parse_header(response)
+        if header is None:
+            return None, "invalid response", 0
+
+        response_tid = header.get('telegram_id')
+        if requested_tid is not None and response_tid is not None and response_tid != requested_tid:
+            return None, f"telegram mismatch req=0x{requested_tid:02X} resp=0x{response_tid:02X}", 0.05
+
+        if ResponseParser.is_nack(header):
+            return None, f"NACK 0x{header['param_id']:02X}", None  # Don't retry NACKs
+
+        # M25 variants differ in read response format:
+        # - Some return STATUS_* param IDs (expected_param_id)
+        # - Some echo the READ_* param ID back
+        # - Some return ACK with payload containing the value
+        param_id = header['param_id']
+        payload = header['payload']
+
+        if param_id == expected_param_id or (requested_param_id is not None and param_id == requested_param_id):
+            parsed = parse_method(payload)
+            return parsed, None if parsed is not None else "parser returned no data", 0
+
+        if ResponseParser.is_ack(header) and payload:
+            parsed = parse_method(payload)
+            return parsed, None if parsed is not None else "ACK payload parse failed", 0
+
+        # Extra compatibility path for variants that reply on the same service
+        # with non-standard param IDs but a parseable payload.
+        if requested_service_id is not None and header.get('service_id') == requested_service_id and payload:
+            parsed = parse_method(payload)
+            return parsed, None if parsed is not None else "same-service payload parse failed", 0
+
+        return None, f"unexpected param_id 0x{param_id:02X}", 0
+
     def read_value(self, conn, build_method, expected_param_id, parse_method):
         """Read a single value from a wheel (with retry)"""
         last_error = None
 
         for attempt in range(self.retries + 1):
             packet = build_method()
-            requested_tid = packet[POS_TELEGRAM_ID] if len(packet) > POS_TELEGRAM_ID else None
-            requested_service_id = packet[POS_SERVICE_ID] if len(packet) > POS_SERVICE_ID else None
-            requested_param_id = packet[POS_PARAM_ID] if len(packet) > POS_PARAM_ID else None
             response = conn.transact(packet)
 
             if response is None:
@@ -387,58 +438,49 @@ class ECSRemote:
                     time.sleep(0.1)  # Brief delay before retry
                 continue
 
-            header = ResponseParser.parse_header(response)
-            if header is None:
-                last_error = "invalid response"
-                continue
-
-            response_tid = header.get('telegram_id')
-            if requested_tid is not None and response_tid is not None and response_tid != requested_tid:
-                last_error = f"telegram mismatch req=0x{requested_tid:02X} resp=0x{response_tid:02X}"
-                if attempt < self.retries:
-                    time.sleep(0.05)
-                continue
-
-            if ResponseParser.is_nack(header):
-                last_error = f"NACK 0x{header['param_id']:02X}"
-                break  # Don't retry NACKs
-
-            # M25 variants differ in read response format:
-            # - Some return STATUS_* param IDs (expected_param_id)
-            # - Some echo the READ_* param ID back
-            # - Some return ACK with payload containing the value
-            param_id = header['param_id']
-            payload = header['payload']
-
-            if param_id == expected_param_id or (requested_param_id is not None and param_id == requested_param_id):
-                parsed = parse_method(payload)
-                if parsed is not None:
-                    return parsed
-                last_error = "parser returned no data"
-                continue
-
-            if ResponseParser.is_ack(header) and payload:
-                parsed = parse_method(payload)
-                if parsed is not None:
-                    return parsed
-                last_error = "ACK payload parse failed"
-                continue
-
-            # Extra compatibility path for variants that reply on the same service
-            # with non-standard param IDs but a parseable payload.
-            if requested_service_id is not None and header.get('service_id') == requested_service_id and payload:
-                parsed = parse_method(payload)
-                if parsed is not None:
-                    return parsed
-                last_error = "same-service payload parse failed"
-                continue
-
-            last_error = f"unexpected param_id 0x{param_id:02X}"
+            parsed, last_error, retry_delay = self._match_read_response(
+                packet, response, expected_param_id, parse_method
+            )
+            if parsed is not None:
+                return parsed
+            if retry_delay is None:
+                break
+            if retry_delay and attempt < self.retries:
+                time.sleep(retry_delay)
 
         if self.verbose and last_error:
             print(f"  {build_method.__name__}: {last_error}", file=sys.stderr)
         return None
 
+    def read_values(self, conn, reads):
+        """Read several values from one wheel; reads are (build_method, expected_param_id, parse_method).
+
+        Connections with transact_many() get all requests back to back and the
+        responses matched by telegram ID, so the batch costs about one round
+        trip. Anything that comes back missing or unparseable is re-read with
+        read_value() and its retries; a NACK is final, as in read_value().
+        Results are returned in request order.
+        """
+        transact_many = getattr(conn, "transact_many", None)
+        if transact_many is None:
+            return [self.read_value(conn, *read) for read in reads]
+
+        packets = [build_method() for build_method, _, _ in reads]
+        responses = transact_many(packets)
+        results = []
+        for read, packet, response in zip(reads, packets, responses):
+            if response is None:
+                results.append(self.read_value(conn, *read))
+                continue
+            parsed, error, retry_delay = self._match_read_response(packet, response, read[1], read[2])
+            if parsed is None:
+                if retry_delay is not None:
+                    parsed = self.read_value(conn, *read)
+                elif self.verbose and error:
+                    print(f"  {read[0].__name__}: {error}", file=sys.stderr)
+            results.append(parsed)
+        return results
+
     def write_value(self, conn, packet, command_name):
         """Send a write command and expect ACK (with retry)
 
@@ -519,7 +561,7 @@ class ECSRemote:
         self._trace(
             f"[D][TX] {wheel_label} WRITE_REMOTE_SPEED svc=0x{service_id:02X} param=0x{param_id:02X} tg=0x{telegram_id:02X} payloadLen={len(payload)}"
         )
-        self._trace(f"[D][TX] remote_speed raw={speed} payload={' '.join(f'{byte:02X}' for byte in payload)}")
+        self._trace(f"[D][TX] remote_speed raw={speed} payload={payload.hex(' ').upper()}")
 
         # RFCOMM connection exposes send_packet() for fire-and-forget writes.
         send_packet = getattr(conn, "send_packet", None)
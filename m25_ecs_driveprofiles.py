@@ -13,7 +13,7 @@ from m25_protocol_data import (
     PROFILE_ID_SOFT, PROFILE_ID_ACTIVE, PROFILE_ID_SENSITIVE_PLUS,
     PROFILE_NAMES,
     MAX_SPEED_VALUES, MAX_SUPPORT_SPEED, MAX_SPEED_LEARNING,
-    SPEED_BIAS_VALUES, SLOPE_VALUES
+    SPEED_BIAS_VALUES, SLOPE_VALUES, format_max_speed
 )
 
 # Aliases for clarity
@@ -30,13 +30,15 @@ def speed_kmh_to_raw(kmh):
     """Convert km/h to raw speed value (mm/s)"""
     return int(kmh / 0.0036)
 
+_SPEED_INDEX = {raw: i for i, raw in enumerate(MAX_SPEED_VALUES)}
+
 def get_speed_index(raw):
     """Get the index of a speed value in the speed range"""
-    try:
-        return MAX_SPEED_VALUES.index(raw)
-    except ValueError:
-        # Find nearest
-        return min(range(len(MAX_SPEED_VALUES)), key=lambda i: abs(MAX_SPEED_VALUES[i] - raw))
+    index = _SPEED_INDEX.get(raw)
+    if index is not None:
+        return index
+    # Find nearest
+    return min(range(len(MAX_SPEED_VALUES)), key=lambda i: abs(MAX_SPEED_VALUES[i] - raw))
 
 
 # Default profile parameters
@@ -205,12 +207,10 @@ def format_profile(profile_data):
     lines = []
     for level in ['level_1', 'level_2']:
         params = profile_data[level]
-        speed_kmh = speed_raw_to_kmh(params['max_speed'])
-
         level_num = level[-1]
         lines.append(f"  Level {level_num}:")
         lines.append(f"    Max Torque:      {params['max_torque']}%")
-        lines.append(f"    Max Speed:       {speed_kmh:.1f} km/h")
+        lines.append(f"    Max Speed:       {format_max_speed(params['max_speed'])}")
         lines.append(f"    Sensor Sens.:    {params['speed_bias']} (speedBias)")
         lines.append(f"    Startup Time:    {params['slope_inc']} (slopeInc)")
         lines.append(f"    Coasting Time:   {params['slope_dec']} (slopeDec)")
@@ -10,6 +10,7 @@ import argparse
 import sys
 import time
 import struct
+from concurrent.futures import ThreadPoolExecutor, wait
 
 # Import M25 protocol utilities
 from m25_utils import parse_key
@@ -28,6 +29,7 @@ SPEED_FAST = 250      # Faster (use with caution!)
 # Timing
 COMMAND_INTERVAL_MS = 100  # Send speed commands every 100ms
 FORWARD_DURATION_MS = 500  # Move forward for 500ms (half second)
+PROGRESS_EVERY = 1000 // COMMAND_INTERVAL_MS  # Progress line cadence, in commands
 
 
 def run_remote_test(left_conn, right_conn, speed=SPEED_SLOW, left_speed=None, right_speed=None, duration_ms=FORWARD_DURATION_MS, dry_run=False):
@@ -43,6 +45,24 @@ def run_remote_test(left_conn, right_conn, speed=SPEED_SLOW, left_speed=None, ri
     """
     builder_left = PacketBuilder()
     builder_right = PacketBuilder()
+    # One worker per wheel so both sends of a tick go out together
+    pool = ThreadPoolExecutor(max_workers=2)
+
+    def send_pair(packet_left, packet_right):
+        """Send to both wheels concurrently; returns (enc_left, enc_right)"""
+        fut_left = pool.submit(left_conn.send_packet, packet_left)
+        fut_right = pool.submit(right_conn.send_packet, packet_right)
+        # Let both finish before raising, so the caller's emergency stop
+        # never writes to a socket a worker is still sending on
+        wait((fut_left, fut_right))
+        return fut_left.result(), fut_right.result()
+
+    def receive_pair(timeout):
+        """Wait for both wheels' replies together, sharing one timeout"""
+        fut_left = pool.submit(left_conn.receive, timeout)
+        fut_right = pool.submit(right_conn.receive, timeout)
+        wait((fut_left, fut_right))
+        return fut_left.result(), fut_right.result()
 
     print("\nM25 Remote Control Test" + (" [DRY RUN]" if dry_run else ""))
 
@@ -53,8 +73,7 @@ def run_remote_test(left_conn, right_conn, speed=SPEED_SLOW, left_speed=None, ri
         print(f"   Right SPP: {packet_right.hex()}")
 
         if not dry_run:
-            enc_left = left_conn.send_packet(packet_left)
-            enc_right = right_conn.send_packet(packet_right)
+            enc_left, enc_right = send_pair(packet_left, packet_right)
             print(f"   Left encrypted:  {enc_left.hex()[:40]}...")
             print(f"   Right encrypted: {enc_right.hex()[:40]}...")
         else:
@@ -74,8 +93,7 @@ def run_remote_test(left_conn, right_conn, speed=SPEED_SLOW, left_speed=None, ri
         if not dry_run:
             time.sleep(0.3)  # Wait for ACK
             # Try to receive ACK
-            resp_left = left_conn.receive(timeout=0.5)
-            resp_right = right_conn.receive(timeout=0.5)
+            resp_left, resp_right = receive_pair(0.5)
             if resp_left:
                 print(f"   Left ACK: {resp_left.hex()[:40]}...")
             if resp_right:
@@ -89,8 +107,7 @@ def run_remote_test(left_conn, right_conn, speed=SPEED_SLOW, left_speed=None, ri
 
         if not dry_run:
             time.sleep(0.3)  # Wait for mode change
-            resp_left = left_conn.receive(timeout=0.5)
-            resp_right = right_conn.receive(timeout=0.5)
+            resp_left, resp_right = receive_pair(0.5)
             if resp_left:
                 print(f"   Left ACK: {resp_left.hex()[:40]}...")
             if resp_right:
@@ -108,8 +125,12 @@ def run_remote_test(left_conn, right_conn, speed=SPEED_SLOW, left_speed=None, ri
         print(f"\n[2/5] MOVING FORWARD (left={left_wheel_speed}, right={right_wheel_speed}, duration={duration_ms}ms)")
 
         num_commands = duration_ms // COMMAND_INTERVAL_MS
+        interval_s = COMMAND_INTERVAL_MS / 1000.0
+        # Ticks are scheduled from a fixed start so send time doesn't add up as drift
+        next_tick = time.monotonic()
 
         for i in range(num_commands):
+            # Rebuilt each tick: every command needs its own telegram ID
             pkt_left = builder_left.build_write_remote_speed(left_wheel_speed)
             pkt_right = builder_right.build_write_remote_speed(right_wheel_speed)
 
@@ -117,12 +138,17 @@ def run_remote_test(left_conn, right_conn, speed=SPEED_SLOW, left_speed=None, ri
                 send_to_both(pkt_left, pkt_right, f"WRITE_REMOTE_SPEED left={left_wheel_speed}, right={right_wheel_speed}")
             else:
                 if not dry_run:
-                    left_conn.send_packet(pkt_left)
-                    right_conn.send_packet(pkt_right)
-                print(f"   Sending speed command {i+1}/{num_commands}...", end='\r')
+                    send_pair(pkt_left, pkt_right)
+                # A '\r' write flushes stdout; report progress once a second and
+                # on the last command, so short runs still show it
+                if (i + 1) % PROGRESS_EVERY == 0 or i + 1 == num_commands:
+                    print(f"   Sending speed command {i+1}/{num_commands}...", end='\r')
 
             if not dry_run:
-                time.sleep(COMMAND_INTERVAL_MS / 1000.0)
+                next_tick += interval_s
+                delay = next_tick - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
 
         print(f"   Sent {num_commands} speed commands                    ")
 
@@ -167,6 +193,9 @@ def run_remote_test(left_conn, right_conn, speed=SPEED_SLOW, left_speed=None, ri
 
         raise
 
+    finally:
+        pool.shutdown(wait=False)
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -5,6 +5,10 @@ M25 Protocol Layer - The boring but essential bits.
 CRC-16, byte stuffing, frame markers. Nothing fancy, but it works.
 """
 
+import re
+import sys
+from array import array
+
 HEADER_MARKER = 0xEF          # All packets start with this. How original.
 HEADER_SIZE = 3
 MAX_FRAME_LENGTH = 293
@@ -18,8 +22,8 @@ DEFAULT_USB_KEY = bytes([
     65, 108, 98, 101, 114, 95, 77, 50, 53, 95, 101, 109, 111, 116, 105, 111
 ])
 
-# CRC-16 Lookup Table
-CRC_TABLE = [
+# CRC-16 Lookup Table (immutable; calculate_crc binds it as a local)
+CRC_TABLE = (
     0, 49345, 49537, 320, 49921, 960, 640, 49729, 50689, 1728, 1920, 51009, 1280, 50625, 50305, 1088,
     52225, 3264, 3456, 52545, 3840, 53185, 52865, 3648, 2560, 51905, 52097, 2880, 51457, 2496, 2176, 51265,
     55297, 6336, 6528, 55617, 6912, 56257, 55937, 6720, 7680, 57025, 57217, 8000, 56577, 7616, 7296, 56385,
@@ -36,49 +40,112 @@ CRC_TABLE = [
     39937, 23744, 23936, 40257, 24320, 40897, 40577, 24128, 23040, 39617, 39809, 23360, 39169, 22976, 22656, 38977,
     34817, 18624, 18816, 35137, 19200, 35777, 35457, 19008, 19968, 36545, 36737, 20288, 36097, 19904, 19584, 35905,
     17408, 33985, 34177, 17728, 34561, 18368, 18048, 34369, 33281, 17088, 17280, 33601, 16640, 33217, 32897, 16448
-]
+)
+
+
+# Second table for the two-bytes-per-step CRC below: the CRC_TABLE entry
+# for byte i, pushed through one more zero byte.
+_CRC_T0 = CRC_TABLE
+_CRC_T1 = tuple((c >> 8) ^ _CRC_T0[c & 0xFF] for c in _CRC_T0)
+
 
+def calculate_crc(data, length, crc=0xFFFF):
+    """Calculate CRC-16 checksum.
 
-def calculate_crc(data, length):
-    """Calculate CRC-16 checksum."""
-    crc = 0xFFFF
-    for i in range(length):
-        crc = (crc >> 8) ^ CRC_TABLE[(crc ^ data[i]) & 0xFF]
-    return crc & 0xFFFF
+    Slice-by-2: the frame is read as little-endian 16-bit words, each folded
+    in with two table lookups, which halves the interpreter loop count.
+    Pass a previous result as crc to continue it: CRC(A + B) equals
+    calculate_crc(B, len(B), calculate_crc(A, len(A))).
+    """
+    try:
+        view = memoryview(data)[:length]
+    except TypeError:  # plain sequences of ints
+        view = memoryview(bytes(data[:length]))
+    n = len(view)
+    words = array("H")
+    words.frombytes(view[:n & ~1])
+    if sys.byteorder == "big":
+        words.byteswap()
+    t0, t1 = _CRC_T0, _CRC_T1
+    for word in words:
+        v = crc ^ word
+        crc = t1[v & 0xFF] ^ t0[v >> 8]
+    if n & 1:
+        crc = (crc >> 8) ^ t0[(crc ^ view[n - 1]) & 0xFF]
+    return crc
+
+
+_MARKER = bytes([HEADER_MARKER])
+_MARKER_STUFFED = _MARKER * 2
+# A stuffed pair, or a stray lone marker, anywhere but the first byte;
+# group 1 is what survives
+_UNSTUFF = re.compile(rb"(?!\A)" + re.escape(_MARKER) + rb"(" + re.escape(_MARKER) + rb"?)")
 
 
 def add_delimiters(buff):
     """Add byte stuffing (double 0xEF bytes except first)."""
     if len(buff) == 0:
         return buff
-    output = bytearray([buff[0]])
-    for byte in buff[1:]:
-        output.append(byte)
-        if byte == HEADER_MARKER:
-            output.append(HEADER_MARKER)
-    return bytes(output)
+    buff = bytes(buff)
+    if buff.find(_MARKER, 1) < 0:
+        return buff
+    return buff[:1] + buff[1:].replace(_MARKER, _MARKER_STUFFED)
 
 
 def remove_delimiters(buff, prot_max_length=MAX_FRAME_LENGTH):
-    """Remove byte stuffing. Returns None on failure."""
+    """Remove byte stuffing. Returns None on failure.
+
+    After the first byte each 0xEF 0xEF pair collapses to one 0xEF and a lone
+    0xEF is dropped; the regex does that in one C-level pass.
+    """
     if len(buff) > prot_max_length * 2:
         return None
 
-    output = bytearray(len(buff))
+    buff = bytes(buff)
+    if buff.find(_MARKER, 1) < 0:
+        return buff
+    return _UNSTUFF.sub(rb"\1", buff)
+
+
+# Frame start: marker, a length high byte that can be valid (0x00/0x01 for
+# lengths up to MAX_FRAME_LENGTH), and the low byte, which may be stuffed
+_FRAME_HEAD = re.compile(
+    re.escape(_MARKER) + rb"([\x00\x01])(" + re.escape(_MARKER_STUFFED) + rb"|[^" + re.escape(_MARKER) + rb"])"
+)
+
+
+def split_frames(buff):
+    """Split a stuffed byte stream into whole frames. Returns (frames, remainder).
+
+    Frames are returned still stuffed, ready for the decryptor. The remainder is
+    an incomplete trailing frame to prepend to the next read; bytes before a
+    marker, and markers with an impossible length, are skipped. Frame starts
+    are found by one compiled regex search per frame.
+    """
+    buff = bytes(buff)
+    frames = []
+    search = _FRAME_HEAD.search
     pos = 0
-    flag = True
-
-    for byte in buff:
-        if byte == HEADER_MARKER:
-            if flag:
-                output[pos] = byte
-                pos += 1
-                flag = False
-            else:
-                flag = True
-        else:
-            output[pos] = byte
-            pos += 1
-            flag = False
-
-    return bytes(output[:pos])
+    while True:
+        match = search(buff, pos)
+        if match is None:
+            # A header still in flight is at most the last 3 bytes
+            start = buff.find(_MARKER, max(pos, len(buff) - HEADER_SIZE))
+            return frames, buff[start:] if start >= 0 else b''
+        start = match.start()
+        frame_length = (match.group(1)[0] << 8) | match.group(2)[0]
+        if not HEADER_SIZE <= frame_length <= MAX_FRAME_LENGTH:
+            pos = start + 1
+            continue
+        need = frame_length + 1
+        end = match.end() + need - HEADER_SIZE
+        while True:
+            if end > len(buff):
+                return frames, buff[start:]
+            # Each stuffed pair (or a pair cut in half at end) leaves us short
+            missing = need - len(remove_delimiters(buff[start:end], need))
+            if missing <= 0:
+                break
+            end += missing
+        frames.append(buff[start:end])
+        pos = end
@@ -8,6 +8,17 @@ Lovingly documented so you don't have to guess what 0x50 means at 3am.
 39C3: "Your Wheelchair Can Do WHAT?!"
 """
 
+import struct
+import sys
+from collections import namedtuple
+from enum import IntEnum, unique
+
+
+def _intern_names(names):
+    """Intern name strings so equality checks at call sites hit the identity fast path."""
+    return {key: sys.intern(name) for key, name in names.items()}
+
+
 # Decrypted SPP packet structure (output from m25_decrypt.py --scope data)
 POS_PROTOCOL_ID = 0    # Protocol version/type (0x01 = STANDARD)
 POS_TELEGRAM_ID = 1    # Sequence number / packet counter
@@ -19,54 +30,52 @@ POS_PAYLOAD = 6        # Start of payload data (variable length)
 
 MIN_SPP_PACKET_SIZE = 6  # Minimum: PROT + TEL + SRC + DEST + SRV + PARAM
 
+# All six header bytes in one C call: (protocol, telegram, source, dest, service, param)
+HEADER_STRUCT = struct.Struct('>6B')
+
 # Protocol IDs
 PROTOCOL_ID_NOT_USED = 0x00
 PROTOCOL_ID_STANDARD = 0x01  # Standard M25 protocol mode
-
-# Device IDs
-SRC_ID_M25_WHEEL_COMMON = 1
-SRC_ID_M25_WHEEL_LEFT = 2
-SRC_ID_M25_WHEEL_RIGHT = 3
-SRC_ID_ECS = 4
-SRC_ID_SMARTPHONE = 5
-SRC_ID_UNISERVICE = 6
-SRC_ID_PROD_TEST = 7
-SRC_ID_DEBUG_APP = 15
-
-# Human-readable source name mapping
-SOURCE_NAMES = {
-    1: "M25_WHEEL_COMMON",
-    2: "M25_WHEEL_LEFT",
-    3: "M25_WHEEL_RIGHT",
-    4: "ECS",
-    5: "SMARTPHONE",
-    6: "UNISERVICE",
-    7: "PROD_TEST",
-    15: "DEBUG_APP"
-}
-
-# Device IDs
-DEST_ID_M25_WHEEL_COMMON = 1
-DEST_ID_M25_WHEEL_LEFT = 2
-DEST_ID_M25_WHEEL_RIGHT = 3
-DEST_ID_ECS = 4
-DEST_ID_SMARTPHONE = 5
-DEST_ID_UNISERVICE = 6
-DEST_ID_PROD_TEST = 7
-DEST_ID_BROADCAST = 15
-DEST_ID_DEBUG_APP = 15  # Same as BROADCAST
-
-# Human-readable destination name mapping
-DEST_NAMES = {
-    1: "M25_WHEEL_COMMON",
-    2: "M25_WHEEL_LEFT",
-    3: "M25_WHEEL_RIGHT",
-    4: "ECS",
-    5: "SMARTPHONE",
-    6: "UNISERVICE",
-    7: "PROD_TEST",
-    15: "BROADCAST/DEBUG_APP"
-}
+_VALID_PROTOCOL_MASK = (1 << PROTOCOL_ID_NOT_USED) | (1 << PROTOCOL_ID_STANDARD)
+
+
+# Device IDs - one numbering for both source and destination
+@unique
+class DeviceID(IntEnum):
+    M25_WHEEL_COMMON = 1
+    M25_WHEEL_LEFT = 2
+    M25_WHEEL_RIGHT = 3
+    ECS = 4
+    SMARTPHONE = 5
+    UNISERVICE = 6
+    PROD_TEST = 7
+    DEBUG_APP = 15  # Also BROADCAST as a destination
+
+
+SRC_ID_M25_WHEEL_COMMON = DEST_ID_M25_WHEEL_COMMON = DeviceID.M25_WHEEL_COMMON.value
+SRC_ID_M25_WHEEL_LEFT = DEST_ID_M25_WHEEL_LEFT = DeviceID.M25_WHEEL_LEFT.value
+SRC_ID_M25_WHEEL_RIGHT = DEST_ID_M25_WHEEL_RIGHT = DeviceID.M25_WHEEL_RIGHT.value
+SRC_ID_ECS = DEST_ID_ECS = DeviceID.ECS.value
+SRC_ID_SMARTPHONE = DEST_ID_SMARTPHONE = DeviceID.SMARTPHONE.value
+SRC_ID_UNISERVICE = DEST_ID_UNISERVICE = DeviceID.UNISERVICE.value
+SRC_ID_PROD_TEST = DEST_ID_PROD_TEST = DeviceID.PROD_TEST.value
+SRC_ID_DEBUG_APP = DEST_ID_DEBUG_APP = DeviceID.DEBUG_APP.value
+DEST_ID_BROADCAST = DeviceID.DEBUG_APP.value  # Same as DEBUG_APP
+
+# Human-readable device names; as a destination 15 is labelled with both roles
+SOURCE_NAMES = _intern_names({device.value: device.name for device in DeviceID})
+DEST_NAMES = _intern_names({**SOURCE_NAMES, DEST_ID_BROADCAST: "BROADCAST/DEBUG_APP"})
+
+# Fallback names for every byte value, formatted once at import
+_HEX2 = tuple(format(i, '02X') for i in range(256))
+_UNKNOWN_SRC = tuple(sys.intern("UNKNOWN_SRC_0x" + h) for h in _HEX2)
+_UNKNOWN_DEST = tuple(sys.intern("UNKNOWN_DEST_0x" + h) for h in _HEX2)
+_UNKNOWN_SRV = tuple(sys.intern("UNKNOWN_SRV_0x" + h) for h in _HEX2)
+_UNKNOWN_PARAM = tuple(sys.intern("PARAM_0x" + h) for h in _HEX2)
+
+# Index these by ID byte instead of hashing into the dicts above
+_SOURCE_TABLE = tuple(SOURCE_NAMES.get(i, _UNKNOWN_SRC[i]) for i in range(256))
+_DEST_TABLE = tuple(DEST_NAMES.get(i, _UNKNOWN_DEST[i]) for i in range(256))
 
 # Service IDs
 SERVICE_ID_ARBITRATION = 0
@@ -89,28 +98,34 @@ SERVICE_ID_KEY_MGMT = 24
 SERVICE_ID_DEBUG_MANAGEMENT = 125
 SERVICE_ID_GENERAL_ERROR_MGMT = 127
 
-# Human-readable service name mapping
-SERVICE_NAMES = {
-    0: "ARBITRATION",
-    1: "APP_MGMT",
-    2: "ACTOR_BUZZER",
-    3: "ACTOR_LEDS",
-    4: "ACTOR_MOTOR",
-    5: "ECS_DISPLAY",
-    6: "ACTOR_PUSH_RIM_SENSOR",
-    7: "ACTOR_ROTOR_POS_SENSOR",
-    8: "BATT_MGMT",
-    9: "MEMORY_MGMT",
-    10: "VERSION_MGMT",
-    11: "STATS",
-    12: "SPECIAL_MODE_MGMT",
-    14: "RTC",
-    16: "BT_INFO",
-    20: "SYS_ERROR_MGMT",
-    24: "KEY_MGMT",
-    125: "DEBUG_MANAGEMENT",
-    127: "GENERAL_ERROR_MGMT"
-}
+
+# Service IDs as an enum; member names double as the human-readable names
+@unique
+class ServiceID(IntEnum):
+    ARBITRATION = SERVICE_ID_ARBITRATION
+    APP_MGMT = SERVICE_ID_APP_MGMT
+    ACTOR_BUZZER = SERVICE_ID_ACTOR_BUZZER
+    ACTOR_LEDS = SERVICE_ID_ACTOR_LEDS
+    ACTOR_MOTOR = SERVICE_ID_ACTOR_MOTOR
+    ECS_DISPLAY = SERVICE_ID_ECS_DISPLAY
+    ACTOR_PUSH_RIM_SENSOR = SERVICE_ID_ACTOR_PUSH_RIM_SENSOR
+    ACTOR_ROTOR_POS_SENSOR = SERVICE_ID_ACTOR_ROTOR_POS_SENSOR
+    BATT_MGMT = SERVICE_ID_BATT_MGMT
+    MEMORY_MGMT = SERVICE_ID_MEMORY_MGMT
+    VERSION_MGMT = SERVICE_ID_VERSION_MGMT
+    STATS = SERVICE_ID_STATS
+    SPECIAL_MODE_MGMT = SERVICE_ID_SPECIAL_MODE_MGMT
+    RTC = SERVICE_ID_RTC
+    BT_INFO = SERVICE_ID_BT_INFO
+    SYS_ERROR_MGMT = SERVICE_ID_SYS_ERROR_MGMT
+    KEY_MGMT = SERVICE_ID_KEY_MGMT
+    DEBUG_MANAGEMENT = SERVICE_ID_DEBUG_MANAGEMENT
+    GENERAL_ERROR_MGMT = SERVICE_ID_GENERAL_ERROR_MGMT
+
+
+SERVICE_NAMES = _intern_names({service.value: service.name for service in ServiceID})
+
+_SERVICE_TABLE = tuple(SERVICE_NAMES.get(i, _UNKNOWN_SRV[i]) for i in range(256))
 
 # Parameter IDs - ACK/NACK
 PARAM_ID_ACK = 0xFF
@@ -399,6 +414,40 @@ PARAM_NAMES_BY_SERVICE = {
     # Service ID 125: DEBUG_MANAGEMENT - Parameters moved to APP_MGMT (Service ID 1)
     # (AUTO_SHUTOFF_TIME and TRIGGER_SW_RESET belong to APP_MGMT per Android source)
 }
+PARAM_NAMES_BY_SERVICE = {svc: _intern_names(names) for svc, names in PARAM_NAMES_BY_SERVICE.items()}
+
+# Dense [service_id][param_id] table (service IDs are <= 127) with the
+# fallbacks baked in. ACK (0xFF) wins in every service. Services with no
+# named params share one row. Built on the first get_param_name call, as
+# most importers only want the constants.
+_NO_PARAMS = _UNKNOWN_PARAM[:PARAM_ID_ACK] + ("ACK",)
+_param_table = None
+
+
+def _check_name_tables():
+    """Catch table typos at import; skipped entirely under python -O."""
+    for names in (SOURCE_NAMES, DEST_NAMES, SERVICE_NAMES):
+        assert all(0 <= key < 256 for key in names), "name table keys must be bytes"
+    for service_id, names in PARAM_NAMES_BY_SERVICE.items():
+        # The dense param table only has rows for service IDs 0..127
+        assert service_id in SERVICE_NAMES and service_id < 128, f"bad service ID {service_id}"
+        assert all(0 <= param_id < 256 and param_id != PARAM_ID_ACK for param_id in names), \
+            f"bad param ID in service {service_id}"
+
+
+if __debug__:
+    _check_name_tables()
+
+
+def _get_param_table():
+    global _param_table
+    if _param_table is None:
+        _param_table = tuple(
+            tuple(names.get(pid, _UNKNOWN_PARAM[pid]) if pid != PARAM_ID_ACK else "ACK" for pid in range(256))
+            if (names := PARAM_NAMES_BY_SERVICE.get(svc)) else _NO_PARAMS
+            for svc in range(128)
+        )
+    return _param_table
 
 
 def get_source_name(source_id):
@@ -411,7 +460,9 @@ def get_source_name(source_id):
     Returns:
         str: Device name or "UNKNOWN_SRC_0xXX"
     """
-    return SOURCE_NAMES.get(source_id, f"UNKNOWN_SRC_0x{source_id:02X}")
+    if 0 <= source_id < 256:
+        return _SOURCE_TABLE[source_id]
+    return f"UNKNOWN_SRC_0x{source_id:02X}"
 
 
 def get_dest_name(dest_id):
@@ -424,7 +475,9 @@ def get_dest_name(dest_id):
     Returns:
         str: Device name or "UNKNOWN_DEST_0xXX"
     """
-    return DEST_NAMES.get(dest_id, f"UNKNOWN_DEST_0x{dest_id:02X}")
+    if 0 <= dest_id < 256:
+        return _DEST_TABLE[dest_id]
+    return f"UNKNOWN_DEST_0x{dest_id:02X}"
 
 
 def get_service_name(service_id):
@@ -437,7 +490,16 @@ def get_service_name(service_id):
     Returns:
         str: Service name or "UNKNOWN_SRV_0xXX"
     """
-    return SERVICE_NAMES.get(service_id, f"UNKNOWN_SRV_0x{service_id:02X}")
+    if 0 <= service_id < 256:
+        return _SERVICE_TABLE[service_id]
+    return f"UNKNOWN_SRV_0x{service_id:02X}"
+
+
+# Frame-free variants for decoders whose IDs come straight from packet
+# bytes (0..255 only; anything else raises IndexError or wraps)
+source_name_of_byte = _SOURCE_TABLE.__getitem__
+dest_name_of_byte = _DEST_TABLE.__getitem__
+service_name_of_byte = _SERVICE_TABLE.__getitem__
 
 
 def get_param_name(service_id, param_id):
@@ -451,16 +513,24 @@ def get_param_name(service_id, param_id):
     Returns:
         str: Parameter name or "PARAM_0xXX"
     """
-    if param_id == PARAM_ID_ACK:
-        return "ACK"
+    if 0 <= param_id < 256:
+        if 0 <= service_id < 128:
+            return (_param_table or _get_param_table())[service_id][param_id]
+        return _NO_PARAMS[param_id]
+    return f"PARAM_0x{param_id:02X}"
 
-    if service_id in PARAM_NAMES_BY_SERVICE:
-        return PARAM_NAMES_BY_SERVICE[service_id].get(
-            param_id,
-            f"PARAM_0x{param_id:02X}"
-        )
 
-    return f"PARAM_0x{param_id:02X}"
+def parse_header(packet):
+    """
+    Unpack the six SPP header bytes
+
+    Args:
+        packet (bytes): Decrypted SPP packet, at least MIN_SPP_PACKET_SIZE long
+
+    Returns:
+        tuple: (protocol_id, telegram_id, source_id, dest_id, service_id, param_id)
+    """
+    return HEADER_STRUCT.unpack_from(packet)
 
 
 def is_valid_protocol_id(protocol_id):
@@ -473,10 +543,31 @@ def is_valid_protocol_id(protocol_id):
     Returns:
         bool: True if valid M25 protocol ID
     """
-    return protocol_id in [PROTOCOL_ID_NOT_USED, PROTOCOL_ID_STANDARD]
+    return 0 <= protocol_id < 64 and (_VALID_PROTOCOL_MASK >> protocol_id) & 1 == 1
 
 
 # Payload Structures
+#
+# Each PAYLOAD_* is a Schema: size, Field tuples, and the precompiled
+# big-endian struct layout and field names derived from those fields.
+Schema = namedtuple('Schema', 'size fields struct names')
+Field = namedtuple('Field', 'offset size name type desc')
+
+_FIELD_CODES = {'uint8': 'B', 'int8': 'b', 'uint16_be': 'H', 'uint32_be': 'I', 'char': 'c'}
+
+
+def _schema(size, fields):
+    fields = tuple(Field(*field) for field in fields)
+    layout = struct.Struct('>' + ''.join(_FIELD_CODES[field.type] for field in fields))
+    if __debug__:
+        offset = 0
+        for field in fields:
+            assert field.offset == offset, f"{field.name}: expected offset {offset}"
+            assert field.size == struct.calcsize('>' + _FIELD_CODES[field.type]), f"{field.name}: size mismatch"
+            offset += field.size
+        assert layout.size == size, f"layout is {layout.size} bytes, schema says {size}"
+    return Schema(size, fields, layout, tuple(field.name for field in fields))
+
 
 # STATUS_DRIVE_PROFILE_PARAMS (0x52) - 10 bytes
 # Service: APP_MGMT (1), Response to READ_DRIVE_PROFILE_PARAMS (0x51)
@@ -493,19 +584,16 @@ def is_valid_protocol_id(protocol_id):
 #   Byte 9:    slope_dec         - Slope decrease (valid: 70,56,42,28,20)
 #
 # Note: Assist level is determined by state machine context, not in payload
-PAYLOAD_DRIVE_PROFILE_PARAMS = {
-    'size': 10,
-    'fields': [
-        (0, 1, 'max_torque', 'uint8', '% motor support (10-100)'),
-        (1, 2, 'max_speed', 'uint16_be', 'mm/s (*0.0036 for km/h)'),
-        (3, 2, 'p_factor', 'uint16_be', 'P-factor (1-999)'),
-        (5, 1, 'speed_bias', 'uint8', 'Speed bias (10,20,30,40,50)'),
-        (6, 1, 'speed_factor', 'uint8', 'Speed factor (1-100)'),
-        (7, 1, 'rotation_thres', 'uint8', 'Rotation threshold (1-150)'),
-        (8, 1, 'slope_inc', 'uint8', 'Slope increase (70,56,42,28,20)'),
-        (9, 1, 'slope_dec', 'uint8', 'Slope decrease (70,56,42,28,20)'),
-    ]
-}
+PAYLOAD_DRIVE_PROFILE_PARAMS = _schema(10, (
+    (0, 1, 'max_torque', 'uint8', '% motor support (10-100)'),
+    (1, 2, 'max_speed', 'uint16_be', 'mm/s (*0.0036 for km/h)'),
+    (3, 2, 'p_factor', 'uint16_be', 'P-factor (1-999)'),
+    (5, 1, 'speed_bias', 'uint8', 'Speed bias (10,20,30,40,50)'),
+    (6, 1, 'speed_factor', 'uint8', 'Speed factor (1-100)'),
+    (7, 1, 'rotation_thres', 'uint8', 'Rotation threshold (1-150)'),
+    (8, 1, 'slope_inc', 'uint8', 'Slope increase (70,56,42,28,20)'),
+    (9, 1, 'slope_dec', 'uint8', 'Slope decrease (70,56,42,28,20)'),
+))
 
 # CRUISE_VALUES (0xD2) - 13 bytes (optionally 14 with error byte)
 # Service: APP_MGMT (1), Response to READ_CRUISE_VALUES (0xD1)
@@ -518,18 +606,15 @@ PAYLOAD_DRIVE_PROFILE_PARAMS = {
 #   Bytes 9-10: push_counter     - Big-endian short (rim push count since startup)
 #   Byte 11:   wheel_error       - Error code (0 = no error)
 #   Byte 12:   (optional) extended data if packet length == 22
-PAYLOAD_CRUISE_VALUES = {
-    'size': 12,  # minimum, can be 13 with extended data
-    'fields': [
-        (0, 1, 'drive_mode', 'uint8', 'Flags: bit0=auto_hold, bit1=cruise, bit2=remote'),
-        (1, 1, 'push_rim_value', 'int8', 'Push rim sensor deflection'),
-        (2, 2, 'current_speed', 'uint16_be', '0.001 km/h units'),
-        (4, 1, 'soc', 'uint8', 'State of charge %'),
-        (5, 4, 'overall_distance', 'uint32_be', '0.01 meter units'),
-        (9, 2, 'push_counter', 'uint16_be', 'Push rim deflection count'),
-        (11, 1, 'wheel_error', 'uint8', 'Error code (0=none)'),
-    ]
-}
+PAYLOAD_CRUISE_VALUES = _schema(12, (  # size is the minimum, can be 13 with extended data
+    (0, 1, 'drive_mode', 'uint8', 'Flags: bit0=auto_hold, bit1=cruise, bit2=remote'),
+    (1, 1, 'push_rim_value', 'int8', 'Push rim sensor deflection'),
+    (2, 2, 'current_speed', 'uint16_be', '0.001 km/h units'),
+    (4, 1, 'soc', 'uint8', 'State of charge %'),
+    (5, 4, 'overall_distance', 'uint32_be', '0.01 meter units'),
+    (9, 2, 'push_counter', 'uint16_be', 'Push rim deflection count'),
+    (11, 1, 'wheel_error', 'uint8', 'Error code (0=none)'),
+))
 
 # STATUS_RTC_TIME (0x12) - 6 bytes
 # Service: RTC (14), Response to READ_RTC_TIME (0x11)
@@ -539,16 +624,13 @@ PAYLOAD_CRUISE_VALUES = {
 #   Byte 3:    day     - 1-31
 #   Byte 4:    hour    - 0-23
 #   Byte 5:    minute  - 0-59
-PAYLOAD_RTC_TIME = {
-    'size': 6,
-    'fields': [
-        (0, 2, 'year', 'uint16_be', 'Year (e.g., 2025)'),
-        (2, 1, 'month', 'uint8', 'Month 1-12'),
-        (3, 1, 'day', 'uint8', 'Day 1-31'),
-        (4, 1, 'hour', 'uint8', 'Hour 0-23'),
-        (5, 1, 'minute', 'uint8', 'Minute 0-59'),
-    ]
-}
+PAYLOAD_RTC_TIME = _schema(6, (
+    (0, 2, 'year', 'uint16_be', 'Year (e.g., 2025)'),
+    (2, 1, 'month', 'uint8', 'Month 1-12'),
+    (3, 1, 'day', 'uint8', 'Day 1-31'),
+    (4, 1, 'hour', 'uint8', 'Hour 0-23'),
+    (5, 1, 'minute', 'uint8', 'Minute 0-59'),
+))
 
 # STATUS_SW_VERSION (0x22) - 4 bytes
 # Service: VERSION_MGMT (10), Response to READ_SW_VERSION (0x21)
@@ -559,24 +641,18 @@ PAYLOAD_RTC_TIME = {
 #   Byte 3: test_version  - Test/patch version (3 digits)
 #
 # Example: 0x56030500 = "V03.005.000"
-PAYLOAD_SW_VERSION = {
-    'size': 4,
-    'fields': [
-        (0, 1, 'dev_state', 'char', 'Development state (V=release)'),
-        (1, 1, 'version', 'uint8', 'Major version'),
-        (2, 1, 'revision', 'uint8', 'Minor/revision'),
-        (3, 1, 'test_version', 'uint8', 'Test/patch version'),
-    ]
-}
+PAYLOAD_SW_VERSION = _schema(4, (
+    (0, 1, 'dev_state', 'char', 'Development state (V=release)'),
+    (1, 1, 'version', 'uint8', 'Major version'),
+    (2, 1, 'revision', 'uint8', 'Minor/revision'),
+    (3, 1, 'test_version', 'uint8', 'Test/patch version'),
+))
 
 # STATUS_HW_VERSION (0x42) - 1 byte
 # Service: VERSION_MGMT (10), Response to READ_HW_VERSION (0x41)
-PAYLOAD_HW_VERSION = {
-    'size': 1,
-    'fields': [
-        (0, 1, 'hw_version', 'uint8', 'Hardware version number'),
-    ]
-}
+PAYLOAD_HW_VERSION = _schema(1, (
+    (0, 1, 'hw_version', 'uint8', 'Hardware version number'),
+))
 
 # STATUS_DISCHARGE (0x22) - 4 bytes
 # Service: BATT_MGMT (8), Response to READ_DISCHARGE_STATE (0x21)
@@ -585,14 +661,11 @@ PAYLOAD_HW_VERSION = {
 #   Byte 0:    current_soc       - Current state of charge %
 #   Byte 1:    target_soc        - Target discharge SOC %
 #   Bytes 2-3: remaining_seconds - Big-endian short (remaining discharge time)
-PAYLOAD_DISCHARGE_STATE = {
-    'size': 4,
-    'fields': [
-        (0, 1, 'current_soc', 'uint8', 'Current SOC %'),
-        (1, 1, 'target_soc', 'uint8', 'Target discharge SOC %'),
-        (2, 2, 'remaining_seconds', 'uint16_be', 'Remaining discharge time (seconds)'),
-    ]
-}
+PAYLOAD_DISCHARGE_STATE = _schema(4, (
+    (0, 1, 'current_soc', 'uint8', 'Current SOC %'),
+    (1, 1, 'target_soc', 'uint8', 'Target discharge SOC %'),
+    (2, 2, 'remaining_seconds', 'uint16_be', 'Remaining discharge time (seconds)'),
+))
 
 # STATUS_BMS_STATE (0x72) - 2+ bytes
 # Service: BATT_MGMT (8), Response to READ_BMS_STATE (0x71)
@@ -600,13 +673,10 @@ PAYLOAD_DISCHARGE_STATE = {
 # Byte layout:
 #   Byte 0: unknown (possibly flags)
 #   Byte 1: is_charging - 0=not charging, non-zero=charging
-PAYLOAD_BMS_STATE = {
-    'size': 2,
-    'fields': [
-        (0, 1, 'flags', 'uint8', 'BMS status flags'),
-        (1, 1, 'is_charging', 'uint8', '0=not charging, 1=charging'),
-    ]
-}
+PAYLOAD_BMS_STATE = _schema(2, (
+    (0, 1, 'flags', 'uint8', 'BMS status flags'),
+    (1, 1, 'is_charging', 'uint8', '0=not charging, 1=charging'),
+))
 
 # STATUS_DUO_DRIVE_PARAMS (0xF2) - 3 bytes
 # Service: APP_MGMT (1), Response to READ_DUO_DRIVE_PARAMS (0xF1)
@@ -615,39 +685,136 @@ PAYLOAD_BMS_STATE = {
 #   Byte 0: mounting_side    - 0=UNKNOWN, 1=RIGHT, 2=LEFT
 #   Byte 1: speed_sensibility - Speed sensitivity setting
 #   Byte 2: steering_dynamic - Steering dynamic enum
-PAYLOAD_DUO_DRIVE_PARAMS = {
-    'size': 3,
-    'fields': [
-        (0, 1, 'mounting_side', 'uint8', '0=UNKNOWN, 1=RIGHT, 2=LEFT'),
-        (1, 1, 'speed_sensibility', 'uint8', 'Speed sensitivity'),
-        (2, 1, 'steering_dynamic', 'uint8', 'Steering dynamic enum'),
-    ]
-}
+PAYLOAD_DUO_DRIVE_PARAMS = _schema(3, (
+    (0, 1, 'mounting_side', 'uint8', '0=UNKNOWN, 1=RIGHT, 2=LEFT'),
+    (1, 1, 'speed_sensibility', 'uint8', 'Speed sensitivity'),
+    (2, 1, 'steering_dynamic', 'uint8', 'Steering dynamic enum'),
+))
 
 # STATUS_AUTO_SHUTOFF_TIME (0x82) - 2 bytes
 # Service: APP_MGMT (1), Response to READ_AUTO_SHUTOFF_TIME (0x81)
 #
 # Byte layout:
 #   Bytes 0-1: shutoff_time - Big-endian short (seconds, default 3600)
-PAYLOAD_AUTO_SHUTOFF_TIME = {
-    'size': 2,
-    'fields': [
-        (0, 2, 'shutoff_time', 'uint16_be', 'Auto shutoff time in seconds'),
-    ]
-}
+PAYLOAD_AUTO_SHUTOFF_TIME = _schema(2, (
+    (0, 2, 'shutoff_time', 'uint16_be', 'Auto shutoff time in seconds'),
+))
 
 # STATUS_LED_STATE (0x12) - 1 byte
 # Service: ACTOR_LEDS (3), Response to READ_LED_STATE (0x11)
 #
 # Byte layout:
 #   Byte 0: led_state - bit0=LEDs while charging, bit1=LEDs normal operation
-PAYLOAD_LED_STATE = {
-    'size': 1,
-    'fields': [
-        (0, 1, 'led_state', 'uint8', 'bit0=charging LEDs, bit1=normal LEDs'),
-    ]
+PAYLOAD_LED_STATE = _schema(1, (
+    (0, 1, 'led_state', 'uint8', 'bit0=charging LEDs, bit1=normal LEDs'),
+))
+
+# Flat aliases for the schema layouts; the _TYPE named tuples give
+# attribute access without a dict per record
+PAYLOAD_DRIVE_PROFILE_PARAMS_STRUCT = PAYLOAD_DRIVE_PROFILE_PARAMS.struct
+PAYLOAD_DRIVE_PROFILE_PARAMS_NAMES = PAYLOAD_DRIVE_PROFILE_PARAMS.names
+PAYLOAD_DRIVE_PROFILE_PARAMS_TYPE = namedtuple('DriveProfileParams', PAYLOAD_DRIVE_PROFILE_PARAMS_NAMES)
+PAYLOAD_CRUISE_VALUES_STRUCT = PAYLOAD_CRUISE_VALUES.struct
+PAYLOAD_CRUISE_VALUES_NAMES = PAYLOAD_CRUISE_VALUES.names
+PAYLOAD_CRUISE_VALUES_TYPE = namedtuple('CruiseValues', PAYLOAD_CRUISE_VALUES_NAMES)
+PAYLOAD_RTC_TIME_STRUCT = PAYLOAD_RTC_TIME.struct
+PAYLOAD_RTC_TIME_NAMES = PAYLOAD_RTC_TIME.names
+PAYLOAD_RTC_TIME_TYPE = namedtuple('RtcTime', PAYLOAD_RTC_TIME_NAMES)
+PAYLOAD_SW_VERSION_STRUCT = PAYLOAD_SW_VERSION.struct
+PAYLOAD_SW_VERSION_NAMES = PAYLOAD_SW_VERSION.names
+PAYLOAD_SW_VERSION_TYPE = namedtuple('SwVersion', PAYLOAD_SW_VERSION_NAMES)
+PAYLOAD_HW_VERSION_STRUCT = PAYLOAD_HW_VERSION.struct
+PAYLOAD_HW_VERSION_NAMES = PAYLOAD_HW_VERSION.names
+PAYLOAD_HW_VERSION_TYPE = namedtuple('HwVersion', PAYLOAD_HW_VERSION_NAMES)
+PAYLOAD_DISCHARGE_STATE_STRUCT = PAYLOAD_DISCHARGE_STATE.struct
+PAYLOAD_DISCHARGE_STATE_NAMES = PAYLOAD_DISCHARGE_STATE.names
+PAYLOAD_DISCHARGE_STATE_TYPE = namedtuple('DischargeState', PAYLOAD_DISCHARGE_STATE_NAMES)
+PAYLOAD_BMS_STATE_STRUCT = PAYLOAD_BMS_STATE.struct
+PAYLOAD_BMS_STATE_NAMES = PAYLOAD_BMS_STATE.names
+PAYLOAD_BMS_STATE_TYPE = namedtuple('BmsState', PAYLOAD_BMS_STATE_NAMES)
+PAYLOAD_DUO_DRIVE_PARAMS_STRUCT = PAYLOAD_DUO_DRIVE_PARAMS.struct
+PAYLOAD_DUO_DRIVE_PARAMS_NAMES = PAYLOAD_DUO_DRIVE_PARAMS.names
+PAYLOAD_DUO_DRIVE_PARAMS_TYPE = namedtuple('DuoDriveParams', PAYLOAD_DUO_DRIVE_PARAMS_NAMES)
+PAYLOAD_AUTO_SHUTOFF_TIME_STRUCT = PAYLOAD_AUTO_SHUTOFF_TIME.struct
+PAYLOAD_AUTO_SHUTOFF_TIME_NAMES = PAYLOAD_AUTO_SHUTOFF_TIME.names
+PAYLOAD_AUTO_SHUTOFF_TIME_TYPE = namedtuple('AutoShutoffTime', PAYLOAD_AUTO_SHUTOFF_TIME_NAMES)
+PAYLOAD_LED_STATE_STRUCT = PAYLOAD_LED_STATE.struct
+PAYLOAD_LED_STATE_NAMES = PAYLOAD_LED_STATE.names
+PAYLOAD_LED_STATE_TYPE = namedtuple('LedState', PAYLOAD_LED_STATE_NAMES)
+
+
+def unpack_payload(schema_struct, names, buf, offset=0):
+    """
+    Decode a fixed-layout payload into a {field_name: value} dict
+
+    Args:
+        schema_struct (struct.Struct): One of the PAYLOAD_*_STRUCT layouts
+        names (tuple): The matching PAYLOAD_*_NAMES
+        buf (bytes): Packet or payload bytes
+        offset (int): Start of the payload within buf
+
+    Returns:
+        dict: Field values keyed by name
+    """
+    return dict(zip(names, schema_struct.unpack_from(buf, offset)))
+
+
+def unpack_record(schema_struct, record_type, buf, offset=0):
+    """
+    Decode a fixed-layout payload into its PAYLOAD_*_TYPE named tuple
+
+    Args:
+        schema_struct (struct.Struct): One of the PAYLOAD_*_STRUCT layouts
+        record_type (type): The matching PAYLOAD_*_TYPE
+        buf (bytes): Packet or payload bytes
+        offset (int): Start of the payload within buf
+
+    Returns:
+        tuple: Record with one attribute per field
+    """
+    return record_type._make(schema_struct.unpack_from(buf, offset))
+
+
+# (service_id, param_id) -> (layout, record type) for every fixed-layout response
+_PAYLOAD_PARSERS = {
+    (SERVICE_ID_APP_MGMT, PARAM_ID_STATUS_DRIVE_PROFILE_PARAMS):
+        (PAYLOAD_DRIVE_PROFILE_PARAMS_STRUCT, PAYLOAD_DRIVE_PROFILE_PARAMS_TYPE),
+    (SERVICE_ID_APP_MGMT, PARAM_ID_CRUISE_VALUES): (PAYLOAD_CRUISE_VALUES_STRUCT, PAYLOAD_CRUISE_VALUES_TYPE),
+    (SERVICE_ID_APP_MGMT, PARAM_ID_STATUS_DUO_DRIVE_PARAMS):
+        (PAYLOAD_DUO_DRIVE_PARAMS_STRUCT, PAYLOAD_DUO_DRIVE_PARAMS_TYPE),
+    (SERVICE_ID_APP_MGMT, PARAM_ID_STATUS_AUTO_SHUTOFF_TIME):
+        (PAYLOAD_AUTO_SHUTOFF_TIME_STRUCT, PAYLOAD_AUTO_SHUTOFF_TIME_TYPE),
+    (SERVICE_ID_ACTOR_LEDS, PARAM_ID_STATUS_LED_STATE): (PAYLOAD_LED_STATE_STRUCT, PAYLOAD_LED_STATE_TYPE),
+    (SERVICE_ID_BATT_MGMT, PARAM_ID_STATUS_DISCHARGE): (PAYLOAD_DISCHARGE_STATE_STRUCT, PAYLOAD_DISCHARGE_STATE_TYPE),
+    (SERVICE_ID_BATT_MGMT, PARAM_ID_STATUS_BMS_STATE): (PAYLOAD_BMS_STATE_STRUCT, PAYLOAD_BMS_STATE_TYPE),
+    (SERVICE_ID_VERSION_MGMT, PARAM_ID_STATUS_SW_VERSION): (PAYLOAD_SW_VERSION_STRUCT, PAYLOAD_SW_VERSION_TYPE),
+    (SERVICE_ID_VERSION_MGMT, PARAM_ID_STATUS_HW_VERSION): (PAYLOAD_HW_VERSION_STRUCT, PAYLOAD_HW_VERSION_TYPE),
+    (SERVICE_ID_RTC, PARAM_ID_STATUS_RTC_TIME): (PAYLOAD_RTC_TIME_STRUCT, PAYLOAD_RTC_TIME_TYPE),
 }
 
+
+def decode_payload(service_id, param_id, buf, offset=0):
+    """
+    Decode a response payload by its (service, param) pair
+
+    Args:
+        service_id (int): Service ID byte
+        param_id (int): Parameter ID byte
+        buf (bytes): Packet or payload bytes
+        offset (int): Start of the payload within buf
+
+    Returns:
+        tuple: PAYLOAD_*_TYPE record, or None if the pair has no fixed
+        layout or buf is too short
+    """
+    parser = _PAYLOAD_PARSERS.get((service_id, param_id))
+    if parser is None:
+        return None
+    layout, record_type = parser
+    if len(buf) - offset < layout.size:
+        return None
+    return record_type._make(layout.unpack_from(buf, offset))
+
 # Intellion-only Service IDs (maintenance tool, not in smartphone app)
 SERVICE_ID_SPECIAL_MODE_PASSWORD = 12  # Same as SPECIAL_MODE_MGMT, password variant
 SERVICE_ID_SPECIAL_MODE = 13           # Different from 12 in Intellion
@@ -713,19 +880,33 @@ PROFILE_ID_SOFT = 3
 PROFILE_ID_ACTIVE = 4
 PROFILE_ID_SENSITIVE_PLUS = 5
 
-PROFILE_NAMES = {
+PROFILE_NAMES = _intern_names({
     PROFILE_ID_CUSTOMIZED: "Customized",
     PROFILE_ID_STANDARD: "Standard",
     PROFILE_ID_SENSITIVE: "Sensitive",
     PROFILE_ID_SOFT: "Soft",
     PROFILE_ID_ACTIVE: "Active",
     PROFILE_ID_SENSITIVE_PLUS: "SensitivePlus"
-}
+})
 
 # Valid max_speed values (mm/s units, multiply by 0.0036 to get km/h)
 # Values correspond to 2.0, 2.5, 3.0, 3.5, 4.0, 4.5, 5.0, 5.5, 6.0, 6.5, 7.0, 7.5, 8.0, 8.5 km/h
 MAX_SPEED_VALUES = [556, 694, 833, 972, 1111, 1250, 1389, 1528, 1667, 1806, 1944, 2083, 2222, 2361]
 MAX_SPEED_VALUES_NO_MPP = [556, 694, 833, 972, 1111, 1250, 1389, 1528, 1667]  # Without M++ (up to 6.0 km/h)
+# O(1) membership checks: `v in MAX_SPEED_VALUES_SET` (too wide for a bitmask)
+MAX_SPEED_VALUES_SET = frozenset(MAX_SPEED_VALUES)
+MAX_SPEED_VALUES_NO_MPP_SET = frozenset(MAX_SPEED_VALUES_NO_MPP)
+# (km/h, display label) per valid max_speed, so labelling needs no math per call
+MAX_SPEED_INFO = {raw: (raw * 0.0036, f"{raw * 0.0036:.1f} km/h") for raw in MAX_SPEED_VALUES}
+
+
+def format_max_speed(raw):
+    """Format a raw max_speed (mm/s) as a km/h label, e.g. "4.0 km/h"."""
+    info = MAX_SPEED_INFO.get(raw)
+    if info is not None:
+        return info[1]
+    return f"{raw * 0.0036:.1f} km/h"
+
 
 # Speed limits (mm/s)
 MAX_SUPPORT_SPEED = 2361     # 8.5 km/h (with M++ license)
@@ -734,20 +915,25 @@ MAX_SPEED_LEARNING = 833     # 3.0 km/h (learning mode)
 
 # Valid slope_inc/slope_dec values
 SLOPE_VALUES = [70, 56, 42, 28, 20]
+# Byte-range check without a scan: `(SLOPE_VALUES_MASK >> v) & 1` for 0 <= v < 256
+SLOPE_VALUES_SET = frozenset(SLOPE_VALUES)
+SLOPE_VALUES_MASK = sum(1 << v for v in SLOPE_VALUES)
 
 # Valid speed_bias values
 SPEED_BIAS_VALUES = [10, 20, 30, 40, 50]
+SPEED_BIAS_VALUES_SET = frozenset(SPEED_BIAS_VALUES)
+SPEED_BIAS_VALUES_MASK = sum(1 << v for v in SPEED_BIAS_VALUES)
 
 # Assist level values
 ASSIST_LEVEL_1 = 0  # Normal / Standard
 ASSIST_LEVEL_2 = 1  # Outdoor
 ASSIST_LEVEL_3 = 2  # Learning mode (Intellion maintenance only)
 
-ASSIST_LEVEL_NAMES = {
+ASSIST_LEVEL_NAMES = _intern_names({
     ASSIST_LEVEL_1: "Normal",
     ASSIST_LEVEL_2: "Outdoor",
     ASSIST_LEVEL_3: "Learning"
-}
+})
 
 # Buzzer state and volume values
 BUZZER_OFF = 0
@@ -888,3 +1074,11 @@ MEMORY_BLOCK_FIRMWARE_SECTOR_E = 135
 MEMORY_BLOCK_FIRMWARE_SECTOR_D = 136
 MEMORY_BLOCK_FIRMWARE_SECTOR_C = 137
 MEMORY_BLOCK_FIRMWARE_SECTOR_B = 138
+
+# Update order, H first; index instead of picking constants by name
+FIRMWARE_SECTORS = (
+    MEMORY_BLOCK_FIRMWARE_SECTOR_H, MEMORY_BLOCK_FIRMWARE_SECTOR_G,
+    MEMORY_BLOCK_FIRMWARE_SECTOR_F, MEMORY_BLOCK_FIRMWARE_SECTOR_E,
+    MEMORY_BLOCK_FIRMWARE_SECTOR_D, MEMORY_BLOCK_FIRMWARE_SECTOR_C,
+    MEMORY_BLOCK_FIRMWARE_SECTOR_B,
+)
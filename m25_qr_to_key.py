@@ -13,12 +13,22 @@ import argparse
 from m25_utils import iter_input_lines, has_input_available
 
 
+def _upk_lut(char_index):
+    """256-entry bytes.translate table: character code -> 6-bit value, 0xFF if invalid."""
+    lut = bytearray(b'\xff' * 256)
+    for char, index in char_index.items():
+        lut[ord(char)] = index
+    return bytes(lut)
+
+
 class M25QRConverter:
     UPK_CHARSET = [
         'A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'J', 'K', 'L', 'M', 'N', 'P', 'Q', 'R', 'S', 'T', 'U', 'V', 'W', 'X', 'Y', 'Z',
         'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 'm', 'n', 'o', 'p', 'q', 'r', 's', 't', 'u', 'v', 'w', 'x', 'y', 'z',
         '1', '2', '3', '4', '5', '6', '7', '8', '9', '+', '#', '@', '&', '?', '/'
     ]
+    UPK_INDEX = {char: index for index, char in enumerate(UPK_CHARSET)}
+    UPK_LUT = _upk_lut(UPK_INDEX)
 
     def convert_qr_to_key(self, qr_code):
         """Convert QR code to 16-byte AES key. Returns None on failure."""
@@ -26,23 +36,22 @@ class M25QRConverter:
             print(f"ERROR: QR code must be 22 characters (got {len(qr_code)})", file=sys.stderr)
             return None
 
-        for char in qr_code:
-            if char not in self.UPK_CHARSET:
-                print(f"ERROR: Invalid character '{char}' in QR code", file=sys.stderr)
-                return None
-
-        binary_string = ""
-        for char in qr_code:
-            index = self.UPK_CHARSET.index(char)
-            binary_string += format(index, '06b')
-
-        binary_key = binary_string[4:132]
-        key_bytes = bytearray()
-        for i in range(0, 128, 8):
-            byte_val = int(binary_key[i:i+8], 2)
-            key_bytes.append(byte_val)
+        # Validate and map every character in one C-level translate pass
+        try:
+            indices = qr_code.encode('latin-1').translate(self.UPK_LUT)
+        except UnicodeEncodeError as e:
+            # A character above U+00FF is invalid, but one before it may be too
+            indices = qr_code[:e.start].encode('latin-1').translate(self.UPK_LUT) + b'\xff'
+        bad = indices.find(0xFF)
+        if bad >= 0:
+            print(f"ERROR: Invalid character '{qr_code[bad]}' in QR code", file=sys.stderr)
+            return None
 
-        return bytes(key_bytes)
+        # 22 six-bit digits = 132 bits; the key is the low 128 (top 4 dropped)
+        acc = 0
+        for index in indices:
+            acc = (acc << 6) | index
+        return (acc & ((1 << 128) - 1)).to_bytes(16, 'big')
 
 
 def process_qr(converter, qr_code, output_file):
@@ -77,9 +86,14 @@ def main():
 
     output_file = open(args.out, 'w') if args.out else sys.stdout
 
+    # Bulk mode: bind lookups once and write directly instead of print()
+    convert = converter.convert_qr_to_key
+    write = output_file.write
     try:
         for line in iter_input_lines(args.input, args.file):
-            process_qr(converter, line, output_file)
+            key = convert(line)
+            if key is not None:
+                write(key.hex() + '\n')
     except FileNotFoundError as e:
         print(f"ERROR: {e}", file=sys.stderr)
         sys.exit(1)
@@ -9,10 +9,11 @@ The future is now.
 import socket
 import struct
 import sys
+import threading
 import time
 
 from m25_protocol import HEADER_MARKER
-from m25_crypto import M25Encryptor, M25Decryptor
+from m25_crypto import get_encryptor, get_decryptor
 from m25_protocol_data import (
     PROTOCOL_ID_STANDARD, SRC_ID_SMARTPHONE, DEST_ID_M25_WHEEL_COMMON,
     SERVICE_ID_APP_MGMT,
@@ -22,9 +23,12 @@ from m25_protocol_data import (
     DEFAULT_TELEGRAM_ID
 )
 
+# Frame length field: big-endian u16 right after the 0xEF marker
+_U16_BE = struct.Struct('>H')
+
 
 def _hex_bytes(data):
-    return " ".join(f"{byte:02X}" for byte in data)
+    return bytes(data).hex(" ").upper()
 
 
 class BluetoothConnection:
@@ -41,8 +45,12 @@ class BluetoothConnection:
         self.debug = debug
         self.log_callback = log_callback
         self.socket = None
-        self.encryptor = M25Encryptor(key)
-        self.decryptor = M25Decryptor(key)
+        self._tx_lock = threading.Lock()
+        self.encryptor = get_encryptor(bytes(key))
+        self.decryptor = get_decryptor(bytes(key))
+        # Reused receive buffer; a stuffed max-size frame is well under 4 KiB
+        self._rx = bytearray(4096)
+        self._rx_view = memoryview(self._rx)
 
     def _trace(self, message):
         if self.log_callback:
@@ -80,40 +88,44 @@ class BluetoothConnection:
             return None
 
         self.socket.settimeout(timeout)
-        buffer = b''
-        start_time = time.time()
+        rx, view = self._rx, self._rx_view
+        size = len(rx)
+        pos = 0
+        now = time.monotonic
+        start_time = now()
 
         try:
-            while True:
-                elapsed = time.time() - start_time
+            while pos < size:
+                elapsed = now() - start_time
                 if elapsed >= timeout:
                     break
 
                 remaining = timeout - elapsed
                 self.socket.settimeout(max(0.1, remaining))
                 try:
-                    chunk = self.socket.recv(1024)
-                    if not chunk:
+                    n = self.socket.recv_into(view[pos:])
+                    if not n:
                         break
-                    buffer += chunk
+                    pos += n
                 except socket.timeout:
-                    if buffer:
+                    if pos:
                         break
                     continue
 
-                if len(buffer) >= 3 and buffer[0] == HEADER_MARKER:
-                    frame_length = (buffer[1] << 8) | buffer[2]
-                    if len(buffer) >= frame_length + 1:
+                if pos >= 3 and rx[0] == HEADER_MARKER:
+                    frame_length = _U16_BE.unpack_from(rx, 1)[0]
+                    if pos >= frame_length + 1:
                         break
 
-            return buffer if buffer else None
+            return bytes(view[:pos]) if pos else None
         except (socket.timeout, Exception):
-            return buffer if buffer else None
+            return bytes(view[:pos]) if pos else None
 
     def transact(self, spp_data, timeout=1.0):
         """Send packet and receive decrypted response."""
-        self.send_packet(spp_data)
-        response = self.receive(timeout)
+        with self._tx_lock:
+            self.send_packet(spp_data)
+            response = self.receive(timeout)
         if response:
             decrypted = self.decryptor.decrypt_packet(response)
             if decrypted:
@@ -125,33 +137,71 @@ class BluetoothConnection:
         return None
 
 
+SPEED_SUFFIX_CACHE_SIZE = 64
+# Protocol ID + telegram ID for every telegram ID, so no header bytes are built per packet
+_TID_PREFIXES = tuple(bytes([PROTOCOL_ID_STANDARD, tid]) for tid in range(256))
+
+
+def _pack_speed(speed):
+    """Encode a remote speed as 16-bit big-endian (negative values wrap)."""
+    return _U16_BE.pack(speed & 0xFFFF if speed < 0 else speed)
+
+
 class PacketBuilder:
     """Build M25 SPP packet payloads."""
 
     def __init__(self, dest_id=DEST_ID_M25_WHEEL_COMMON):
         self.telegram_id = DEFAULT_TELEGRAM_ID
         self.dest_id = dest_id
+        # Builders may be shared by the left/right worker threads
+        self._tid_lock = threading.Lock()
+        # Static header bytes per op; only the telegram ID and payload
+        # differ between requests for the same op.
+        self._header_tails = {}
+        # Whole post-ID suffix for single-byte-payload ops (modes, levels)
+        self._byte_suffixes = {}
+        # Same for WRITE_REMOTE_SPEED, per (dest_id, speed); drive loops repeat a few values
+        self._speed_suffixes = {}
 
     def next_telegram_id(self):
         """Get next telegram ID and increment counter."""
-        tid = self.telegram_id
-        self.telegram_id = (self.telegram_id + 1) & 0xFF
+        with self._tid_lock:
+            tid = self.telegram_id
+            self.telegram_id = (tid + 1) & 0xFF
         return tid
 
     def build_packet(self, service_id, param_id, payload=b''):
         """Build decrypted SPP packet."""
-        return bytes([
-            PROTOCOL_ID_STANDARD,
-            self.next_telegram_id(),
-            SRC_ID_SMARTPHONE,
-            self.dest_id,
-            service_id,
-            param_id
-        ]) + payload
+        key = (self.dest_id, service_id, param_id)
+        tail = self._header_tails.get(key)
+        if tail is None:
+            tail = self._header_tails[key] = bytes([SRC_ID_SMARTPHONE, self.dest_id, service_id, param_id])
+        return _TID_PREFIXES[self.next_telegram_id()] + tail + payload
+
+    def build_byte_packet(self, service_id, param_id, value):
+        """Build a packet with a one-byte payload; all but the telegram ID is cached."""
+        key = (self.dest_id, service_id, param_id, value)
+        suffix = self._byte_suffixes.get(key)
+        if suffix is None:
+            suffix = self._byte_suffixes[key] = bytes([SRC_ID_SMARTPHONE, self.dest_id, service_id, param_id, value])
+        return _TID_PREFIXES[self.next_telegram_id()] + suffix
+
+    def _build_speed_packet(self, speed, make_payload):
+        """Build WRITE_REMOTE_SPEED, caching everything after the telegram ID per speed."""
+        key = (self.dest_id, speed)
+        suffix = self._speed_suffixes.get(key)
+        if suffix is None:
+            payload = make_payload(speed)
+            if len(self._speed_suffixes) >= SPEED_SUFFIX_CACHE_SIZE:
+                self._speed_suffixes.clear()
+            suffix = self._speed_suffixes[key] = bytes([
+                SRC_ID_SMARTPHONE, self.dest_id, SERVICE_ID_APP_MGMT, PARAM_ID_WRITE_REMOTE_SPEED
+            ]) + payload
+        return _TID_PREFIXES[self.next_telegram_id()] + suffix
 
     def build_write_system_mode(self, mode):
         """Build WRITE_SYSTEM_MODE packet (0x01=Connect, 0x02=Standby)."""
-        return self.build_packet(SERVICE_ID_APP_MGMT, PARAM_ID_WRITE_SYSTEM_MODE, bytes([mode]))
+        return self.build_byte_packet(SERVICE_ID_APP_MGMT, PARAM_ID_WRITE_SYSTEM_MODE, mode)
 
     def build_read_system_mode(self):
         """Build READ_SYSTEM_MODE packet."""
@@ -159,7 +209,7 @@ class PacketBuilder:
 
     def build_write_drive_mode(self, mode):
         """Build WRITE_DRIVE_MODE packet."""
-        return self.build_packet(SERVICE_ID_APP_MGMT, PARAM_ID_WRITE_DRIVE_MODE, bytes([mode]))
+        return self.build_byte_packet(SERVICE_ID_APP_MGMT, PARAM_ID_WRITE_DRIVE_MODE, mode)
 
     def build_read_drive_mode(self):
         """Build READ_DRIVE_MODE packet."""
@@ -167,7 +217,4 @@ class PacketBuilder:
 
     def build_write_remote_speed(self, speed):
         """Build WRITE_REMOTE_SPEED packet. Speed: signed 16-bit, positive=forward."""
-        if speed < 0:
-            speed = speed & 0xFFFF
-        payload = struct.pack('>h', speed) if speed < 32768 else struct.pack('>H', speed)
-        return self.build_packet(SERVICE_ID_APP_MGMT, PARAM_ID_WRITE_REMOTE_SPEED, payload)
+        return self._build_speed_packet(speed, _pack_speed)
@@ -5,7 +5,8 @@ M25 Utilities - The unglamorous helper functions that make everything work.
 Hex parsing, key validation, input handling. Not exciting, but essential.
 """
 
-from typing import Optional, Iterator, List
+from functools import lru_cache
+from typing import Optional, Iterable, Iterator, List
 import os
 import sys
 
@@ -23,6 +24,7 @@ def parse_hex_safe(hex_str: str) -> Optional[bytes]:
         return None
 
 
+@lru_cache(maxsize=16)
 def parse_hex_key(key_hex: str, key_length: int = 16) -> bytes:
     """Parse and validate AES key from hex string. Raises ValueError on error."""
     try:
@@ -43,6 +45,20 @@ def parse_key(key_hex: str, name: str = "key") -> bytes:
         sys.exit(1)
 
 
+_stdin_tty = (None, False)
+
+
+def _stdin_is_tty() -> bool:
+    """sys.stdin.isatty(), cached per stdin object so a swapped stream is re-checked."""
+    global _stdin_tty
+    stream, is_tty = _stdin_tty
+    if stream is not sys.stdin:
+        stream = sys.stdin
+        is_tty = stream.isatty()
+        _stdin_tty = (stream, is_tty)
+    return is_tty
+
+
 def iter_input_lines(input_arg: Optional[str] = None,
                      file_arg: Optional[str] = None,
                      stdin: bool = True,
@@ -53,19 +69,17 @@ def iter_input_lines(input_arg: Optional[str] = None,
 
     Priority: file_arg > input_arg (file or value) > stdin
     """
-    def should_yield(line: str) -> bool:
-        if skip_empty and not line:
-            return False
-        if skip_comments and line.startswith('#'):
-            return False
-        return True
+    def filter_lines(lines: Iterable[str]) -> Iterator[str]:
+        # One inlined strip + filter loop; the flags are read as fast closure cells
+        for line in lines:
+            line = line.strip()
+            if (skip_empty and not line) or (skip_comments and line.startswith('#')):
+                continue
+            yield line
 
     def iter_file(filepath: str) -> Iterator[str]:
         with open(filepath, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if should_yield(line):
-                    yield line
+            yield from filter_lines(f)
 
     if file_arg:
         if not os.path.isfile(file_arg):
@@ -77,16 +91,11 @@ def iter_input_lines(input_arg: Optional[str] = None,
         if os.path.isfile(input_arg):
             yield from iter_file(input_arg)
         else:
-            line = input_arg.strip()
-            if should_yield(line):
-                yield line
+            yield from filter_lines((input_arg,))
         return
 
-    if stdin and not sys.stdin.isatty():
-        for line in sys.stdin:
-            line = line.strip()
-            if should_yield(line):
-                yield line
+    if stdin and not _stdin_is_tty():
+        yield from filter_lines(sys.stdin)
         return
 
     raise ValueError("No input provided")
@@ -102,18 +111,21 @@ def read_all_input(input_arg: Optional[str] = None,
 def has_input_available(input_arg: Optional[str] = None,
                         file_arg: Optional[str] = None) -> bool:
     """Check if any input source is available."""
-    return bool(file_arg or input_arg or not sys.stdin.isatty())
+    return bool(file_arg or input_arg or not _stdin_is_tty())
 
 
 def format_hex(data: bytes, separator: str = '') -> str:
     """Format bytes as hex string with optional separator."""
+    if len(separator) == 1:
+        return data.hex(separator)
     if separator:
-        return separator.join(f'{b:02x}' for b in data)
+        # bytes.hex only takes a one-character separator; hex digits never contain ' '
+        return data.hex(' ').replace(' ', separator)
     return data.hex()
 
 
 def format_hex_upper(data: bytes, separator: str = '') -> str:
     """Format bytes as uppercase hex with optional separator."""
     if separator:
-        return separator.join(f'{b:02X}' for b in data)
+        return data.hex(' ').upper().replace(' ', separator)
     return data.hex().upper()
@@ -19,7 +19,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from m25_crypto import M25Encryptor, M25Decryptor
-from m25_protocol import DEFAULT_USB_KEY
+from m25_protocol import DEFAULT_USB_KEY, remove_delimiters
 from m25_protocol_data import (
     PROTOCOL_ID_STANDARD,
     SRC_ID_SMARTPHONE,
@@ -30,6 +30,23 @@ from m25_protocol_data import (
     PARAM_ID_READ_CURRENT_SPEED,
 )
 
+_U16_BE = struct.Struct('>H')
+_I16_BE = struct.Struct('>h')
+
+# Protocol ID + telegram ID for every telegram ID; the rest of the header is
+# fixed per command
+_TID_PREFIXES = tuple(bytes([PROTOCOL_ID_STANDARD, tid]) for tid in range(256))
+
+
+def _command_header(service_id, param_id):
+    """SRC/DEST/service/param bytes that follow the telegram ID"""
+    return bytes([SRC_ID_SMARTPHONE, DEST_ID_M25_WHEEL_LEFT, service_id, param_id])
+
+
+_HDR_WRITE_SYSTEM_MODE = _command_header(SERVICE_ID_APP_MGMT, PARAM_ID_WRITE_SYSTEM_MODE)
+_HDR_WRITE_REMOTE_SPEED = _command_header(SERVICE_ID_APP_MGMT, PARAM_ID_WRITE_REMOTE_SPEED)
+_HDR_READ_CURRENT_SPEED = _command_header(SERVICE_ID_APP_MGMT, PARAM_ID_READ_CURRENT_SPEED)
+
 
 class WheelController:
     """Simple wheel controller for demo"""
@@ -47,6 +64,8 @@ class WheelController:
         """Connect to simulator"""
         print(f"Connecting to wheel simulator at {self.host}:{self.port}...")
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # Small request/response packets: don't let Nagle hold them back
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         self.sock.connect((self.host, self.port))
         self.sock.settimeout(2.0)
         print("Connected!\n")
@@ -63,55 +82,85 @@ class WheelController:
         return tid
     
     def build_packet(self, service_id, param_id, payload=b''):
-        return bytes([
-            PROTOCOL_ID_STANDARD,
-            self.next_telegram_id(),
-            SRC_ID_SMARTPHONE,
-            DEST_ID_M25_WHEEL_LEFT,
-            service_id,
-            param_id
-        ]) + payload
+        return self._build(_command_header(service_id, param_id), payload)
+    
+    def _build(self, header, payload=b''):
+        """Join the telegram ID prefix with a precomputed command header"""
+        return _TID_PREFIXES[self.next_telegram_id()] + header + payload
     
     def send_receive(self, spp_packet):
         """Send and receive"""
-        encrypted = self.encryptor.encrypt(spp_packet)
-        self.sock.send(encrypted)
+        self.sock.sendall(self.encryptor.encrypt(spp_packet))
+        return self._receive()
+    
+    def send_many(self, spp_packets):
+        """Send several packets in one write, then read one response each"""
+        encrypt = self.encryptor.encrypt
+        self.sock.sendall(b''.join([encrypt(packet) for packet in spp_packets]))
+        return [self._receive() for _ in spp_packets]
+    
+    def _receive(self):
+        """Read and decrypt exactly one response frame"""
+        # Header first, then the rest of the frame into one pre-sized buffer
+        header = bytearray(3)
+        if not self._recv_into(header):
+            return None
+        frame_length = _U16_BE.unpack_from(header, 1)[0]
+        frame = bytearray(frame_length + 1)
+        frame[:3] = header
+        if not self._recv_into(memoryview(frame)[3:]):
+            return None
         
-        response_data = b''
-        while True:
-            chunk = self.sock.recv(1024)
-            if not chunk:
-                break
-            response_data += chunk
-            if len(response_data) >= 3:
-                frame_length = (response_data[1] << 8) | response_data[2]
-                if len(response_data) >= frame_length + 1:
-                    break
+        # Stuffed 0xEF pairs (or one cut in half) make the frame longer on the wire
+        frame = bytes(frame)
+        missing = frame_length + 1 - len(remove_delimiters(frame, frame_length + 1))
+        while missing > 0:
+            tail = bytearray(missing)
+            if not self._recv_into(tail):
+                return None
+            frame += tail
+            missing = frame_length + 1 - len(remove_delimiters(frame, frame_length + 1))
         
-        return self.decryptor.decrypt(response_data) if response_data else None
+        return self.decryptor.decrypt(frame)
+    
+    def _recv_into(self, buf):
+        """Fill buf completely; False if the connection closed first"""
+        view = memoryview(buf)
+        while view:
+            n = self.sock.recv_into(view)
+            if not n:
+                return False
+            view = view[n:]
+        return True
     
     def set_system_mode(self, mode):
         """Set system mode"""
-        packet = self.build_packet(SERVICE_ID_APP_MGMT, PARAM_ID_WRITE_SYSTEM_MODE, bytes([mode]))
+        packet = self._build(_HDR_WRITE_SYSTEM_MODE, bytes([mode]))
         response = self.send_receive(packet)
         return response is not None
     
     def set_speed(self, speed):
         """Set motor speed"""
-        speed_bytes = struct.pack('>h', speed)
-        packet = self.build_packet(SERVICE_ID_APP_MGMT, PARAM_ID_WRITE_REMOTE_SPEED, speed_bytes)
+        packet = self._build(_HDR_WRITE_REMOTE_SPEED, _I16_BE.pack(speed))
         response = self.send_receive(packet)
         return response is not None
     
     def get_speed(self):
         """Get current motor speed"""
-        packet = self.build_packet(SERVICE_ID_APP_MGMT, PARAM_ID_READ_CURRENT_SPEED)
+        packet = self._build(_HDR_READ_CURRENT_SPEED)
         response = self.send_receive(packet)
         if response and len(response) >= 8:
-            return struct.unpack('>h', response[6:8])[0]
+            return _I16_BE.unpack_from(response, 6)[0]
         return None
 
 
+def _sleep_until(deadline):
+    """Sleep until an absolute time.monotonic() deadline"""
+    delay = deadline - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
+
+
 def demo_control_sequence():
     """Demonstrate realistic control sequence"""
     controller = WheelController()
@@ -131,41 +180,50 @@ def demo_control_sequence():
         # Demo 1: Gradual acceleration
         print("Demo 1: Gradual Acceleration (0 -> 100)")
         print("-" * 40)
+        # Fixed 0.3s period: deadlines absorb round-trip time instead of adding to it
+        tick = time.monotonic()
         for speed in range(0, 101, 10):
             controller.set_speed(speed)
-            time.sleep(0.1)
+            _sleep_until(tick + 0.1)
             current_speed = controller.get_speed()
             bar = '#' * (speed // 5)
             print(f"  Target: {speed:3d}  Current: {current_speed:3d}  [{bar:<20}]")
-            time.sleep(0.2)
+            tick += 0.3
+            _sleep_until(tick)
         
         time.sleep(1)
         
         # Demo 2: Gradual deceleration
         print("\nDemo 2: Gradual Deceleration (100 -> 0)")
         print("-" * 40)
+        # Fixed 0.3s period: deadlines absorb round-trip time instead of adding to it
+        tick = time.monotonic()
         for speed in range(100, -1, -10):
             controller.set_speed(speed)
-            time.sleep(0.1)
+            _sleep_until(tick + 0.1)
             current_speed = controller.get_speed()
             bar = '#' * (speed // 5)
             print(f"  Target: {speed:3d}  Current: {current_speed:3d}  [{bar:<20}]")
-            time.sleep(0.2)
+            tick += 0.3
+            _sleep_until(tick)
         
         time.sleep(1)
         
         # Demo 3: Pulse pattern
         print("\nDemo 3: Pulse Pattern")
         print("-" * 40)
+        tick = time.monotonic()
         for cycle in range(3):
             print(f"  Cycle {cycle + 1}/3:")
             controller.set_speed(80)
-            time.sleep(0.3)
+            tick += 0.3
+            _sleep_until(tick)
             current = controller.get_speed()
             print(f"    Speed UP to {current}")
             
             controller.set_speed(20)
-            time.sleep(0.3)
+            tick += 0.3
+            _sleep_until(tick)
             current = controller.get_speed()
             print(f"    Speed DOWN to {current}")
         
@@ -22,19 +22,19 @@ import logging
 import sys
 import struct
 import argparse
-from typing import Optional, Dict, Any
+from operator import attrgetter
+from typing import Optional, Dict, Any, Tuple
 from dataclasses import dataclass, field
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from m25_crypto import M25Encryptor, M25Decryptor
-from m25_protocol import DEFAULT_USB_KEY
+from m25_crypto import get_encryptor, get_decryptor
+from m25_protocol import DEFAULT_USB_KEY, split_frames
 from m25_protocol_data import (
     PROTOCOL_ID_STANDARD,
-    POS_PROTOCOL_ID, POS_TELEGRAM_ID, POS_SOURCE_ID, POS_DEST_ID,
-    POS_SERVICE_ID, POS_PARAM_ID, POS_PAYLOAD,
+    POS_PAYLOAD, parse_header,
     MIN_SPP_PACKET_SIZE,
     
     # Source/Dest IDs
@@ -76,8 +76,25 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_INT16_BE = struct.Struct('>h')
 
-@dataclass
+# One-byte payloads, prebuilt
+_BYTES = tuple(bytes((i,)) for i in range(256))
+
+# Assist level clamped to 1-10 for every payload byte
+_CLAMP_1_10 = bytes(max(1, min(10, i)) for i in range(256))
+
+
+def _dest_suffixes(service_id: int, param_id: int) -> tuple:
+    """DEST/service/param tail of a response header for every destination byte"""
+    return tuple(bytes((dest, service_id, param_id)) for dest in range(256))
+
+
+# Slotted state on 3.10+ (dataclass slots=True); plain dataclass before that
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class WheelState:
     """Simulated wheel state"""
     # Battery
@@ -108,7 +125,7 @@ class WheelState:
     def next_telegram_id(self) -> int:
         """Get next telegram ID"""
         tid = self.telegram_counter
-        self.telegram_counter = (self.telegram_counter + 1) & 0xFF
+        self.telegram_counter = (tid + 1) & 0xFF
         return tid
 
 
@@ -141,27 +158,66 @@ class MockWheelSimulator:
         self.wheel_id = wheel_id
         self.debug = debug
         
-        self.encryptor = M25Encryptor(key)
-        self.decryptor = M25Decryptor(key)
+        # Shared per key: one ECB cipher (and key schedule) per direction
+        self.encryptor = get_encryptor(bytes(key))
+        self.decryptor = get_decryptor(bytes(key))
+        self._encrypt = self.encryptor.encrypt
+        self._decrypt = self.decryptor.decrypt
         
         self.state = WheelState()
         
+        # Response headers are PROTOCOL/telegram/wheel + DEST/service/param;
+        # both halves come from tables so a response is a couple of concatenations
+        self._tid_prefixes = tuple(bytes((PROTOCOL_ID_STANDARD, tid, wheel_id)) for tid in range(256))
+        self._ack_suffixes = _dest_suffixes(SERVICE_ID_APP_MGMT, PARAM_ID_ACK)
+        self._system_mode_suffixes = _dest_suffixes(SERVICE_ID_APP_MGMT, PARAM_ID_READ_SYSTEM_MODE + 1)
+        self._drive_mode_suffixes = _dest_suffixes(SERVICE_ID_APP_MGMT, PARAM_ID_STATUS_DRIVE_MODE)
+        self._assist_level_suffixes = _dest_suffixes(SERVICE_ID_APP_MGMT, PARAM_ID_STATUS_ASSIST_LEVEL)
+        
+        # Destinations we answer to (15 = broadcast)
+        self._my_dests = frozenset((wheel_id, DEST_ID_M25_WHEEL_COMMON, 15))
+        
         # Command handlers mapping
         self.handlers: Dict[tuple, Any] = {
             # APP_MGMT
             (SERVICE_ID_APP_MGMT, PARAM_ID_WRITE_SYSTEM_MODE): self.handle_write_system_mode,
-            (SERVICE_ID_APP_MGMT, PARAM_ID_READ_SYSTEM_MODE): self.handle_read_system_mode,
+            (SERVICE_ID_APP_MGMT, PARAM_ID_READ_SYSTEM_MODE): self._status_handler(
+                self._system_mode_suffixes, 'system_mode'),
             (SERVICE_ID_APP_MGMT, PARAM_ID_WRITE_DRIVE_MODE): self.handle_write_drive_mode,
-            (SERVICE_ID_APP_MGMT, PARAM_ID_READ_DRIVE_MODE): self.handle_read_drive_mode,
+            (SERVICE_ID_APP_MGMT, PARAM_ID_READ_DRIVE_MODE): self._status_handler(
+                self._drive_mode_suffixes, 'drive_mode'),
             (SERVICE_ID_APP_MGMT, PARAM_ID_WRITE_REMOTE_SPEED): self.handle_write_remote_speed,
             (SERVICE_ID_APP_MGMT, PARAM_ID_READ_CURRENT_SPEED): self.handle_read_current_speed,
             (SERVICE_ID_APP_MGMT, PARAM_ID_WRITE_ASSIST_LEVEL): self.handle_write_assist_level,
-            (SERVICE_ID_APP_MGMT, PARAM_ID_READ_ASSIST_LEVEL): self.handle_read_assist_level,
+            (SERVICE_ID_APP_MGMT, PARAM_ID_READ_ASSIST_LEVEL): self._status_handler(
+                self._assist_level_suffixes, 'assist_level'),
         }
+        # Flat dispatch table indexed by (service_id << 8) | param_id; the
+        # dict above stays the readable registry
+        self.handler_table = [None] * 0x10000
+        for (service_id, param_id), handler in self.handlers.items():
+            self.handler_table[(service_id << 8) | param_id] = handler
         
         logger.info(f"Mock Wheel Simulator initialized: {SOURCE_NAMES.get(wheel_id, f'ID_{wheel_id}')}")
         logger.info(f"Encryption key: {key.hex()}")
     
+    def _status_handler(self, suffixes: tuple, field_name: str):
+        """
+        READ handler answering with one state byte (READ_SYSTEM_MODE,
+        READ_DRIVE_MODE, READ_ASSIST_LEVEL).
+        
+        The header tables, state object and field getter are bound into the
+        closure, so a call does no attribute lookups on self.
+        """
+        prefixes = self._tid_prefixes
+        state = self.state
+        value = attrgetter(field_name)
+        byte = _BYTES
+        
+        def handler(telegram_id: int, source_id: int, payload: bytes) -> bytes:
+            return prefixes[telegram_id] + suffixes[source_id] + byte[value(state)]
+        return handler
+    
     def process_packet(self, encrypted_packet: bytes) -> Optional[bytes]:
         """
         Process received encrypted packet and generate encrypted response.
@@ -173,7 +229,7 @@ class MockWheelSimulator:
             Encrypted response packet or None
         """
         # Decrypt incoming packet
-        decrypted = self.decryptor.decrypt(encrypted_packet)
+        decrypted = self._decrypt(encrypted_packet)
         if decrypted is None:
             logger.warning("Failed to decrypt packet")
             return None
@@ -182,49 +238,60 @@ class MockWheelSimulator:
             logger.warning(f"Packet too short: {len(decrypted)} bytes")
             return None
         
-        # Parse packet header
-        protocol_id = decrypted[POS_PROTOCOL_ID]
-        telegram_id = decrypted[POS_TELEGRAM_ID]
-        source_id = decrypted[POS_SOURCE_ID]
-        dest_id = decrypted[POS_DEST_ID]
-        service_id = decrypted[POS_SERVICE_ID]
-        param_id = decrypted[POS_PARAM_ID]
-        payload = decrypted[POS_PAYLOAD:] if len(decrypted) > POS_PAYLOAD else b''
-        
-        if self.debug:
-            logger.debug(f"RX: Proto={protocol_id:02X} Tel={telegram_id:02X} "
-                        f"Src={SOURCE_NAMES.get(source_id, f'{source_id:02X}')} "
-                        f"Dst={DEST_NAMES.get(dest_id, f'{dest_id:02X}')} "
-                        f"Srv={SERVICE_NAMES.get(service_id, f'{service_id:02X}')} "
-                        f"Param={param_id:02X} Payload={payload.hex()}")
+        # Parse packet header (one C-level unpack of the six header bytes)
+        protocol_id, telegram_id, source_id, dest_id, service_id, param_id = parse_header(decrypted)
+        payload = memoryview(decrypted)[POS_PAYLOAD:]  # Zero-copy; empty if no payload
+        
+        # The logger's level check decides; nothing is formatted when DEBUG is off
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("RX: Proto=%02X Tel=%02X Src=%s Dst=%s Srv=%s Param=%02X Payload=%s",
+                         protocol_id, telegram_id,
+                         SOURCE_NAMES.get(source_id, f'{source_id:02X}'),
+                         DEST_NAMES.get(dest_id, f'{dest_id:02X}'),
+                         SERVICE_NAMES.get(service_id, f'{service_id:02X}'),
+                         param_id, payload.hex())
         
         self.state.command_count += 1
         
         # Check if we're the destination
-        if dest_id not in [self.wheel_id, DEST_ID_M25_WHEEL_COMMON, 15]:  # 15 = broadcast
-            logger.debug(f"Packet not for us (dest={dest_id}, we are {self.wheel_id})")
+        if dest_id not in self._my_dests:
+            logger.debug("Packet not for us (dest=%d, we are %d)", dest_id, self.wheel_id)
             return None
         
         # Find handler
-        handler_key = (service_id, param_id)
-        handler = self.handlers.get(handler_key)
+        handler = self.handler_table[(service_id << 8) | param_id]
         
         if handler:
             response_spp = handler(telegram_id, source_id, payload)
         else:
             # Unknown command - send NACK
-            logger.warning(f"Unknown command: Service={service_id:02X} Param={param_id:02X}")
+            logger.warning("Unknown command: Service=%02X Param=%02X", service_id, param_id)
             response_spp = self.build_nack(telegram_id, source_id, NACK_PID)
         
         # Encrypt response
         if response_spp:
-            encrypted_response = self.encryptor.encrypt(response_spp)
-            if self.debug:
-                logger.debug(f"TX: {response_spp.hex()} -> {encrypted_response.hex()}")
+            encrypted_response = self._encrypt(response_spp)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("TX: %s -> %s", response_spp.hex(), encrypted_response.hex())
             return encrypted_response
         
         return None
     
+    def process_packets(self, data: bytes) -> Tuple[bytes, bytes]:
+        """
+        Process every whole frame in a stream read.
+        
+        Args:
+            data: Received bytes, possibly holding several frames
+            
+        Returns:
+            (all encrypted responses joined for one write, incomplete trailing frame)
+        """
+        frames, remainder = split_frames(data)
+        process = self.process_packet
+        responses = [process(frame) for frame in frames]
+        return b''.join([r for r in responses if r]), remainder
+    
     def build_response(
         self,
         telegram_id: int,
@@ -234,24 +301,15 @@ class MockWheelSimulator:
         payload: bytes = b''
     ) -> bytes:
         """Build SPP response packet"""
-        return bytes([
-            PROTOCOL_ID_STANDARD,
-            telegram_id,
-            self.wheel_id,
-            dest_id,
-            service_id,
-            param_id
-        ]) + payload
+        return self._tid_prefixes[telegram_id] + bytes((dest_id, service_id, param_id)) + payload
     
     def build_ack(self, telegram_id: int, dest_id: int) -> bytes:
         """Build ACK response"""
-        return self.build_response(telegram_id, dest_id, SERVICE_ID_APP_MGMT, PARAM_ID_ACK)
+        return self._tid_prefixes[telegram_id] + self._ack_suffixes[dest_id]
     
     def build_nack(self, telegram_id: int, dest_id: int, error_code: int) -> bytes:
         """Build NACK response"""
-        return self.build_response(
-            telegram_id, dest_id, SERVICE_ID_APP_MGMT, PARAM_ID_ACK, bytes([error_code])
-        )
+        return self._tid_prefixes[telegram_id] + self._ack_suffixes[dest_id] + _BYTES[error_code]
     
     # Command Handlers
     
@@ -263,14 +321,6 @@ class MockWheelSimulator:
             logger.info(f"System mode set to: 0x{mode:02X}")
         return self.build_ack(telegram_id, source_id)
     
-    def handle_read_system_mode(self, telegram_id: int, source_id: int, payload: bytes) -> bytes:
-        """Handle READ_SYSTEM_MODE"""
-        return self.build_response(
-            telegram_id, source_id, SERVICE_ID_APP_MGMT,
-            PARAM_ID_READ_SYSTEM_MODE + 1,  # STATUS = READ + 1
-            bytes([self.state.system_mode])
-        )
-    
     def handle_write_drive_mode(self, telegram_id: int, source_id: int, payload: bytes) -> bytes:
         """Handle WRITE_DRIVE_MODE"""
         if len(payload) >= 1:
@@ -279,19 +329,11 @@ class MockWheelSimulator:
             logger.info(f"Drive mode set to: 0x{mode:02X}")
         return self.build_ack(telegram_id, source_id)
     
-    def handle_read_drive_mode(self, telegram_id: int, source_id: int, payload: bytes) -> bytes:
-        """Handle READ_DRIVE_MODE"""
-        return self.build_response(
-            telegram_id, source_id, SERVICE_ID_APP_MGMT,
-            PARAM_ID_STATUS_DRIVE_MODE,
-            bytes([self.state.drive_mode])
-        )
-    
     def handle_write_remote_speed(self, telegram_id: int, source_id: int, payload: bytes) -> bytes:
         """Handle WRITE_REMOTE_SPEED - motor control command"""
         if len(payload) >= 2:
             # Remote speed is typically 2 bytes: signed int16
-            speed = struct.unpack('>h', payload[0:2])[0]  # Big-endian signed short
+            speed = _INT16_BE.unpack_from(payload, 0)[0]  # Big-endian signed short
             self.state.target_speed = speed
             
             # Simulate motor response (ramp towards target)
@@ -308,7 +350,7 @@ class MockWheelSimulator:
     def handle_read_current_speed(self, telegram_id: int, source_id: int, payload: bytes) -> bytes:
         """Handle READ_CURRENT_SPEED"""
         # Return current motor speed as signed int16
-        speed_bytes = struct.pack('>h', self.state.motor_speed)
+        speed_bytes = _INT16_BE.pack(self.state.motor_speed)
         return self.build_response(
             telegram_id, source_id, SERVICE_ID_APP_MGMT,
             PARAM_ID_STATUS_CURRENT_SPEED,
@@ -319,23 +361,68 @@ class MockWheelSimulator:
         """Handle WRITE_ASSIST_LEVEL"""
         if len(payload) >= 1:
             level = payload[0]
-            self.state.assist_level = max(1, min(10, level))  # Clamp to 1-10
+            self.state.assist_level = _CLAMP_1_10[level]  # Clamp to 1-10
             logger.info(f"Assist level set to: {self.state.assist_level}")
         return self.build_ack(telegram_id, source_id)
     
-    def handle_read_assist_level(self, telegram_id: int, source_id: int, payload: bytes) -> bytes:
-        """Handle READ_ASSIST_LEVEL"""
-        return self.build_response(
-            telegram_id, source_id, SERVICE_ID_APP_MGMT,
-            PARAM_ID_STATUS_ASSIST_LEVEL,
-            bytes([self.state.assist_level])
-        )
-    
     def get_state(self) -> WheelState:
         """Get current wheel state"""
         return self.state
 
 
+class WheelClientProtocol(asyncio.BufferedProtocol):
+    """
+    One client connection. The event loop receives straight into a reused
+    buffer; every whole frame in it is answered and the incomplete tail is
+    kept at the front for the next read.
+    """
+    
+    def __init__(self, simulator: MockWheelSimulator):
+        self.simulator = simulator
+        # Only an incomplete frame (under 600 bytes stuffed) is ever carried over
+        self.buffer = bytearray(4096)
+        self.view = memoryview(self.buffer)
+        self.used = 0
+        self.transport: Optional[asyncio.Transport] = None
+        self.addr = None
+    
+    def connection_made(self, transport):
+        self.transport = transport
+        self.addr = transport.get_extra_info('peername')
+        logger.info(f"Client connected: {self.addr}")
+    
+    def get_buffer(self, sizehint: int) -> memoryview:
+        return self.view[self.used:]
+    
+    def buffer_updated(self, nbytes: int):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received %d bytes: %s...", nbytes,
+                         self.view[self.used:self.used + min(nbytes, 50)].hex())
+        self.used += nbytes
+        
+        try:
+            response, remainder = self.simulator.process_packets(self.view[:self.used])
+        except ValueError as e:
+            # Bad input from the client (oversized frame): no traceback
+            logger.error("Error handling client: %s", e)
+            self.transport.close()
+            return
+        except Exception as e:
+            logger.error("Error handling client: %s", e, exc_info=True)
+            self.transport.close()
+            return
+        
+        self.used = len(remainder)
+        self.buffer[:self.used] = remainder
+        
+        if response:
+            self.transport.write(response)
+            logger.debug("Sent %d bytes", len(response))
+    
+    def connection_lost(self, exc):
+        logger.info(f"Client disconnected: {self.addr}")
+
+
 class SocketServer:
     """TCP socket server for testing"""
     
@@ -344,42 +431,11 @@ class SocketServer:
         self.port = port
         self.server: Optional[asyncio.Server] = None
     
-    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
-        """Handle connected client"""
-        addr = writer.get_extra_info('peername')
-        logger.info(f"Client connected: {addr}")
-        
-        try:
-            while True:
-                # Read enough data to get at least one packet
-                # M25 packets are typically 37-300 bytes with byte stuffing
-                data = await reader.read(512)
-                if not data:
-                    break
-                
-                logger.debug(f"Received {len(data)} bytes: {data[:50].hex()}...")
-                
-                # Process packet
-                response = self.simulator.process_packet(data)
-                
-                if response:
-                    writer.write(response)
-                    await writer.drain()
-                    logger.debug(f"Sent {len(response)} bytes")
-        
-        except asyncio.CancelledError:
-            pass
-        except Exception as e:
-            logger.error(f"Error handling client: {e}", exc_info=True)
-        finally:
-            logger.info(f"Client disconnected: {addr}")
-            writer.close()
-            await writer.wait_closed()
-    
     async def start(self):
         """Start the server"""
-        self.server = await asyncio.start_server(
-            self.handle_client, '127.0.0.1', self.port
+        loop = asyncio.get_running_loop()
+        self.server = await loop.create_server(
+            lambda: WheelClientProtocol(self.simulator), '127.0.0.1', self.port
         )
         
         addr = self.server.sockets[0].getsockname()
@@ -10,13 +10,15 @@ import asyncio
 import socket
 import sys
 import struct
+import time
+from array import array
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from m25_crypto import M25Encryptor, M25Decryptor
-from m25_protocol import DEFAULT_USB_KEY
+from m25_crypto import get_encryptor, get_decryptor
+from m25_protocol import DEFAULT_USB_KEY, split_frames
 from m25_protocol_data import (
     PROTOCOL_ID_STANDARD,
     SRC_ID_SMARTPHONE,
@@ -31,25 +33,49 @@ from m25_protocol_data import (
     PARAM_ID_ACK,
 )
 
+_SPEED = struct.Struct('>h')
+
+# Linux only; the kernel clears it after delayed-ACK events, so it is re-armed per recv
+_TCP_QUICKACK = getattr(socket, 'TCP_QUICKACK', None)
+
+# Protocol ID + telegram ID for every telegram ID
+_TID_PREFIXES = tuple(bytes([PROTOCOL_ID_STANDARD, tid]) for tid in range(256))
+
 
 class SimpleTestClient:
     """Simple test client for the mock wheel simulator"""
     
-    def __init__(self, host: str = '127.0.0.1', port: int = 5000, key: bytes = DEFAULT_USB_KEY):
+    def __init__(self, host: str = '127.0.0.1', port: int = 5000, key: bytes = DEFAULT_USB_KEY,
+                 debug: bool = False):
         self.host = host
         self.port = port
         self.key = key
-        self.encryptor = M25Encryptor(key)
-        self.decryptor = M25Decryptor(key)
+        self.debug = debug  # Print every TX/RX packet (hex-formatting each one)
+        # Shared per key: PyCryptodome ciphers (AES-NI when available), keyed once
+        self.encryptor = get_encryptor(bytes(key))
+        self.decryptor = get_decryptor(bytes(key))
         self.telegram_id = 0
         self.sock = None
+        # Static SRC/DEST/service/param bytes per command
+        self._header_tails = {}
+        self._timeout = None  # Current socket timeout, to skip redundant settimeout calls
+        # Persistent receive buffer; bytes past the first frame wait for the next call
+        self._rxbuf = bytearray(8192)
+        self._rxview = memoryview(self._rxbuf)
+        self._rxlen = 0
     
     def connect(self):
         """Connect to the simulator"""
         print(f"Connecting to {self.host}:{self.port}...")
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # Small request/response packets: don't let Nagle hold the request back
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # Room for a whole pipelined burst, so one recv usually drains it
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 65536)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 65536)
         self.sock.connect((self.host, self.port))
         self.sock.settimeout(2.0)
+        self._timeout = 2.0
         print("Connected!")
     
     def disconnect(self):
@@ -66,134 +92,165 @@ class SimpleTestClient:
     
     def build_packet(self, service_id: int, param_id: int, payload: bytes = b'') -> bytes:
         """Build SPP packet"""
-        return bytes([
-            PROTOCOL_ID_STANDARD,
-            self.next_telegram_id(),
-            SRC_ID_SMARTPHONE,
-            DEST_ID_M25_WHEEL_LEFT,
-            service_id,
-            param_id
-        ]) + payload
+        tail = self._header_tails.get((service_id, param_id))
+        if tail is None:
+            tail = self._header_tails[service_id, param_id] = bytes(
+                [SRC_ID_SMARTPHONE, DEST_ID_M25_WHEEL_LEFT, service_id, param_id]
+            )
+        return _TID_PREFIXES[self.next_telegram_id()] + tail + payload
     
     def send_receive(self, spp_packet: bytes, timeout: float = 2.0) -> bytes:
         """Send packet and receive response"""
         # Encrypt and send
         encrypted = self.encryptor.encrypt(spp_packet)
-        print(f"  TX: {spp_packet.hex()} -> {len(encrypted)} bytes encrypted")
+        if self.debug:
+            print(f"  TX: {spp_packet.hex()} -> {len(encrypted)} bytes encrypted")
         self.sock.send(encrypted)
+        return self._receive(timeout)
+    
+    def send_receive_many(self, spp_packets, timeout: float = 2.0) -> dict:
+        """Pipeline packets in one send, then collect the responses by telegram ID"""
+        encrypt = self.encryptor.encrypt
+        self.sock.sendall(b''.join([encrypt(packet) for packet in spp_packets]))
+        if self.debug:
+            print(f"  TX: {len(spp_packets)} packets pipelined")
         
-        # Small delay to allow server to process
-        import time
-        time.sleep(0.1)
-        
-        # Receive response
-        self.sock.settimeout(timeout)
-        response_data = b''
+        responses = {}
+        for _ in spp_packets:
+            decrypted = self._receive(timeout)
+            if decrypted is None:
+                break
+            if len(decrypted) > 1:
+                responses[decrypted[1]] = decrypted
+        return responses
+    
+    def _receive(self, timeout: float) -> bytes:
+        """Receive and decrypt one response frame"""
+        # recv blocks until a response arrives, no fixed delay needed
+        if timeout != self._timeout:
+            self.sock.settimeout(timeout)
+            self._timeout = timeout
+        response_data = self._take_frame()
         
         # Read until we have a complete packet
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        start_time = time.monotonic()
+        while response_data is None and time.monotonic() - start_time < timeout:
             try:
-                chunk = self.sock.recv(1024)
-                if not chunk:
+                if _TCP_QUICKACK is not None:
+                    self.sock.setsockopt(socket.IPPROTO_TCP, _TCP_QUICKACK, 1)
+                n = self.sock.recv_into(self._rxview[self._rxlen:])
+                if not n:
                     break
-                response_data += chunk
-                
-                # Check if we have enough data
-                if len(response_data) >= 3:
-                    frame_length = (response_data[1] << 8) | response_data[2]
-                    if len(response_data) >= frame_length + 1:
-                        break
+                self._rxlen += n
+                response_data = self._take_frame()
             except socket.timeout:
-                if response_data:
+                if self._rxlen:
                     break
                 continue
         
-        if not response_data:
-            print("  RX: No response")
+        if response_data is None:
+            print("  RX: No response" if not self._rxlen else "  RX: Decryption failed")
+            self._rxlen = 0
             return None
         
         # Decrypt response
         decrypted = self.decryptor.decrypt(response_data)
         if decrypted:
-            print(f"  RX: {len(response_data)} bytes encrypted -> {decrypted.hex()}")
+            if self.debug:
+                print(f"  RX: {len(response_data)} bytes encrypted -> {decrypted.hex()}")
             return decrypted
         else:
             print("  RX: Decryption failed")
             return None
     
-    def test_write_system_mode(self):
-        """Test WRITE_SYSTEM_MODE command"""
-        print("\n[TEST] Write System Mode (Connect)")
+    def _take_frame(self):
+        """Pop the first whole frame off the receive buffer, or None"""
+        frames, rest = split_frames(self._rxview[:self._rxlen])
+        if not frames:
+            return None
+        # Move what follows the frame to the front of the buffer
+        tail = b''.join(frames[1:]) + rest
+        self._rxlen = len(tail)
+        self._rxbuf[:self._rxlen] = tail
+        return frames[0]
+    
+    # Each test is a case: (title, packet, check). The test_* methods run one
+    # case per round trip; run_all_tests pipelines all of them.
+    
+    def _case_write_system_mode(self):
         packet = self.build_packet(SERVICE_ID_APP_MGMT, PARAM_ID_WRITE_SYSTEM_MODE, bytes([0x01]))
-        response = self.send_receive(packet)
-        
+        return "Write System Mode (Connect)", packet, self._check_ack
+    
+    def _case_read_system_mode(self):
+        packet = self.build_packet(SERVICE_ID_APP_MGMT, PARAM_ID_READ_SYSTEM_MODE)
+        return "Read System Mode", packet, self._check_system_mode
+    
+    def _case_write_drive_mode(self):
+        packet = self.build_packet(SERVICE_ID_APP_MGMT, PARAM_ID_WRITE_DRIVE_MODE, bytes([0x01]))
+        return "Write Drive Mode (Normal)", packet, self._check_ack
+    
+    def _case_write_remote_speed(self, speed: int = 50):
+        speed_bytes = _SPEED.pack(speed)  # Big-endian signed short
+        packet = self.build_packet(SERVICE_ID_APP_MGMT, PARAM_ID_WRITE_REMOTE_SPEED, speed_bytes)
+        return f"Write Remote Speed ({speed})", packet, self._check_ack
+    
+    def _case_read_current_speed(self):
+        packet = self.build_packet(SERVICE_ID_APP_MGMT, PARAM_ID_READ_CURRENT_SPEED)
+        return "Read Current Speed", packet, self._check_current_speed
+    
+    @staticmethod
+    def _check_ack(response) -> bool:
         if response and len(response) >= 6:
             param_id = response[5]
             if param_id == PARAM_ID_ACK:
                 print("  Result: ACK received - SUCCESS")
                 return True
-            else:
-                print(f"  Result: Unexpected response param_id={param_id:02X}")
+            print(f"  Result: Unexpected response param_id={param_id:02X}")
         else:
             print("  Result: FAILED")
         return False
     
-    def test_read_system_mode(self):
-        """Test READ_SYSTEM_MODE command"""
-        print("\n[TEST] Read System Mode")
-        packet = self.build_packet(SERVICE_ID_APP_MGMT, PARAM_ID_READ_SYSTEM_MODE)
-        response = self.send_receive(packet)
-        
+    @staticmethod
+    def _check_system_mode(response) -> bool:
         if response and len(response) >= 7:
             mode = response[6]
             print(f"  Result: System Mode = 0x{mode:02X} - SUCCESS")
             return True
-        else:
-            print("  Result: FAILED")
+        print("  Result: FAILED")
         return False
     
-    def test_write_drive_mode(self):
-        """Test WRITE_DRIVE_MODE command"""
-        print("\n[TEST] Write Drive Mode (Normal)")
-        packet = self.build_packet(SERVICE_ID_APP_MGMT, PARAM_ID_WRITE_DRIVE_MODE, bytes([0x01]))
-        response = self.send_receive(packet)
-        
-        if response and len(response) >= 6:
-            param_id = response[5]
-            if param_id == PARAM_ID_ACK:
-                print("  Result: ACK received - SUCCESS")
-                return True
+    @staticmethod
+    def _check_current_speed(response) -> bool:
+        if response and len(response) >= 8:
+            speed = _SPEED.unpack_from(response, 6)[0]
+            print(f"  Result: Current Speed = {speed} - SUCCESS")
+            return True
         print("  Result: FAILED")
         return False
     
+    def _run_case(self, title, packet, check):
+        print(f"\n[TEST] {title}")
+        return check(self.send_receive(packet))
+    
+    def test_write_system_mode(self):
+        """Test WRITE_SYSTEM_MODE command"""
+        return self._run_case(*self._case_write_system_mode())
+    
+    def test_read_system_mode(self):
+        """Test READ_SYSTEM_MODE command"""
+        return self._run_case(*self._case_read_system_mode())
+    
+    def test_write_drive_mode(self):
+        """Test WRITE_DRIVE_MODE command"""
+        return self._run_case(*self._case_write_drive_mode())
+    
     def test_write_remote_speed(self, speed: int = 50):
         """Test WRITE_REMOTE_SPEED command"""
-        print(f"\n[TEST] Write Remote Speed ({speed})")
-        speed_bytes = struct.pack('>h', speed)  # Big-endian signed short
-        packet = self.build_packet(SERVICE_ID_APP_MGMT, PARAM_ID_WRITE_REMOTE_SPEED, speed_bytes)
-        response = self.send_receive(packet)
-        
-        if response and len(response) >= 6:
-            param_id = response[5]
-            if param_id == PARAM_ID_ACK:
-                print("  Result: ACK received - SUCCESS")
-                return True
-        print("  Result: FAILED")
-        return False
+        return self._run_case(*self._case_write_remote_speed(speed))
     
     def test_read_current_speed(self):
         """Test READ_CURRENT_SPEED command"""
-        print("\n[TEST] Read Current Speed")
-        packet = self.build_packet(SERVICE_ID_APP_MGMT, PARAM_ID_READ_CURRENT_SPEED)
-        response = self.send_receive(packet)
-        
-        if response and len(response) >= 8:
-            speed = struct.unpack('>h', response[6:8])[0]
-            print(f"  Result: Current Speed = {speed} - SUCCESS")
-            return True
-        print("  Result: FAILED")
-        return False
+        return self._run_case(*self._case_read_current_speed())
     
     def run_all_tests(self):
         """Run all tests"""
@@ -202,36 +259,48 @@ class SimpleTestClient:
         print("=" * 60)
         
         tests = [
-            ("Write System Mode", self.test_write_system_mode),
-            ("Read System Mode", self.test_read_system_mode),
-            ("Write Drive Mode", self.test_write_drive_mode),
-            ("Write Remote Speed (50)", lambda: self.test_write_remote_speed(50)),
-            ("Read Current Speed", self.test_read_current_speed),
-            ("Write Remote Speed (100)", lambda: self.test_write_remote_speed(100)),
-            ("Read Current Speed", self.test_read_current_speed),
-            ("Write Remote Speed (0)", lambda: self.test_write_remote_speed(0)),
-            ("Read Current Speed", self.test_read_current_speed),
+            ("Write System Mode", self._case_write_system_mode),
+            ("Read System Mode", self._case_read_system_mode),
+            ("Write Drive Mode", self._case_write_drive_mode),
+            ("Write Remote Speed (50)", lambda: self._case_write_remote_speed(50)),
+            ("Read Current Speed", self._case_read_current_speed),
+            ("Write Remote Speed (100)", lambda: self._case_write_remote_speed(100)),
+            ("Read Current Speed", self._case_read_current_speed),
+            ("Write Remote Speed (0)", lambda: self._case_write_remote_speed(0)),
+            ("Read Current Speed", self._case_read_current_speed),
         ]
+        cases = [(test_name, make_case()) for test_name, make_case in tests]
+        
+        # The wheel answers in order and echoes each telegram ID, so send every
+        # request back to back and match the responses afterwards
+        print("\n[PIPELINE] Sending all test packets")
+        try:
+            responses = self.send_receive_many([packet for _, (_, packet, _) in cases])
+        except Exception as e:
+            print(f"  ERROR: {e}")
+            responses = {}
         
-        results = []
-        for test_name, test_func in tests:
+        # Pass/fail flags packed alongside the names, one byte per test
+        names = tuple(test_name for test_name, _ in cases)
+        passed_flags = array('b', bytes(len(cases)))
+        for i, (_, (title, packet, check)) in enumerate(cases):
+            print(f"\n[TEST] {title}")
             try:
-                result = test_func()
-                results.append((test_name, result))
+                if check(responses.get(packet[1])):
+                    passed_flags[i] = 1
             except Exception as e:
                 print(f"  ERROR: {e}")
-                results.append((test_name, False))
         
         print("\n" + "=" * 60)
         print("Test Results Summary")
         print("=" * 60)
         
-        for test_name, result in results:
+        for test_name, result in zip(names, passed_flags):
             status = "PASS" if result else "FAIL"
             print(f"  [{status}] {test_name}")
         
-        passed = sum(1 for _, result in results if result)
-        total = len(results)
+        passed = sum(passed_flags)
+        total = len(passed_flags)
         print(f"\n  Total: {passed}/{total} tests passed")
         print("=" * 60)
         
@@ -240,7 +309,7 @@ class SimpleTestClient:
 
 def main():
     """Main entry point"""
-    client = SimpleTestClient()
+    client = SimpleTestClient(debug=True)
     
     try:
         client.connect()
@@ -112,11 +112,11 @@ async def test_basic_flow():
     await input_provider2.start()
     await transport2.connect("AA:BB:CC:DD:EE:FF", "FF:EE:DD:CC:BB:AA", b"key1234567890123", b"key0987654321098")
     
-    # Simulate a few cycles
+    # Simulate a few cycles; the mocks never wait, so skip the event loop
     for i in range(3):
-        ctrl = await input_provider2.read_control_state()
+        ctrl = input_provider2.read_control_state_sync()
         cmd = mapper2.map(ctrl)
-        await transport2.send_command(cmd)
+        transport2.send_command_sync(cmd)
     
     assert transport2.command_count == 3, "Not all commands sent"
     print(f"  ✓ Sent {transport2.command_count} commands through full pipeline")
@@ -146,27 +146,15 @@ async def test_safety_features():
     mapper = Mapper(MapperConfig())
     transport = MockTransport()
     
+    config = SupervisorConfig()
     supervisor = Supervisor(
         input_provider=input_provider,
         mapper=mapper,
         transport=transport,
-        config=SupervisorConfig()
+        config=config
     )
     
-    try:
-        await asyncio.wait_for(supervisor.run(), timeout=2.0)
-    except asyncio.TimeoutError:
-        pass
-    
-    supervisor.stop()
-    
-    # With deadman=False, no movement commands should be sent
-    print(f"  - Commands sent: {transport.command_count}")
-    # Note: Some commands might be sent during connection phase
-    print("  ✓ Deadman switch active")
-    
     # Test emergency stop
-    print("\n[2/3] Testing emergency stop...")
     input_provider2 = MockInput()
     input_provider2.load_script("emergency_stop")
     
@@ -175,15 +163,32 @@ async def test_safety_features():
         input_provider=input_provider2,
         mapper=Mapper(MapperConfig()),
         transport=transport2,
-        config=SupervisorConfig()
+        config=config
     )
     
-    try:
-        await asyncio.wait_for(supervisor2.run(), timeout=2.0)
-    except asyncio.TimeoutError:
-        pass
+    # Run both supervisors concurrently, each for about twice its script length
+    def run_for_script(supervisor, provider):
+        timeout = max(len(provider._states), 1) * config.loop_interval * 2
+        return asyncio.wait_for(supervisor.run(), timeout=timeout)
     
+    results = await asyncio.gather(
+        run_for_script(supervisor, input_provider),
+        run_for_script(supervisor2, input_provider2),
+        return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, BaseException) and not isinstance(result, asyncio.TimeoutError):
+            raise result
+    
+    supervisor.stop()
     supervisor2.stop()
+    
+    # With deadman=False, no movement commands should be sent
+    print(f"  - Commands sent: {transport.command_count}")
+    # Note: Some commands might be sent during connection phase
+    print("  ✓ Deadman switch active")
+    
+    print("\n[2/3] Testing emergency stop...")
     print(f"  - Commands sent: {transport2.command_count}")
     print("  ✓ Emergency stop handled")
     
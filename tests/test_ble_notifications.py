@@ -22,12 +22,20 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from m25_bluetooth_ble import M25BluetoothBLE
 
 
+def _short_hex(data: bytes, limit: int = 8) -> str:
+    """Hex of the first few bytes only, for log lines"""
+    if not data:
+        return 'None'
+    return data[:limit].hex() + ('...' if len(data) > limit else '')
+
+
 class NotificationTester:
     """Test harness for BLE notifications"""
     
-    def __init__(self, address: str, key: bytes = None):
+    def __init__(self, address: str, key: bytes = None, perf_window: float = 10.0):
         self.address = address
         self.key = key
+        self.perf_window = perf_window  # Seconds test_07 collects callback notifications
         self.test_results: List[tuple] = []
         
     def log_test(self, name: str, passed: bool, details: str = ""):
@@ -90,39 +98,36 @@ class NotificationTester:
             self.log_test("Connection", False, str(e))
             return False
     
-    async def test_02_callback_notification(self) -> bool:
+    async def test_02_callback_notification(self, bt: M25BluetoothBLE) -> bool:
         """Test notification with callback"""
         print("\n[Test 2] Callback Notifications")
         print("-" * 60)
         
-        bt = M25BluetoothBLE(
-            address=self.address,
-            key=self.key,
-            name="test_wheel",
-            debug=True
-        )
-        
         try:
-            await bt.connect()
-            
             # Track received data
             received_data = []
+            got_data = asyncio.Event()
             
             def callback(data: bytes):
                 received_data.append(data)
-                print(f"  Callback received {len(data)} bytes: {data.hex()}")
+                got_data.set()
+                # Only format the first few; the rest would just churn strings
+                if len(received_data) <= 3:
+                    print(f"  Callback received {len(data)} bytes: {data.hex()}")
             
             # Enable notifications
             notify_started = await bt.start_notifications(callback)
             self.log_test("Start Notifications (callback)", notify_started)
             
             if not notify_started:
-                await bt.disconnect()
                 return False
             
-            # Wait for data (5 seconds)
-            print("  Waiting 5 seconds for notifications...")
-            await asyncio.sleep(5)
+            # Wait for data (up to 5 seconds)
+            print("  Waiting up to 5 seconds for notifications...")
+            try:
+                await asyncio.wait_for(got_data.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                pass
             
             # Check if we received any data
             data_received = len(received_data) > 0
@@ -133,38 +138,23 @@ class NotificationTester:
             notify_stopped = await bt.stop_notifications()
             self.log_test("Stop Notifications", notify_stopped)
             
-            await bt.disconnect()
             return notify_started and notify_stopped
             
         except Exception as e:
             self.log_test("Callback Notifications", False, str(e))
-            try:
-                await bt.disconnect()
-            except:
-                pass
             return False
     
-    async def test_03_queue_notification(self) -> bool:
+    async def test_03_queue_notification(self, bt: M25BluetoothBLE) -> bool:
         """Test notification with queue"""
         print("\n[Test 3] Queue Notifications")
         print("-" * 60)
         
-        bt = M25BluetoothBLE(
-            address=self.address,
-            key=self.key,
-            name="test_wheel",
-            debug=True
-        )
-        
         try:
-            await bt.connect()
-            
             # Enable notifications without callback (uses queue)
             notify_started = await bt.start_notifications()
             self.log_test("Start Notifications (queue)", notify_started)
             
             if not notify_started:
-                await bt.disconnect()
                 return False
             
             # Wait for notifications with timeout
@@ -175,7 +165,7 @@ class NotificationTester:
             
             data_received = data is not None
             self.log_test("Queue Data Received", data_received,
-                         f"Received in {elapsed:.2f}s: {data.hex() if data else 'None'}")
+                         f"Received in {elapsed:.2f}s: {_short_hex(data)}")
             
             # Test timeout behavior
             print("  Testing timeout (1 second, expecting timeout)...")
@@ -188,32 +178,18 @@ class NotificationTester:
                          f"Timeout after {timeout_elapsed:.2f}s")
             
             await bt.stop_notifications()
-            await bt.disconnect()
             return notify_started and timeout_works
             
         except Exception as e:
             self.log_test("Queue Notifications", False, str(e))
-            try:
-                await bt.disconnect()
-            except:
-                pass
             return False
     
-    async def test_04_notification_restart(self) -> bool:
+    async def test_04_notification_restart(self, bt: M25BluetoothBLE) -> bool:
         """Test stopping and restarting notifications"""
         print("\n[Test 4] Notification Restart")
         print("-" * 60)
         
-        bt = M25BluetoothBLE(
-            address=self.address,
-            key=self.key,
-            name="test_wheel",
-            debug=True
-        )
-        
         try:
-            await bt.connect()
-            
             # Start, stop, start again
             print("  First start...")
             started1 = await bt.start_notifications()
@@ -236,21 +212,16 @@ class NotificationTester:
             data = await bt.wait_notification(timeout=5.0)
             still_works = data is not None
             self.log_test("Restart Works", still_works,
-                         f"Received: {data.hex() if data else 'None'}")
+                         f"Received: {_short_hex(data)}")
             
             await bt.stop_notifications()
-            await bt.disconnect()
             return started1 and stopped and started2
             
         except Exception as e:
             self.log_test("Notification Restart", False, str(e))
-            try:
-                await bt.disconnect()
-            except:
-                pass
             return False
     
-    async def test_05_encryption_notification(self) -> bool:
+    async def test_05_encryption_notification(self, bt: M25BluetoothBLE) -> bool:
         """Test notifications with encryption (if key provided)"""
         print("\n[Test 5] Encrypted Notifications")
         print("-" * 60)
@@ -259,22 +230,12 @@ class NotificationTester:
             self.log_test("Encrypted Notifications", True, "Skipped (no key)")
             return True
         
-        bt = M25BluetoothBLE(
-            address=self.address,
-            key=self.key,
-            name="test_wheel",
-            debug=True
-        )
-        
         try:
-            await bt.connect()
-            
             # Verify encryptor/decryptor exist
             has_crypto = bt.encryptor is not None and bt.decryptor is not None
             self.log_test("Crypto Objects", has_crypto)
             
             if not has_crypto:
-                await bt.disconnect()
                 return False
             
             # Enable notifications
@@ -287,43 +248,36 @@ class NotificationTester:
             # If we got data, it was decrypted automatically
             received_decrypted = data is not None
             self.log_test("Decrypted Data", received_decrypted,
-                         f"Data: {data.hex() if data else 'None'}")
+                         f"Data: {_short_hex(data)}")
             
             await bt.stop_notifications()
-            await bt.disconnect()
             return has_crypto and received_decrypted
             
         except Exception as e:
             self.log_test("Encrypted Notifications", False, str(e))
-            try:
-                await bt.disconnect()
-            except:
-                pass
             return False
     
-    async def test_06_error_conditions(self) -> bool:
+    async def test_06_error_conditions(self, bt: M25BluetoothBLE) -> bool:
         """Test error handling"""
         print("\n[Test 6] Error Conditions")
         print("-" * 60)
         
-        bt = M25BluetoothBLE(
-            address=self.address,
-            key=self.key,
-            name="test_wheel",
-            debug=False  # Reduce noise for error tests
-        )
+        bt.debug = False  # Reduce noise for error tests
         
         try:
-            # Try notifications before connection
+            # Try notifications before connection, on a throwaway instance
             print("  Testing notification before connect...")
-            result = await bt.start_notifications()
+            unconnected = M25BluetoothBLE(
+                address=self.address,
+                key=self.key,
+                name="test_wheel",
+                debug=False
+            )
+            result = await unconnected.start_notifications()
             before_connect = not result  # Should fail
             self.log_test("Notification Before Connect", before_connect,
                          "Correctly rejected" if before_connect else "Incorrectly allowed")
             
-            # Connect normally
-            await bt.connect()
-            
             # Try wait_notification before start_notifications
             print("  Testing wait before start...")
             try:
@@ -346,32 +300,20 @@ class NotificationTester:
             double_stop = True  # Should not crash
             self.log_test("Double Stop", double_stop, "No crash")
             
-            await bt.disconnect()
             return before_connect and wait_before_start and double_stop
             
         except Exception as e:
             self.log_test("Error Conditions", False, str(e))
-            try:
-                await bt.disconnect()
-            except:
-                pass
             return False
     
-    async def test_07_performance(self) -> bool:
+    async def test_07_performance(self, bt: M25BluetoothBLE) -> bool:
         """Test notification performance"""
         print("\n[Test 7] Performance Metrics")
         print("-" * 60)
         
-        bt = M25BluetoothBLE(
-            address=self.address,
-            key=self.key,
-            name="test_wheel",
-            debug=False
-        )
+        bt.debug = False
         
         try:
-            await bt.connect()
-            
             # Measure notification latency
             received_count = 0
             latencies = []
@@ -382,9 +324,9 @@ class NotificationTester:
             
             await bt.start_notifications(callback)
             
-            print("  Collecting notifications for 10 seconds...")
+            print(f"  Collecting notifications for {self.perf_window:g} seconds...")
             start_time = time.time()
-            await asyncio.sleep(10)
+            await asyncio.sleep(self.perf_window)
             elapsed = time.time() - start_time
             
             rate = received_count / elapsed
@@ -396,29 +338,32 @@ class NotificationTester:
             await bt.start_notifications()  # Queue mode
             
             queue_count = 0
-            print("  Testing queue throughput (5 seconds)...")
-            timeout_time = time.time() + 5
+            queue_window = self.perf_window / 2
+            print(f"  Testing queue throughput ({queue_window:g} seconds)...")
+            timeout_time = time.time() + queue_window
             while time.time() < timeout_time:
                 data = await bt.wait_notification(timeout=0.5)
                 if data:
                     queue_count += 1
             
-            queue_rate = queue_count / 5.0
+            queue_rate = queue_count / queue_window
             self.log_test("Queue Throughput", True,
-                         f"{queue_count} packets in 5s = {queue_rate:.2f} Hz")
+                         f"{queue_count} packets in {queue_window:g}s = {queue_rate:.2f} Hz")
             
             await bt.stop_notifications()
-            await bt.disconnect()
             return True
             
         except Exception as e:
             self.log_test("Performance", False, str(e))
-            try:
-                await bt.disconnect()
-            except:
-                pass
             return False
     
+    @staticmethod
+    def _drain_notifications(bt: M25BluetoothBLE) -> None:
+        """Drop queued notifications so the next test starts clean"""
+        queue = bt._notification_queue
+        while queue is not None and not queue.empty():
+            queue.get_nowait()
+    
     async def run_all_tests(self):
         """Run all tests in sequence"""
         print("="*60)
@@ -428,8 +373,14 @@ class NotificationTester:
         print(f"Encryption: {'Enabled' if self.key else 'Disabled'}")
         print("="*60)
         
+        # test_01 exercises connect/disconnect itself
+        try:
+            await self.test_01_connection()
+        except Exception as e:
+            print(f"\n[EXCEPTION] test_01_connection: {e}")
+            self.log_test("test_01_connection", False, str(e))
+        
         tests = [
-            self.test_01_connection,
             self.test_02_callback_notification,
             self.test_03_queue_notification,
             self.test_04_notification_restart,
@@ -438,15 +389,30 @@ class NotificationTester:
             self.test_07_performance,
         ]
         
-        for test in tests:
-            try:
-                await test()
-            except Exception as e:
-                print(f"\n[EXCEPTION] {test.__name__}: {e}")
-                self.log_test(test.__name__, False, str(e))
-            
-            # Pause between tests
-            await asyncio.sleep(2)
+        # The rest share one connection instead of reconnecting per test
+        bt = M25BluetoothBLE(
+            address=self.address,
+            key=self.key,
+            name="test_wheel",
+            debug=True
+        )
+        
+        try:
+            for test in tests:
+                if not bt.is_connected() and not await bt.connect():
+                    self.log_test(test.__name__, False, "Connection failed")
+                    continue
+                try:
+                    await test(bt)
+                except Exception as e:
+                    print(f"\n[EXCEPTION] {test.__name__}: {e}")
+                    self.log_test(test.__name__, False, str(e))
+                
+                # Leave no notifications running or queued for the next test
+                await bt.stop_notifications()
+                self._drain_notifications(bt)
+        finally:
+            await bt.disconnect()
         
         self.print_summary()
 
@@ -461,6 +427,8 @@ async def main():
     parser.add_argument("--address", help="Bluetooth address (or use M25_LEFT_MAC from .env)")
     parser.add_argument("--key", help="Encryption key hex (or use M25_LEFT_KEY from .env)")
     parser.add_argument("--no-encryption", action="store_true", help="Disable encryption")
+    parser.add_argument("--perf-window", type=float, default=10.0,
+                        help="Seconds to measure notification rate in test 7 (default: 10; e.g. 1 in CI)")
     
     args = parser.parse_args()
     
@@ -486,7 +454,7 @@ async def main():
                 key = bytes.fromhex(key_hex)
     
     # Run tests
-    tester = NotificationTester(address, key)
+    tester = NotificationTester(address, key, perf_window=args.perf_window)
     await tester.run_all_tests()
 
 
@@ -1,14 +1,26 @@
 """Tests for Mapper"""
 
 import pytest
-import time
 from core.types import ControlState, CommandFrame, DriveMode, MapperConfig
 from core.mapper import Mapper
 
 
-@pytest.fixture
+class FakeClock:
+    """Manually advanced clock, so ramping tests don't have to sleep"""
+    
+    def __init__(self, start: float = 1000.0):
+        self.now = start
+    
+    def __call__(self) -> float:
+        return self.now
+    
+    def advance(self, dt: float) -> None:
+        self.now += dt
+
+
+@pytest.fixture(scope="session")
 def default_mapper():
-    """Create mapper with default config"""
+    """Mapper with default config, shared by all tests and reset after each"""
     config = MapperConfig(
         deadzone=0.1,
         curve=2.0,
@@ -20,6 +32,14 @@ def default_mapper():
     return Mapper(config)
 
 
+@pytest.fixture(autouse=True)
+def _reset_default_mapper(request):
+    """Clear ramping state so no test sees the previous test's last command"""
+    yield
+    if "default_mapper" in request.fixturenames:
+        request.getfixturevalue("default_mapper").reset()
+
+
 def test_deadman_required(default_mapper):
     """Test that deadman switch is required"""
     state = ControlState(vx=0.5, vy=0.0, deadman=False, mode=DriveMode.NORMAL)
@@ -76,33 +96,27 @@ def test_turn_movement():
     assert frame.right_speed > frame.left_speed
 
 
-def test_speed_limits(default_mapper):
+@pytest.mark.parametrize("mode,limit", [
+    (DriveMode.SLOW, 30),
+    (DriveMode.NORMAL, 60),
+    (DriveMode.FAST, 100),
+])
+def test_speed_limits(default_mapper, mode, limit):
     """Test mode-specific speed limits"""
-    # SLOW mode
-    state_slow = ControlState(vx=1.0, vy=0.0, deadman=True, mode=DriveMode.SLOW)
-    frame_slow = default_mapper.map(state_slow)
-    assert abs(frame_slow.left_speed) <= 30
-    
-    # NORMAL mode
-    state_normal = ControlState(vx=1.0, vy=0.0, deadman=True, mode=DriveMode.NORMAL)
-    frame_normal = default_mapper.map(state_normal)
-    assert abs(frame_normal.left_speed) <= 60
-    
-    # FAST mode
-    state_fast = ControlState(vx=1.0, vy=0.0, deadman=True, mode=DriveMode.FAST)
-    frame_fast = default_mapper.map(state_fast)
-    assert abs(frame_fast.left_speed) <= 100
+    frame = default_mapper.map(ControlState(vx=1.0, vy=0.0, deadman=True, mode=mode))
+    assert abs(frame.left_speed) <= limit
 
 
 def test_ramping():
     """Test ramping limits rate of change"""
     config = MapperConfig(ramp_rate=10.0)  # Very slow ramp
-    mapper = Mapper(config)
+    clock = FakeClock()
+    mapper = Mapper(config, clock=clock)
     
     # First command
     state1 = ControlState(vx=0.0, vy=0.0, deadman=True, mode=DriveMode.NORMAL)
     frame1 = mapper.map(state1)
-    time.sleep(0.1)  # 100ms
+    clock.advance(0.1)  # 100ms
     
     # Sudden change to full speed
     state2 = ControlState(vx=1.0, vy=0.0, deadman=True, mode=DriveMode.NORMAL)
@@ -127,31 +141,33 @@ def test_differential_drive():
     assert frame.left_speed < frame.right_speed
 
 
-def test_reset(default_mapper):
+def test_reset():
     """Test mapper reset"""
+    # Own mapper, so the shared fixture's reset doesn't mask a broken reset()
+    mapper = Mapper(MapperConfig())
     state = ControlState(vx=0.5, vy=0.0, deadman=True, mode=DriveMode.NORMAL)
-    default_mapper.map(state)
+    mapper.map(state)
     
-    assert default_mapper._last_command is not None
+    assert mapper._last_command is not None
     
-    default_mapper.reset()
+    mapper.reset()
     
-    assert default_mapper._last_command is None
-    assert default_mapper._last_time == 0.0
+    assert mapper._last_command is None
+    assert mapper._last_time == 0.0
 
 
 def test_curve_application():
     """Test exponential curve makes low inputs smoother"""
-    import time
+    clock = FakeClock()
     
     # Test curve application directly without ramping interference
     # Linear mapper
     config_linear = MapperConfig(deadzone=0.0, curve=1.0)
-    mapper_linear = Mapper(config_linear)
+    mapper_linear = Mapper(config_linear, clock=clock)
     
     # Curved mapper
     config_curved = MapperConfig(deadzone=0.0, curve=2.0)
-    mapper_curved = Mapper(config_curved)
+    mapper_curved = Mapper(config_curved, clock=clock)
     
     # First establish baseline with zero command and wait
     neutral = ControlState(vx=0.0, vy=0.0, deadman=True, mode=DriveMode.FAST)
@@ -159,7 +175,7 @@ def test_curve_application():
     mapper_curved.map(neutral)
     
     # Wait long enough for ramping to allow full range
-    time.sleep(0.1)
+    clock.advance(0.1)
     
     # Now apply same input to both
     state = ControlState(vx=0.7, vy=0.0, deadman=True, mode=DriveMode.FAST)
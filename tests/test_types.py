@@ -28,13 +28,11 @@ def test_control_state_valid():
     assert state.timestamp > 0
 
 
-def test_control_state_validation():
+@pytest.mark.parametrize("vx,vy", [(1.5, 0.0), (0.0, -1.5), (-1.1, 0.0), (0.0, 1.1)])
+def test_control_state_validation(vx, vy):
     """Test control state validates ranges"""
     with pytest.raises(AssertionError):
-        ControlState(vx=1.5, vy=0.0, deadman=True, mode=DriveMode.NORMAL)
-    
-    with pytest.raises(AssertionError):
-        ControlState(vx=0.0, vy=-1.5, deadman=True, mode=DriveMode.NORMAL)
+        ControlState(vx=vx, vy=vy, deadman=True, mode=DriveMode.NORMAL)
 
 
 def test_control_state_is_neutral():
@@ -67,13 +65,11 @@ def test_command_frame_valid():
     assert frame.timestamp > 0
 
 
-def test_command_frame_validation():
+@pytest.mark.parametrize("left,right", [(150, 50), (50, -150), (-101, 0), (0, 101)])
+def test_command_frame_validation(left, right):
     """Test command frame validates ranges"""
     with pytest.raises(AssertionError):
-        CommandFrame(left_speed=150, right_speed=50)
-    
-    with pytest.raises(AssertionError):
-        CommandFrame(left_speed=50, right_speed=-150)
+        CommandFrame(left_speed=left, right_speed=right)
 
 
 def test_command_frame_stop():